@@ -16,6 +16,8 @@ import time
 
 from scs_core.sys.eeprom_image import EEPROMImage
 
+from scs_dfe.board.i2c_mutex import I2CMutex
+
 from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
@@ -41,43 +43,43 @@ class AT24MAC402(object):
     @classmethod
     def __read_array(cls, device_addr, memory_addr, count):
         try:
-            I2C.start_tx(Host.DFE_UID_ADDR)
+            I2CMutex.start_tx(Host.DFE_UID_ADDR)
 
             # I2C.read(1)
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
         try:
-            I2C.start_tx(Host.DFE_UID_ADDR)
+            I2CMutex.start_tx(Host.DFE_UID_ADDR)
 
             # I2C.write(0x80)
 
             return I2C.read_cmd(0x80, count)        # memory_addr,
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
 
     @classmethod
     def __read_image(cls, memory_addr, count):
         try:
-            I2C.start_tx(Host.DFE_EEPROM_ADDR)
+            I2CMutex.start_tx(Host.DFE_EEPROM_ADDR)
 
             content = I2C.read_cmd(memory_addr, count)
 
             return EEPROMImage(content)
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
 
     @classmethod
     def __write_image(cls, memory_addr, values):       # max 32 values
         try:
-            I2C.start_tx(Host.DFE_EEPROM_ADDR)
+            I2CMutex.start_tx(Host.DFE_EEPROM_ADDR)
 
             I2C.write_addr(memory_addr, *values)
             time.sleep(cls.__TWR)
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
 
     # ----------------------------------------------------------------------------------------------------------------
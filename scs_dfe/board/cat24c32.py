@@ -16,6 +16,8 @@ import time
 
 from scs_core.sys.eeprom_image import EEPROMImage
 
+from scs_dfe.board.i2c_mutex import I2CMutex
+
 from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
@@ -38,24 +40,24 @@ class CAT24C32(object):
     @classmethod
     def __read_image(cls, addr, count):
         try:
-            I2C.start_tx(Host.DFE_EEPROM_ADDR)
+            I2CMutex.start_tx(Host.DFE_EEPROM_ADDR)
 
             content = I2C.read_cmd16(addr, count)
 
             return EEPROMImage(content)
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
 
     @classmethod
     def __write_image(cls, addr, values):       # max 32 values
         try:
-            I2C.start_tx(Host.DFE_EEPROM_ADDR)
+            I2CMutex.start_tx(Host.DFE_EEPROM_ADDR)
 
             I2C.write_addr16(addr, *values)
             time.sleep(cls.__TWR)
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
 
     # ----------------------------------------------------------------------------------------------------------------
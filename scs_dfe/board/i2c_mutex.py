@@ -0,0 +1,65 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A process-wide mutex for the I2C bus. scs_host's I2C holds a single, class-level device file, whose slave address is
+set by start_tx(..) - two threads with overlapping transactions could each read or write the other's device. Every
+start_tx(..) / end_tx() span is therefore made under this mutex, which is re-entrant, so that a thread may nest
+transactions.
+
+Cross-process exclusion of individual devices remains the job of the scs_host Lock.
+
+Usage, as for I2C:
+
+try:
+    I2CMutex.start_tx(addr)
+    ...
+finally:
+    I2CMutex.end_tx()
+"""
+
+import threading
+
+from scs_host.bus.i2c import I2C
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class I2CMutex(object):
+    """
+    classdocs
+    """
+
+    __lock = threading.RLock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def start_tx(cls, addr):
+        """
+        the mutex is held until the matching end_tx() - which must be called, even if start_tx(..) raises
+        """
+        cls.__lock.acquire()
+
+        I2C.start_tx(addr)
+
+
+    @classmethod
+    def end_tx(cls):
+        try:
+            I2C.end_tx()
+
+        finally:
+            cls.__lock.release()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def lock(cls):
+        """
+        the underlying RLock - may be held across several transactions
+        """
+        return cls.__lock
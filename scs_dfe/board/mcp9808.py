@@ -4,9 +4,11 @@ Created on 6 Aug 2016
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 """
 
+import asyncio
 import time
 
 from scs_dfe.board.board_datum import BoardDatum
+from scs_dfe.board.i2c_mutex import I2CMutex
 
 from scs_host.bus.i2c import I2C
 
@@ -47,19 +49,19 @@ class MCP9808(object):
     @classmethod
     def __write_config(cls, config):
         try:
-            I2C.start_tx(cls.__ADDR)
+            I2CMutex.start_tx(cls.__ADDR)
             I2C.write(cls.__REG_CONFIG, config >> 8, config & 0xff)
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
 
     @classmethod
     def __read_temp(cls):
         try:
-            I2C.start_tx(cls.__ADDR)
+            I2CMutex.start_tx(cls.__ADDR)
             msb, lsb = I2C.read_cmd(cls.__REG_TEMP, 2)
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
         # render voltage...
         unsigned_c = float(msb & 0x1f) * 16 + float(lsb) / 16
@@ -115,6 +117,19 @@ class MCP9808(object):
         self.__running = running
 
 
+    async def set_running_async(self, running):
+        """
+        as the running setter, but awaits the first conversion
+        """
+        config = MCP9808.__CONV_CONT if running else MCP9808.__CONV_SHUT
+        MCP9808.__write_config(config)
+
+        if running and not self.__running:
+            await asyncio.sleep(MCP9808.__TCONV_0p0625)
+
+        self.__running = running
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
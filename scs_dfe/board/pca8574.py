@@ -10,6 +10,8 @@ from collections import OrderedDict
 
 from scs_core.data.json import PersistentJSONable
 
+from scs_dfe.board.i2c_mutex import I2CMutex
+
 from scs_host.bus.i2c import I2C
 from scs_host.sys.host import Host
 
@@ -49,22 +51,22 @@ class PCA8574(object):
 
     def read(self):
         try:
-            I2C.start_tx(self.__addr)
+            I2CMutex.start_tx(self.__addr)
             byte = I2C.read(1)
 
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
         return byte
 
 
     def write(self, byte):
         try:
-            I2C.start_tx(self.__addr)
+            I2CMutex.start_tx(self.__addr)
             I2C.write(byte)
 
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
 
     # ----------------------------------------------------------------------------------------------------------------
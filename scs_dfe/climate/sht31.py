@@ -6,10 +6,13 @@ Created on 5 Jul 2016
 https://github.com/raspberrypi/weather-station/blob/master/SHT31.py
 """
 
+import asyncio
 import time
 
 from scs_core.climate.sht_datum import SHTDatum
 
+from scs_dfe.board.i2c_mutex import I2CMutex
+
 from scs_host.bus.i2c import I2C
 
 
@@ -25,6 +28,11 @@ class SHT31(object):
     __CMD_READ_SINGLE_HIGH =        0x2c06
     __CMD_READ_SINGLE_LOW =         0x2c10
 
+    __CMD_READ_SINGLE_HIGH_NO_STRETCH = 0x2400
+
+    __TMEAS_HIGH =                  0.016           # seconds
+    __TRESET =                      0.001           # seconds
+
     __CMD_READ_STATUS =             0xf32d
 
 
@@ -67,7 +75,7 @@ class SHT31(object):
 
     def reset(self):
         try:
-            I2C.start_tx(self.__addr)
+            I2CMutex.start_tx(self.__addr)
             I2C.write16(SHT31.__CMD_RESET)
             time.sleep(0.001)
 
@@ -75,21 +83,66 @@ class SHT31(object):
             time.sleep(0.001)
 
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
 
     def sample(self):
         try:
-            I2C.start_tx(self.__addr)
+            I2CMutex.start_tx(self.__addr)
             temp_msb, temp_lsb, _, humid_msb, humid_lsb, _ = I2C.read_cmd16(SHT31.__CMD_READ_SINGLE_HIGH, 6)
 
-            raw_humid = (humid_msb << 8) | humid_lsb
-            raw_temp = (temp_msb << 8) | temp_lsb
+        finally:
+            I2CMutex.end_tx()
+
+        return SHT31.__datum(temp_msb, temp_lsb, humid_msb, humid_lsb)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+    # the bus is not held across an await, so that other coroutines may use it...
+
+    async def reset_async(self):
+        for cmd in (SHT31.__CMD_RESET, SHT31.__CMD_CLEAR):
+            try:
+                I2CMutex.start_tx(self.__addr)
+                I2C.write16(cmd)
+
+            finally:
+                I2CMutex.end_tx()
+
+            await asyncio.sleep(SHT31.__TRESET)
 
-            return SHTDatum(SHT31.humid(raw_humid), SHT31.temp(raw_temp))
+
+    async def sample_async(self):
+        """
+        uses the measurement command without clock stretching, then awaits the measurement time
+        """
+        try:
+            I2CMutex.start_tx(self.__addr)
+            I2C.write16(SHT31.__CMD_READ_SINGLE_HIGH_NO_STRETCH)
 
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
+
+        await asyncio.sleep(SHT31.__TMEAS_HIGH)
+
+        try:
+            I2CMutex.start_tx(self.__addr)
+            temp_msb, temp_lsb, _, humid_msb, humid_lsb, _ = I2C.read(6)
+
+        finally:
+            I2CMutex.end_tx()
+
+        return SHT31.__datum(temp_msb, temp_lsb, humid_msb, humid_lsb)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __datum(temp_msb, temp_lsb, humid_msb, humid_lsb):
+        raw_humid = (humid_msb << 8) | humid_lsb
+        raw_temp = (temp_msb << 8) | temp_lsb
+
+        return SHTDatum(SHT31.humid(raw_humid), SHT31.temp(raw_temp))
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -97,13 +150,13 @@ class SHT31(object):
     @property
     def status(self):
         try:
-            I2C.start_tx(self.__addr)
+            I2CMutex.start_tx(self.__addr)
             status_msb, status_lsb, _ = I2C.read_cmd16(SHT31.__CMD_READ_STATUS, 3)
 
             return (status_msb << 8) | status_lsb
 
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
 
     @property
@@ -0,0 +1,12 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+from scs_dfe.data.duration_histogram import DurationHistogram
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+DurationHistogram.init()
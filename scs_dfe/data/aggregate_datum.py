@@ -0,0 +1,98 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+a completed aggregation window - the count, mean, min and max of each numeric field of the source datums, keyed by
+its dotted JSON path
+
+example JSON:
+{"src": "AFE", "start": 1760788800.0, "end": 1760788860.0, "n": 6,
+"stats": {"pt1.tmp": {"n": 6, "avg": 21.43, "min": 21.1, "max": 21.9}, "sns.NO2.cnc": {...}, ...}}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.datum import Datum
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AggregateDatum(JSONable):
+    """
+    classdocs
+    """
+
+    __PRECISION = 6                             # decimal places of the mean
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, src, start, end, count, stats):
+        """
+        Constructor
+        """
+        self.__src = src                        # string or None
+        self.__start = start                    # float     epoch seconds, inclusive
+        self.__end = end                        # float     epoch seconds, exclusive
+        self.__count = count                    # int       datums in the window
+
+        self.__stats = stats                    # OrderedDict of path: stats jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        if self.src is not None:
+            jdict['src'] = self.src
+
+        jdict['start'] = self.start
+        jdict['end'] = self.end
+        jdict['n'] = self.count
+
+        jdict['stats'] = OrderedDict()
+
+        for path, stats in self.stats.items():
+            stats_jdict = OrderedDict(stats)
+            stats_jdict['avg'] = Datum.float(stats['avg'], AggregateDatum.__PRECISION)
+
+            jdict['stats'][path] = stats_jdict
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def src(self):
+        return self.__src
+
+
+    @property
+    def start(self):
+        return self.__start
+
+
+    @property
+    def end(self):
+        return self.__end
+
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    @property
+    def stats(self):
+        return self.__stats
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AggregateDatum:{src:%s, start:%s, end:%s, count:%d, paths:%s}" % \
+               (self.src, self.start, self.end, self.count, list(self.stats.keys()))
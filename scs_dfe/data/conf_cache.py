@@ -0,0 +1,182 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A process-wide cache of PersistentJSONable documents - confs, calibrations and baselines - keyed by class and file
+name. A cached document is returned for as long as the inode, modification time and size of its file are unchanged;
+a missing file is cached as such. Documents are reloaded only when their file really changes.
+
+The cache checks each file with one os.stat(..) per load. If watch() is called, and Linux inotify is available, the
+directories of cached files are watched, and the stat is skipped until a change is reported in any watched
+directory. If inotify events are lost, every entry is checked by stat on its next load.
+
+inotify events arrive asynchronously, so AFEConf, Pt1000Conf, OPCConf, GPSConf and SHTConf invalidate their entry
+when they are saved - a load that follows a save in the same process always sees the saved document. AFECalib,
+AFEBaseline and Pt1000Calib, which AFEConf loads through the cache, are saved by scs_core, and have no such hook - a
+process that saves one of them should call invalidate(filename).
+
+Cached documents are shared - callers must not modify them, other than to save(..) them.
+"""
+
+import os
+import threading
+
+from collections import OrderedDict
+
+from scs_dfe.data.inotify_watcher import InotifyWatcher
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConfCache(object):
+    """
+    classdocs
+    """
+
+    __entries = OrderedDict()                   # (class, filename): [stat_key, document, generation, watched]
+    __lock = threading.RLock()
+
+    __watcher = None                            # InotifyWatcher or None
+    __generation = 0                            # int       incremented on every change in a watched directory
+
+    __hits = 0                                  # int
+    __misses = 0                                # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, persistent_class, host):
+        return cls.load_from_file(persistent_class, persistent_class.filename(host))
+
+
+    @classmethod
+    def load_from_file(cls, persistent_class, filename):
+        key = (persistent_class, filename)
+
+        with cls.__lock:
+            generation = cls.__generation
+            entry = cls.__entries.get(key)
+
+            if entry is not None and entry[3] and entry[2] == generation:
+                cls.__hits += 1
+                return entry[1]
+
+        watched = cls.__watch_file(filename)        # before the stat, so that any later change is reported
+        stat_key = cls.__stat_key(filename)
+
+        with cls.__lock:
+            if entry is not None and entry[0] == stat_key:
+                entry[2] = generation
+                entry[3] = watched
+                cls.__hits += 1
+                return entry[1]
+
+        document = persistent_class.load_from_file(filename)
+
+        with cls.__lock:
+            cls.__entries[key] = [stat_key, document, generation, watched]
+            cls.__misses += 1
+
+        return document
+
+
+    @classmethod
+    def invalidate(cls, filename=None):
+        """
+        discard the cached documents for filename, or all cached documents
+        """
+        with cls.__lock:
+            if filename is None:
+                cls.__entries.clear()
+                return
+
+            for key in [key for key in cls.__entries if key[1] == filename]:
+                del cls.__entries[key]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def watch(cls):
+        """
+        returns True if inotify is in use
+        """
+        with cls.__lock:
+            if cls.__watcher is not None:
+                return True
+
+            watcher = InotifyWatcher(cls.__changed)
+
+            try:
+                watcher.start()
+
+            except OSError:
+                return False
+
+            cls.__watcher = watcher
+            cls.__generation += 1                   # changes before now were not seen
+
+            for (_, filename), entry in cls.__entries.items():
+                entry[3] = cls.__watch_file(filename)
+
+        return True
+
+
+    @classmethod
+    def unwatch(cls):
+        with cls.__lock:
+            watcher = cls.__watcher
+            cls.__watcher = None
+
+            for entry in cls.__entries.values():
+                entry[3] = False
+
+        if watcher is not None:
+            watcher.stop()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def hits(cls):
+        return cls.__hits
+
+
+    @classmethod
+    def misses(cls):
+        return cls.__misses
+
+
+    @classmethod
+    def watching(cls):
+        return cls.__watcher is not None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __changed(cls, _directory, _name):
+        with cls.__lock:
+            cls.__generation += 1                   # every entry must be checked by stat on its next load - this
+                                                    # includes lost events, reported as None, None
+
+
+    @classmethod
+    def __watch_file(cls, filename):
+        if cls.__watcher is None:
+            return False
+
+        return cls.__watcher.add(os.path.dirname(os.path.abspath(filename)))
+
+
+    @staticmethod
+    def __stat_key(filename):
+        try:
+            stat = os.stat(filename)
+
+        except FileNotFoundError:
+            return None
+
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
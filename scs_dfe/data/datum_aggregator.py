@@ -0,0 +1,175 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Incremental aggregation of a stream of datums - AFEDatum, OPCDatum, SHTDatum or any other JSONable - over tumbling
+windows of the given period, aligned to multiples of the period since the epoch, and optionally over a sliding window.
+
+Every numeric field of the datum's JSON is aggregated, keyed by its dotted path, for example "sns.NO2.cnc",
+"pt1.tmp", "pm2p5", "bin.3" or "hmd". Null fields are not counted. The work per datum is O(1) for each field.
+
+append(..) returns an AggregateDatum when a tumbling window is completed - that is, when the first datum for a later
+window arrives - otherwise None. Windows in which no datums were received are not reported.
+"""
+
+import math
+import time
+
+from collections import OrderedDict
+
+from scs_dfe.data.aggregate_datum import AggregateDatum
+from scs_dfe.data.sliding_window import SlidingWindow
+from scs_dfe.data.window_stats import WindowStats
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DatumAggregator(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __fields(cls, node, path=''):
+        """
+        yields (path, value) for each numeric leaf of the JSON representation of node
+        """
+        if hasattr(node, 'as_json'):
+            node = node.as_json()
+
+        if isinstance(node, dict):
+            items = node.items()
+
+        elif isinstance(node, (list, tuple)):
+            items = enumerate(node)
+
+        else:
+            if isinstance(node, (int, float)) and not isinstance(node, bool):
+                yield path, node
+
+            return
+
+        for key, value in items:
+            yield from cls.__fields(value, str(key) if not path else path + '.' + str(key))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, period, sliding_period=None, src=None):
+        """
+        Constructor
+        """
+        if period <= 0:
+            raise ValueError("DatumAggregator: period must be positive.")
+
+        self.__period = period                          # float     seconds
+        self.__sliding_period = sliding_period          # float     seconds, or None
+        self.__src = src                                # string or None
+
+        self.__start = None                             # float     epoch seconds, start of the current window
+        self.__count = 0                                # int       datums in the current window
+        self.__stats = OrderedDict()                    # path: WindowStats
+
+        self.__sliding = OrderedDict()                  # path: SlidingWindow
+        self.__latest = None                            # float     epoch seconds, most recent datum
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, datum, rec=None):
+        """
+        rec is the epoch time of the datum, and must not be earlier than that of the previous datum
+        """
+        rec = time.time() if rec is None else rec
+
+        start = float(math.floor(rec / self.__period) * self.__period)
+
+        completed = None
+
+        if self.__start is not None and start > self.__start:
+            completed = self.flush()
+
+        self.__start = start
+        self.__count += 1
+        self.__latest = rec
+
+        for path, value in DatumAggregator.__fields(datum):
+            if path not in self.__stats:
+                self.__stats[path] = WindowStats()
+
+            self.__stats[path].append(value)
+
+            if self.__sliding_period is not None:
+                if path not in self.__sliding:
+                    self.__sliding[path] = SlidingWindow(self.__sliding_period)
+
+                self.__sliding[path].append(rec, value)
+
+        return completed
+
+
+    def flush(self):
+        """
+        returns the current tumbling window as an AggregateDatum, or None if it is empty, and starts a new window
+        """
+        if self.__count == 0:
+            return None
+
+        stats = OrderedDict((path, window.as_json()) for path, window in self.__stats.items())
+
+        completed = AggregateDatum(self.__src, self.__start, self.__start + self.__period, self.__count, stats)
+
+        self.__count = 0
+        self.__stats = OrderedDict()
+
+        return completed
+
+
+    def sliding(self, rec=None):
+        """
+        returns an AggregateDatum for the sliding window ending at rec, or None if there is no sliding window
+        """
+        if self.__sliding_period is None:
+            return None
+
+        rec = self.__latest if rec is None else rec
+
+        if rec is None:
+            return None
+
+        for window in self.__sliding.values():
+            window.expire(rec)
+
+        windows = [(path, window) for path, window in self.__sliding.items() if window.count > 0]
+
+        stats = OrderedDict((path, window.as_json()) for path, window in windows)
+        count = max([window.count for _, window in windows], default=0)
+
+        return AggregateDatum(self.__src, rec - self.__sliding_period, rec, count, stats)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def period(self):
+        return self.__period
+
+
+    @property
+    def sliding_period(self):
+        return self.__sliding_period
+
+
+    @property
+    def src(self):
+        return self.__src
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DatumAggregator:{period:%s, sliding_period:%s, src:%s, start:%s, count:%d}" % \
+               (self.period, self.sliding_period, self.src, self.__start, self.__count)
@@ -0,0 +1,148 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A fixed-size histogram of durations, with bins whose upper bounds double from 10 µs to about 10 s - recording is
+O(1), and memory does not grow with the number of observations.
+
+example JSON:
+{"n": 120, "total": 59.3, "min": 0.4862, "max": 0.5247, "bins": {"0.000010": 0, ..., "0.655360": 120, "inf": 0}}
+"""
+
+import math
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class DurationHistogram(JSONable):
+    """
+    classdocs
+    """
+
+    __LOWEST =          0.00001             # seconds - upper bound of the first bin
+    __BINS =            21                  # finite bins, plus one overflow bin
+
+    __UPPER =           None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def init(cls):
+        cls.__UPPER = tuple(cls.__LOWEST * (2 ** i) for i in range(cls.__BINS))
+
+
+    @classmethod
+    def upper_bounds(cls):
+        return cls.__UPPER
+
+
+    @classmethod
+    def __bin(cls, duration):
+        if duration <= cls.__LOWEST:
+            return 0
+
+        return min(int(math.ceil(math.log2(duration / cls.__LOWEST))), cls.__BINS)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__counts = [0] * (DurationHistogram.__BINS + 1)
+
+        self.__n = 0                        # int
+        self.__total = 0.0                  # float     seconds
+        self.__min = None                   # float     seconds
+        self.__max = None                   # float     seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def record(self, duration):
+        self.__counts[DurationHistogram.__bin(duration)] += 1
+
+        self.__n += 1
+        self.__total += duration
+
+        if self.__min is None or duration < self.__min:
+            self.__min = duration
+
+        if self.__max is None or duration > self.__max:
+            self.__max = duration
+
+
+    def clear(self):
+        self.__counts = [0] * (DurationHistogram.__BINS + 1)
+
+        self.__n = 0
+        self.__total = 0.0
+        self.__min = None
+        self.__max = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['n'] = self.n
+        jdict['total'] = round(self.total, 6)
+        jdict['min'] = None if self.min is None else round(self.min, 6)
+        jdict['max'] = None if self.max is None else round(self.max, 6)
+
+        bins = OrderedDict(('%0.6f' % upper, count) for upper, count in zip(DurationHistogram.__UPPER, self.__counts))
+        bins['inf'] = self.__counts[-1]
+
+        jdict['bins'] = bins
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def counts(self):
+        return tuple(self.__counts)
+
+
+    @property
+    def n(self):
+        return self.__n
+
+
+    @property
+    def total(self):
+        return self.__total
+
+
+    @property
+    def mean(self):
+        if self.__n == 0:
+            return None
+
+        return self.__total / self.__n
+
+
+    @property
+    def min(self):
+        return self.__min
+
+
+    @property
+    def max(self):
+        return self.__max
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "DurationHistogram:{n:%d, total:%0.6f, min:%s, max:%s, counts:%s}" % \
+               (self.n, self.total, self.min, self.max, self.__counts)
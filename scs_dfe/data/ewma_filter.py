@@ -0,0 +1,100 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A first-order IIR low-pass filter - the exponentially-weighted moving average:
+
+y[n] = y[n-1] + alpha * (x[n] - y[n-1])
+
+alpha is in (0, 1] - smaller values give heavier smoothing. The first value initialises the filter.
+
+example JSON:
+{"type": "ewma", "alpha": 0.2, "value": 0.29409}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class EWMAFilter(JSONable):
+    """
+    classdocs
+    """
+
+    TYPE = 'ewma'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        alpha = jdict.get('alpha')
+        value = jdict.get('value')
+
+        return EWMAFilter(alpha, value)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, alpha, value=None):
+        """
+        Constructor
+        """
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("EWMAFilter: alpha must be in (0, 1].")
+
+        self.__alpha = float(alpha)             # float
+        self.__value = value                    # float or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def update(self, value):
+        if self.__value is None:
+            self.__value = value
+
+        else:
+            self.__value += self.__alpha * (value - self.__value)
+
+        return self.__value
+
+
+    def reset(self):
+        self.__value = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['type'] = EWMAFilter.TYPE
+        jdict['alpha'] = self.alpha
+        jdict['value'] = self.value
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def alpha(self):
+        return self.__alpha
+
+
+    @property
+    def value(self):
+        return self.__value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "EWMAFilter:{alpha:%s, value:%s}" % (self.alpha, self.value)
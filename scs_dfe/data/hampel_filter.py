@@ -0,0 +1,157 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A causal Hampel filter for spike rejection. A value is rejected - and replaced by the median of the preceding length
+values - if it lies more than threshold scaled MADs from that median. Values are entered into the window whether or
+not they are rejected, so that a genuine step change is accepted once it fills half the window.
+
+The MAD is the running median of the absolute deviations of recent values from the median at their arrival, rather
+than being recomputed over the whole window for each value - O(log n) per update, rather than O(n).
+
+The rejection limit is never less than min_limit. A steady, quantised signal has a MAD of zero, and would otherwise
+have every change rejected - even of one LSB - until half the deviations were non-zero. The default, in Volts, is
+one and a half LSBs of the ADS1115 at its default gain, so that a one-LSB change is never rejected.
+
+example JSON:
+{"type": "hampel", "length": 7, "threshold": 3.0, "min-limit": 0.0001875, "rejected": 2, "window": [...],
+"deviations": [...]}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+from scs_dfe.data.running_median import RunningMedian
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class HampelFilter(JSONable):
+    """
+    classdocs
+    """
+
+    TYPE = 'hampel'
+
+    DEFAULT_THRESHOLD = 3.0
+    DEFAULT_MIN_LIMIT = 0.0001875       # Volts - 1.5 ADS1115 LSBs at GAIN_4p096
+
+    __MAD_SCALE = 1.4826                # MAD to standard deviation, for normally-distributed noise
+    __MIN_COUNT = 3                     # values required before any value is rejected
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        length = jdict.get('length')
+        threshold = jdict.get('threshold', cls.DEFAULT_THRESHOLD)
+        min_limit = jdict.get('min-limit', cls.DEFAULT_MIN_LIMIT)
+        rejected = jdict.get('rejected', 0)
+
+        window = jdict.get('window', [])
+        deviations = jdict.get('deviations', [])
+
+        return HampelFilter(length, threshold, min_limit, rejected, window, deviations)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, length, threshold=DEFAULT_THRESHOLD, min_limit=DEFAULT_MIN_LIMIT, rejected=0, window=(),
+                 deviations=()):
+        """
+        Constructor
+        """
+        self.__threshold = float(threshold)                     # float     scaled MADs
+        self.__min_limit = float(min_limit)                     # float     least deviation that may be rejected
+        self.__rejected = int(rejected)                         # int
+
+        self.__median = RunningMedian(length, window)
+        self.__mad = RunningMedian(length, deviations)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def update(self, value):
+        median = self.__median.value
+
+        if median is None:
+            self.__median.update(value)
+            return value
+
+        deviation = abs(value - median)
+        limit = max(self.__threshold * HampelFilter.__MAD_SCALE * self.__mad.value, self.__min_limit) \
+            if self.__mad.count else None
+
+        self.__median.update(value)
+        self.__mad.update(deviation)
+
+        if limit is not None and self.__median.count >= HampelFilter.__MIN_COUNT and deviation > limit:
+            self.__rejected += 1
+            return median
+
+        return value
+
+
+    def reset(self):
+        self.__median.reset()
+        self.__mad.reset()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['type'] = HampelFilter.TYPE
+        jdict['length'] = self.length
+        jdict['threshold'] = self.threshold
+        jdict['min-limit'] = self.min_limit
+        jdict['rejected'] = self.rejected
+
+        jdict['window'] = self.__median.as_json()['window']
+        jdict['deviations'] = self.__mad.as_json()['window']
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def length(self):
+        return self.__median.length
+
+
+    @property
+    def threshold(self):
+        return self.__threshold
+
+
+    @property
+    def min_limit(self):
+        return self.__min_limit
+
+
+    @property
+    def rejected(self):
+        return self.__rejected
+
+
+    @property
+    def value(self):
+        """
+        the median of the window
+        """
+        return self.__median.value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "HampelFilter:{length:%d, threshold:%s, min_limit:%s, rejected:%d, value:%s}" % \
+               (self.length, self.threshold, self.min_limit, self.rejected, self.value)
@@ -0,0 +1,158 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A sorted multiset with O(log n) insertion, removal and access by rank - a skiplist whose links record the number of
+values that they span. Used by RunningMedian.
+
+Values must be finite and mutually comparable.
+
+After R. Hettinger, "Efficient Running Median using an Indexable Skiplist", Python Cookbook recipe 576930.
+"""
+
+import math
+import random
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class IndexableSkiplist(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, expected_size=100):
+        """
+        Constructor
+        """
+        self.__levels = int(1 + math.log2(max(expected_size, 2)))     # int
+
+        self.__tail = _Node(math.inf, [], [])
+        self.__head = _Node(None, [self.__tail] * self.__levels, [1] * self.__levels)
+
+        self.__size = 0                                 # int
+        self.__random = random.Random()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def insert(self, value):
+        chain = [None] * self.__levels
+        steps_at_level = [0] * self.__levels
+
+        node = self.__head
+
+        for level in reversed(range(self.__levels)):
+            while node.next[level].value <= value:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+
+            chain[level] = node
+
+        depth = min(self.__levels, 1 - int(math.log2(1.0 - self.__random.random())))
+
+        new_node = _Node(value, [None] * depth, [None] * depth)
+        steps = 0
+
+        for level in range(depth):
+            prev_node = chain[level]
+
+            new_node.next[level] = prev_node.next[level]
+            prev_node.next[level] = new_node
+
+            new_node.width[level] = prev_node.width[level] - steps
+            prev_node.width[level] = steps + 1
+
+            steps += steps_at_level[level]
+
+        for level in range(depth, self.__levels):
+            chain[level].width[level] += 1
+
+        self.__size += 1
+
+
+    def remove(self, value):
+        """
+        remove one occurrence of value - raises ValueError if it is not present
+        """
+        chain = [None] * self.__levels
+
+        node = self.__head
+
+        for level in reversed(range(self.__levels)):
+            while node.next[level].value < value:
+                node = node.next[level]
+
+            chain[level] = node
+
+        if value != chain[0].next[0].value:
+            raise ValueError("IndexableSkiplist.remove: %s not present." % value)
+
+        depth = len(chain[0].next[0].next)
+
+        for level in range(depth):
+            prev_node = chain[level]
+
+            prev_node.width[level] += prev_node.next[level].width[level] - 1
+            prev_node.next[level] = prev_node.next[level].next[level]
+
+        for level in range(depth, self.__levels):
+            chain[level].width[level] -= 1
+
+        self.__size -= 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.__size
+
+        if not 0 <= index < self.__size:
+            raise IndexError("IndexableSkiplist: index out of range.")
+
+        node = self.__head
+        index += 1
+
+        for level in reversed(range(self.__levels)):
+            while node.width[level] <= index:
+                index -= node.width[level]
+                node = node.next[level]
+
+        return node.value
+
+
+    def __iter__(self):
+        node = self.__head.next[0]
+
+        while node is not self.__tail:
+            yield node.value
+            node = node.next[0]
+
+
+    def __len__(self):
+        return self.__size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "IndexableSkiplist:{levels:%d, size:%d}" % (self.__levels, self.__size)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class _Node(object):
+    """
+    a skiplist node - next and width are indexed by level
+    """
+
+    __slots__ = ('value', 'next', 'width')
+
+    def __init__(self, value, next_nodes, widths):
+        self.value = value
+        self.next = next_nodes
+        self.width = widths
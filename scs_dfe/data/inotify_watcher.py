@@ -0,0 +1,211 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Watches directories for changes to the files within them, using Linux inotify through ctypes, on a daemon thread.
+The callback is invoked with the directory and the file name for each file that is written, replaced, created,
+deleted or has its attributes changed.
+
+If the kernel's event queue overflows, or an event cannot be attributed to a watched directory, the callback is
+invoked with None, None - any file in any watched directory may have changed. A directory whose watch is lost is no
+longer watched, and its callers should revert to polling.
+
+If inotify is not available, start() raises OSError.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class InotifyWatcher(object):
+    """
+    classdocs
+    """
+
+    __IN_ATTRIB =           0x00000004
+    __IN_CLOSE_WRITE =      0x00000008
+    __IN_MOVED_FROM =       0x00000040
+    __IN_MOVED_TO =         0x00000080
+    __IN_CREATE =           0x00000100
+    __IN_DELETE =           0x00000200
+    __IN_DELETE_SELF =      0x00000400
+    __IN_MOVE_SELF =        0x00000800
+    __IN_Q_OVERFLOW =       0x00004000
+    __IN_IGNORED =          0x00008000
+
+    __IN_CLOEXEC =          0o2000000
+
+    __MASK = __IN_ATTRIB | __IN_CLOSE_WRITE | __IN_MOVED_FROM | __IN_MOVED_TO | __IN_CREATE | __IN_DELETE | \
+        __IN_DELETE_SELF | __IN_MOVE_SELF
+
+    __LOST = __IN_DELETE_SELF | __IN_MOVE_SELF | __IN_IGNORED
+
+    __EVENT = struct.Struct('iIII')                 # wd, mask, cookie, len - followed by name
+    __READ_SIZE = 4096
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __libc(cls):
+        name = ctypes.util.find_library('c')
+
+        if name is None:
+            raise OSError("InotifyWatcher: libc not found.")
+
+        libc = ctypes.CDLL(name, use_errno=True)
+
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError("InotifyWatcher: inotify is not available.")
+
+        return libc
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, callback):
+        """
+        Constructor
+        """
+        self.__callback = callback                  # callable(directory, name)
+
+        self.__libc = None
+        self.__fd = None                            # int       inotify file descriptor
+        self.__stop_r, self.__stop_w = None, None   # int       pipe to wake the thread
+
+        self.__directories = {}                     # wd: directory
+        self.__lock = threading.Lock()
+        self.__thread = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start(self):
+        if self.__thread is not None:
+            return
+
+        self.__libc = InotifyWatcher.__libc()
+
+        fd = self.__libc.inotify_init1(InotifyWatcher.__IN_CLOEXEC)
+
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, "InotifyWatcher.start: %s" % os.strerror(errno))
+
+        self.__fd = fd
+        self.__stop_r, self.__stop_w = os.pipe()
+
+        self.__thread = threading.Thread(target=self.__run, name='InotifyWatcher', daemon=True)
+        self.__thread.start()
+
+
+    def stop(self):
+        if self.__thread is None:
+            return
+
+        os.write(self.__stop_w, b'x')
+        self.__thread.join()
+
+        for fd in (self.__fd, self.__stop_r, self.__stop_w):
+            os.close(fd)
+
+        self.__thread = None
+        self.__fd = None
+
+        with self.__lock:
+            self.__directories = {}
+
+
+    def add(self, directory):
+        """
+        returns True if the directory is watched
+        """
+        if self.__thread is None:
+            return False
+
+        directory = os.path.abspath(directory)
+
+        with self.__lock:
+            if directory in self.__directories.values():
+                return True
+
+            wd = self.__libc.inotify_add_watch(self.__fd, os.fsencode(directory), InotifyWatcher.__MASK)
+
+            if wd < 0:
+                return False
+
+            self.__directories[wd] = directory
+
+        return True
+
+
+    def watches(self, directory):
+        with self.__lock:
+            return os.path.abspath(directory) in self.__directories.values()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __run(self):
+        while True:
+            readable, _, _ = select.select([self.__fd, self.__stop_r], [], [])
+
+            if self.__stop_r in readable:
+                return
+
+            buffer = os.read(self.__fd, InotifyWatcher.__READ_SIZE)
+
+            for directory, name in self.__events(buffer):
+                self.__callback(directory, name)
+
+
+    def __events(self, buffer):
+        offset = 0
+
+        while offset + InotifyWatcher.__EVENT.size <= len(buffer):
+            wd, mask, _, length = InotifyWatcher.__EVENT.unpack_from(buffer, offset)
+            offset += InotifyWatcher.__EVENT.size
+
+            name = os.fsdecode(buffer[offset:offset + length].rstrip(b'\0'))
+            offset += length
+
+            if mask & InotifyWatcher.__IN_Q_OVERFLOW:
+                yield None, None                                # events were lost
+                continue
+
+            with self.__lock:
+                directory = self.__directories.get(wd)
+
+                if mask & InotifyWatcher.__LOST:
+                    self.__directories.pop(wd, None)            # the watch is gone - callers revert to polling
+
+            if directory is None:
+                yield None, None                                # the watch has been removed, or was never known
+            else:
+                yield directory, name
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def active(self):
+        return self.__thread is not None
+
+
+    @property
+    def directories(self):
+        with self.__lock:
+            return sorted(self.__directories.values())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "InotifyWatcher:{active:%s, directories:%s}" % (self.active, self.directories)
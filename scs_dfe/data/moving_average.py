@@ -0,0 +1,101 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A streaming moving average over the most recent length values - O(1) per update, by means of a running sum.
+
+example JSON:
+{"type": "mavg", "length": 5, "window": [0.29411, 0.29415, 0.29402]}
+"""
+
+from collections import OrderedDict, deque
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MovingAverage(JSONable):
+    """
+    classdocs
+    """
+
+    TYPE = 'mavg'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        length = jdict.get('length')
+        window = jdict.get('window', [])
+
+        return MovingAverage(length, window)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, length, window=()):
+        """
+        Constructor
+        """
+        if length < 1:
+            raise ValueError("MovingAverage: length must be at least 1.")
+
+        self.__length = int(length)                             # int
+        self.__window = deque(window, maxlen=self.__length)     # deque of float
+        self.__sum = sum(self.__window)                         # float
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def update(self, value):
+        if len(self.__window) == self.__length:
+            self.__sum -= self.__window[0]
+
+        self.__window.append(value)
+        self.__sum += value
+
+        return self.value
+
+
+    def reset(self):
+        self.__window.clear()
+        self.__sum = 0.0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['type'] = MovingAverage.TYPE
+        jdict['length'] = self.length
+        jdict['window'] = list(self.__window)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def length(self):
+        return self.__length
+
+
+    @property
+    def value(self):
+        if not self.__window:
+            return None
+
+        return self.__sum / len(self.__window)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "MovingAverage:{length:%d, count:%d, value:%s}" % (self.length, len(self.__window), self.value)
@@ -0,0 +1,167 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Opt-in timing instrumentation: durations and counts for each phase of a sweep - such as lock waits, I2C
+transactions, conversion waits, and calibration - are totalled over the sweep, then recorded in a per-phase
+DurationHistogram.
+
+Instrumented classes hold a profile of None when instrumentation is off, and the timed(..) decorator then calls the
+method directly.
+
+example JSON:
+{"sweeps": 120, "phases": {"i2c": {"count": 3360, "per-sweep": {"n": 120, "total": 0.8113, ...}}, ...}}
+"""
+
+import functools
+import time
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+from scs_dfe.data.duration_histogram import DurationHistogram
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PhaseProfile(JSONable):
+    """
+    classdocs
+    """
+
+    LOCK_WAIT =         'lock-wait'
+    I2C =               'i2c'
+    CONVERSION_WAIT =   'conversion-wait'
+    CALIBRATION =       'calibration'
+    DATUM =             'datum'
+    SWEEP =             'sweep'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def timed(phase):
+        """
+        method decorator: records the duration of each call, if the instance has a profile
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(self, *args, **kwargs):
+                profile = self.profile
+
+                if profile is None:
+                    return func(self, *args, **kwargs)
+
+                start_time = time.perf_counter()
+
+                try:
+                    return func(self, *args, **kwargs)
+
+                finally:
+                    profile.record(phase, time.perf_counter() - start_time)
+
+            return wrapper
+
+        return decorator
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__histograms = OrderedDict()           # phase: DurationHistogram of per-sweep totals
+        self.__counts = OrderedDict()               # phase: int
+
+        self.__sweeps = 0                           # int
+        self.__sweep_start = None                   # float     perf_counter
+        self.__sweep_totals = OrderedDict()         # phase: float seconds, for the sweep in progress
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start_sweep(self):
+        self.__sweep_start = time.perf_counter()
+        self.__sweep_totals = OrderedDict()
+
+
+    def end_sweep(self):
+        if self.__sweep_start is None:
+            return
+
+        self.record(PhaseProfile.SWEEP, time.perf_counter() - self.__sweep_start)
+
+        for phase, total in self.__sweep_totals.items():
+            if phase not in self.__histograms:
+                self.__histograms[phase] = DurationHistogram()
+
+            self.__histograms[phase].record(total)
+
+        self.__sweeps += 1
+        self.__sweep_start = None
+
+
+    def record(self, phase, duration):
+        self.__sweep_totals[phase] = self.__sweep_totals.get(phase, 0.0) + duration
+        self.__counts[phase] = self.__counts.get(phase, 0) + 1
+
+
+    def clear(self):
+        self.__histograms = OrderedDict()
+        self.__counts = OrderedDict()
+
+        self.__sweeps = 0
+        self.__sweep_start = None
+        self.__sweep_totals = OrderedDict()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        phases = OrderedDict()
+
+        for phase, histogram in self.__histograms.items():
+            jdict = OrderedDict()
+
+            jdict['count'] = self.__counts.get(phase, 0)
+            jdict['per-sweep'] = histogram
+
+            phases[phase] = jdict
+
+        jdict = OrderedDict()
+
+        jdict['sweeps'] = self.sweeps
+        jdict['phases'] = phases
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def histogram(self, phase):
+        return self.__histograms.get(phase)
+
+
+    def count(self, phase):
+        return self.__counts.get(phase, 0)
+
+
+    @property
+    def phases(self):
+        return list(self.__histograms.keys())
+
+
+    @property
+    def sweeps(self):
+        return self.__sweeps
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        phases = '{' + ', '.join('%s: %s' % (phase, histogram) for phase, histogram in self.__histograms.items()) + '}'
+
+        return "PhaseProfile:{sweeps:%d, phases:%s}" % (self.sweeps, phases)
@@ -0,0 +1,136 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A fixed-capacity, preallocated ring buffer of timestamped numeric values. Values are held in an array.array of the
+given typecode, so that a buffer of raw ADC counts costs two bytes per sample plus its timestamp.
+
+There is a single writer; readers receive copies, in chronological order.
+"""
+
+from array import array
+from threading import Lock
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RingBuffer(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, capacity, typecode='h'):
+        """
+        Constructor
+        """
+        if capacity < 1:
+            raise ValueError("RingBuffer: capacity must be at least 1.")
+
+        self.__capacity = capacity                              # int
+        self.__typecode = typecode                              # string
+
+        self.__values = array(typecode, [0]) * capacity         # array of typecode
+        self.__recs = array('d', [0.0]) * capacity              # array of float    epoch seconds
+
+        self.__head = 0                                         # int   index of the next write
+        self.__count = 0                                        # int   total values appended
+
+        self.__lock = Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, rec, value):
+        with self.__lock:
+            self.__recs[self.__head] = rec
+            self.__values[self.__head] = value
+
+            self.__head = (self.__head + 1) % self.__capacity
+            self.__count += 1
+
+
+    def clear(self):
+        with self.__lock:
+            self.__head = 0
+            self.__count = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def last(self, n):
+        """
+        returns (recs, values) for the most recent n values, oldest first
+        """
+        with self.__lock:
+            return self.__slice(max(len(self) - n, 0))
+
+
+    def since(self, rec):
+        """
+        returns (recs, values) for the values timestamped at or after rec, oldest first
+        """
+        with self.__lock:
+            return self.__slice(self.__find(rec))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __find(self, rec):
+        length = len(self)
+        first = (self.__head - length) % self.__capacity
+
+        lo, hi = 0, length                  # binary search over the chronological order
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+
+            if self.__recs[(first + mid) % self.__capacity] < rec:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        return lo
+
+
+    def __slice(self, start):
+        length = len(self)
+        first = (self.__head - length) % self.__capacity          # physical index of the oldest value
+
+        begin = (first + start) % self.__capacity
+        end = begin + length - start
+
+        if end <= self.__capacity:
+            return self.__recs[begin:end], self.__values[begin:end]
+
+        end %= self.__capacity
+
+        return self.__recs[begin:] + self.__recs[:end], self.__values[begin:] + self.__values[:end]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+
+    @property
+    def count(self):
+        """
+        the total number of values appended, including those that have been overwritten
+        """
+        return self.__count
+
+
+    def __len__(self):
+        return min(self.__count, self.__capacity)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RingBuffer:{capacity:%d, typecode:%s, length:%d, count:%d}" % \
+               (self.capacity, self.__typecode, len(self), self.count)
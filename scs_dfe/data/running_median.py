@@ -0,0 +1,124 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A streaming median over the most recent length values - O(log n) per update. The window is held in arrival order,
+and in sorted order in an IndexableSkiplist.
+
+example JSON:
+{"type": "median", "length": 5, "window": [0.29411, 0.29415, 0.29402]}
+"""
+
+import math
+
+from collections import OrderedDict, deque
+
+from scs_core.data.json import JSONable
+
+from scs_dfe.data.indexable_skiplist import IndexableSkiplist
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RunningMedian(JSONable):
+    """
+    classdocs
+    """
+
+    TYPE = 'median'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return None
+
+        length = jdict.get('length')
+        window = jdict.get('window', [])
+
+        return RunningMedian(length, window)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, length, window=()):
+        """
+        Constructor
+        """
+        if length < 1:
+            raise ValueError("RunningMedian: length must be at least 1.")
+
+        self.__length = int(length)                             # int
+        self.__window = deque(maxlen=self.__length)             # deque of float, in arrival order
+        self.__sorted = IndexableSkiplist(self.__length)        # the same values, in sorted order
+
+        for value in window:
+            self.update(value)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def update(self, value):
+        if not math.isfinite(value):
+            raise ValueError("RunningMedian.update: value must be finite: %s" % value)
+
+        if len(self.__window) == self.__length:
+            self.__sorted.remove(self.__window[0])
+
+        self.__window.append(value)
+        self.__sorted.insert(value)
+
+        return self.value
+
+
+    def reset(self):
+        self.__window.clear()
+        self.__sorted = IndexableSkiplist(self.__length)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['type'] = RunningMedian.TYPE
+        jdict['length'] = self.length
+        jdict['window'] = list(self.__window)
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def length(self):
+        return self.__length
+
+
+    @property
+    def count(self):
+        return len(self.__window)
+
+
+    @property
+    def value(self):
+        count = len(self.__sorted)
+
+        if count == 0:
+            return None
+
+        middle = count // 2
+
+        if count % 2:
+            return self.__sorted[middle]
+
+        return (self.__sorted[middle - 1] + self.__sorted[middle]) / 2.0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RunningMedian:{length:%d, count:%d, value:%s}" % (self.length, self.count, self.value)
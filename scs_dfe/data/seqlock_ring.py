@@ -0,0 +1,244 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A single-writer, multi-reader ring of fixed-size binary records in shared memory. Each slot is guarded by its own
+sequence lock: while record n is written to its slot, the slot's sequence number is 2n + 1, and when it is complete,
+2n + 2. A reader copies the slot, then re-reads the sequence number - it retries if the record was being written, or
+reports it as lost if it has been overwritten. Readers take no lock, and never block the writer.
+
+The count and the sequence numbers are 32-bit words, aligned to 4 bytes, and each is written by a single 32-bit store,
+so that a reader on a 32-bit host cannot see a torn value. There must be only one writer. Python provides no memory
+barriers - the writer's stores are assumed to become visible to readers in the order in which they are made. Record
+numbers, and sequence numbers, wrap at 2 ** 32.
+
+Layout, in native 32-bit words: count, record size, capacity, reserved, then capacity slots of sequence, record -
+each slot padded to a whole number of words.
+"""
+
+import time
+
+from multiprocessing import shared_memory
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SeqlockRing(object):
+    """
+    classdocs
+    """
+
+    __WORD = 4                                      # bytes
+    __WORD_MASK = 0xffffffff
+
+    __COUNT = 0                                     # word indices of header
+    __RECORD_SIZE = 1
+    __CAPACITY = 2
+    __HEADER_WORDS = 4
+
+    __MAX_RETRIES = 1000
+    __RETRY_DELAY = 0.000001                        # seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def attach(cls, name):
+        """
+        attach to an existing ring
+        """
+        shm = shared_memory.SharedMemory(name=name)
+
+        words = shm.buf.cast('I')
+
+        try:
+            record_size, capacity = words[cls.__RECORD_SIZE], words[cls.__CAPACITY]
+
+        finally:
+            words.release()
+
+        return cls(record_size, capacity, shm=shm)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, record_size, capacity, shm=None):
+        """
+        Constructor
+        """
+        if capacity < 1:
+            raise ValueError("SeqlockRing: capacity must be at least 1.")
+
+        word = SeqlockRing.__WORD
+        slot_size = word + -(-record_size // word) * word                   # sequence, record, padding
+        size = SeqlockRing.__HEADER_WORDS * word + capacity * slot_size
+
+        self.__owner = shm is None
+        self.__shm = shared_memory.SharedMemory(create=True, size=size) if shm is None else shm
+
+        self.__record_size = record_size            # int       bytes
+        self.__capacity = capacity                  # int       records
+        self.__slot_size = slot_size                # int       bytes
+        self.__buf = self.__shm.buf
+        self.__words = self.__buf[:size].cast('I')  # memoryview of native 32-bit words
+
+        if self.__owner:
+            self.__words[SeqlockRing.__RECORD_SIZE] = record_size
+            self.__words[SeqlockRing.__CAPACITY] = capacity
+            self.__words[SeqlockRing.__COUNT] = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, record):
+        """
+        single writer only
+        returns the number of the record
+        """
+        if len(record) != self.__record_size:
+            raise ValueError("SeqlockRing.write: record of %d bytes is not of size %d." %
+                             (len(record), self.__record_size))
+
+        number = self.__words[SeqlockRing.__COUNT]
+        offset = self.__offset(number)
+        seq_index = offset // SeqlockRing.__WORD
+
+        self.__words[seq_index] = self.__seq(number, 1)                         # odd: write in progress
+
+        start = offset + SeqlockRing.__WORD
+        self.__buf[start:start + self.__record_size] = record
+
+        self.__words[seq_index] = self.__seq(number, 2)                         # even: complete
+
+        self.__words[SeqlockRing.__COUNT] = (number + 1) & SeqlockRing.__WORD_MASK
+
+        return number
+
+
+    def read(self, number):
+        """
+        returns a consistent copy of record number, or None if it has not been written, or has been overwritten
+        raises TimeoutError if no consistent copy could be made
+        """
+        offset = self.__offset(number)
+        seq_index = offset // SeqlockRing.__WORD
+        start = offset + SeqlockRing.__WORD
+
+        writing = self.__seq(number, 1)
+        complete = self.__seq(number, 2)
+
+        for _ in range(SeqlockRing.__MAX_RETRIES):
+            seq1 = self.__words[seq_index]
+
+            if seq1 == writing:
+                time.sleep(SeqlockRing.__RETRY_DELAY)
+                continue
+
+            if seq1 != complete:
+                return None
+
+            record = bytes(self.__buf[start:start + self.__record_size])
+
+            seq2 = self.__words[seq_index]
+
+            if seq1 == seq2:
+                return record
+
+        raise TimeoutError("SeqlockRing.read: no consistent read.")
+
+
+    def latest(self):
+        """
+        returns (number, record) for the most recent record, or None if nothing has been written
+        """
+        for _ in range(SeqlockRing.__MAX_RETRIES):
+            count = self.count
+
+            if count == 0:
+                return None
+
+            record = self.read(count - 1)
+
+            if record is not None:
+                return count - 1, record
+
+        raise TimeoutError("SeqlockRing.latest: no consistent read.")
+
+
+    def since(self, number):
+        """
+        returns a list of (number, record) for the records numbered number or later that are still held, oldest first
+        """
+        count = self.count
+
+        records = []
+
+        for n in range(max(number, count - self.__capacity, 0), count):
+            record = self.read(n)
+
+            if record is not None:
+                records.append((n, record))
+
+        return records
+
+
+    def close(self):
+        """
+        detach - the ring is destroyed if this instance created it
+        """
+        self.__words.release()
+        self.__words = None
+        self.__buf = None
+
+        self.__shm.close()
+
+        if self.__owner:
+            self.__shm.unlink()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __offset(self, number):
+        return SeqlockRing.__HEADER_WORDS * SeqlockRing.__WORD + (number % self.__capacity) * self.__slot_size
+
+
+    @staticmethod
+    def __seq(number, phase):
+        return (2 * number + phase) & SeqlockRing.__WORD_MASK
+
+
+    def __reduce__(self):
+        return SeqlockRing.attach, (self.name, )      # a process that unpickles the ring attaches to it
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.__shm.name
+
+
+    @property
+    def record_size(self):
+        return self.__record_size
+
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+
+    @property
+    def count(self):
+        """
+        the number of records written, including those that have been overwritten
+        """
+        return self.__words[SeqlockRing.__COUNT]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SeqlockRing:{name:%s, record_size:%d, capacity:%d, count:%d, owner:%s}" % \
+               (self.name, self.record_size, self.capacity, self.count, self.__owner)
@@ -0,0 +1,174 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A single-writer, multi-reader slot in shared memory, guarded by a sequence lock: the writer makes the sequence number
+odd, writes the payload, then makes it even. A reader copies the payload, then re-reads the sequence number - it
+retries if the sequence number was odd, or changed while it was copying. Readers take no lock, and never block the
+writer.
+
+The sequence number and the payload length are 32-bit words, aligned to 4 bytes, and each is written by a single
+32-bit store, so that a reader on a 32-bit host cannot see a torn value. There must be only one writer. Python provides
+no memory barriers - the writer's stores are assumed to become visible to readers in the order in which they are made.
+The sequence number wraps at 2 ** 32.
+
+Layout, in native 32-bit words: sequence, payload length, capacity, reserved, then the payload (capacity bytes).
+"""
+
+import time
+
+from multiprocessing import shared_memory
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SeqlockSlot(object):
+    """
+    classdocs
+    """
+
+    __WORD_MASK = 0xffffffff
+
+    __SEQ = 0                                       # word indices of header
+    __LENGTH = 1
+    __CAPACITY = 2
+    __HEADER_SIZE = 16                              # bytes - four words
+
+    __MAX_RETRIES = 1000
+    __RETRY_DELAY = 0.000001                        # seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def attach(cls, name):
+        """
+        attach to an existing slot
+        """
+        shm = shared_memory.SharedMemory(name=name)
+
+        words = shm.buf[:cls.__HEADER_SIZE].cast('I')
+
+        try:
+            capacity = words[cls.__CAPACITY]                    # shm.size may be rounded up to a page
+
+        finally:
+            words.release()
+
+        return cls(capacity, shm=shm)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, capacity, shm=None):
+        """
+        Constructor
+        """
+        self.__owner = shm is None
+        self.__shm = shared_memory.SharedMemory(create=True, size=SeqlockSlot.__HEADER_SIZE + capacity) \
+            if shm is None else shm
+
+        self.__capacity = capacity                  # int       bytes
+        self.__buf = self.__shm.buf
+        self.__words = self.__buf[:SeqlockSlot.__HEADER_SIZE].cast('I')     # memoryview of native 32-bit words
+
+        if self.__owner:
+            self.__words[SeqlockSlot.__CAPACITY] = capacity
+            self.__words[SeqlockSlot.__LENGTH] = 0
+            self.__words[SeqlockSlot.__SEQ] = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, payload):
+        """
+        single writer only
+        """
+        length = len(payload)
+
+        if length > self.__capacity:
+            raise ValueError("SeqlockSlot.write: payload of %d bytes exceeds capacity of %d." %
+                             (length, self.__capacity))
+
+        seq = self.__words[SeqlockSlot.__SEQ]
+
+        self.__words[SeqlockSlot.__SEQ] = (seq + 1) & SeqlockSlot.__WORD_MASK       # odd: write in progress
+
+        start = SeqlockSlot.__HEADER_SIZE
+        self.__buf[start:start + length] = payload
+        self.__words[SeqlockSlot.__LENGTH] = length
+
+        self.__words[SeqlockSlot.__SEQ] = (seq + 2) & SeqlockSlot.__WORD_MASK       # even: complete
+
+
+    def read(self):
+        """
+        returns a consistent copy of the payload, or None if nothing has been written
+        raises TimeoutError if no consistent copy could be made
+        """
+        start = SeqlockSlot.__HEADER_SIZE
+
+        for _ in range(SeqlockSlot.__MAX_RETRIES):
+            seq1 = self.__words[SeqlockSlot.__SEQ]
+
+            if seq1 & 1:
+                time.sleep(SeqlockSlot.__RETRY_DELAY)
+                continue
+
+            if seq1 == 0:
+                return None
+
+            length = min(self.__words[SeqlockSlot.__LENGTH], self.__capacity)
+            payload = bytes(self.__buf[start:start + length])
+
+            seq2 = self.__words[SeqlockSlot.__SEQ]
+
+            if seq1 == seq2:
+                return payload
+
+        raise TimeoutError("SeqlockSlot.read: no consistent read.")
+
+
+    def close(self):
+        """
+        detach - the slot is destroyed if this instance created it
+        """
+        self.__words.release()
+        self.__words = None
+        self.__buf = None
+
+        self.__shm.close()
+
+        if self.__owner:
+            self.__shm.unlink()
+
+
+    def __reduce__(self):
+        return SeqlockSlot.attach, (self.name, )      # a process that unpickles the slot attaches to it
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        return self.__shm.name
+
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+
+    @property
+    def seq(self):
+        """
+        the number of completed writes
+        """
+        return self.__words[SeqlockSlot.__SEQ] // 2
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SeqlockSlot:{name:%s, capacity:%d, owner:%s}" % (self.name, self.capacity, self.__owner)
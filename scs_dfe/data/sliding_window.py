@@ -0,0 +1,136 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+count, total, mean, min and max of the values received in the most recent period - amortised O(1) per value. The
+total is kept as a running sum; the min and max are the heads of monotonic deques, from which values that can no
+longer be the extremum are discarded as new values arrive.
+
+Values must be appended in time order.
+
+example JSON:
+{"n": 60, "avg": 21.43, "min": 21.1, "max": 21.9}
+"""
+
+from collections import OrderedDict, deque
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SlidingWindow(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, period):
+        """
+        Constructor
+        """
+        if period <= 0:
+            raise ValueError("SlidingWindow: period must be positive.")
+
+        self.__period = period              # float     seconds
+
+        self.__values = deque()             # deque of (rec, value), oldest first
+        self.__total = 0.0                  # float
+
+        self.__mins = deque()               # deque of (rec, value), values increasing
+        self.__maxs = deque()               # deque of (rec, value), values decreasing
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, rec, value):
+        self.expire(rec)
+
+        self.__values.append((rec, value))
+        self.__total += value
+
+        while self.__mins and self.__mins[-1][1] >= value:
+            self.__mins.pop()
+
+        self.__mins.append((rec, value))
+
+        while self.__maxs and self.__maxs[-1][1] <= value:
+            self.__maxs.pop()
+
+        self.__maxs.append((rec, value))
+
+
+    def expire(self, rec):
+        """
+        discard values received at or before rec - period
+        """
+        start = rec - self.__period
+
+        while self.__values and self.__values[0][0] <= start:
+            self.__total -= self.__values.popleft()[1]
+
+        while self.__mins and self.__mins[0][0] <= start:
+            self.__mins.popleft()
+
+        while self.__maxs and self.__maxs[0][0] <= start:
+            self.__maxs.popleft()
+
+        if not self.__values:
+            self.__total = 0.0              # discard accumulated rounding error
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['n'] = self.count
+        jdict['avg'] = self.mean
+        jdict['min'] = self.min
+        jdict['max'] = self.max
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def period(self):
+        return self.__period
+
+
+    @property
+    def count(self):
+        return len(self.__values)
+
+
+    @property
+    def total(self):
+        return self.__total
+
+
+    @property
+    def mean(self):
+        if not self.__values:
+            return None
+
+        return self.__total / len(self.__values)
+
+
+    @property
+    def min(self):
+        return self.__mins[0][1] if self.__mins else None
+
+
+    @property
+    def max(self):
+        return self.__maxs[0][1] if self.__maxs else None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "SlidingWindow:{period:%s, count:%d, mean:%s, min:%s, max:%s}" % \
+               (self.period, self.count, self.mean, self.min, self.max)
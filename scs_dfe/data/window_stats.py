@@ -0,0 +1,90 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+count, mean, min and max of the values in a tumbling window - O(1) per value, constant memory.
+
+example JSON:
+{"n": 60, "avg": 21.43, "min": 21.1, "max": 21.9}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class WindowStats(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__count = 0                    # int
+        self.__total = 0.0                  # float
+        self.__min = None                   # number
+        self.__max = None                   # number
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, value):
+        self.__count += 1
+        self.__total += value
+
+        if self.__min is None or value < self.__min:
+            self.__min = value
+
+        if self.__max is None or value > self.__max:
+            self.__max = value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['n'] = self.count
+        jdict['avg'] = self.mean
+        jdict['min'] = self.min
+        jdict['max'] = self.max
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def count(self):
+        return self.__count
+
+
+    @property
+    def mean(self):
+        if self.__count == 0:
+            return None
+
+        return self.__total / self.__count
+
+
+    @property
+    def min(self):
+        return self.__min
+
+
+    @property
+    def max(self):
+        return self.__max
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "WindowStats:{count:%d, mean:%s, min:%s, max:%s}" % (self.count, self.mean, self.min, self.max)
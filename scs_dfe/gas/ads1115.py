@@ -4,9 +4,16 @@ Created on 22 Jul 2016
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 """
 
-import struct
+import asyncio
 import time
 
+from scs_dfe.board.i2c_mutex import I2CMutex
+
+from scs_dfe.data.phase_profile import PhaseProfile
+
+from scs_dfe.gas.bus_session import BusSession
+from scs_dfe.gas.conversion_timer import ConversionTimer
+
 from scs_host.bus.i2c import I2C
 from scs_host.lock.lock import Lock
 
@@ -78,7 +85,9 @@ class ADS1115(object):
 
     __GAIN =            None
     __FULL_SCALE =      None
+    __LSB =             None
     __TCONV =           None
+    __SPS =             None
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -108,6 +117,9 @@ class ADS1115(object):
                         ADS1115.GAIN_6p144:  6.144
                     }
 
+        # volts per bit, indexed by gain code...
+        cls.__LSB = tuple(cls.__FULL_SCALE[gain_code << 9] / 32767.5 for gain_code in range(6))
+
         cls.__TCONV = {
                         ADS1115.RATE_8:     0.145,
                         ADS1115.RATE_16:    0.082,
@@ -119,12 +131,52 @@ class ADS1115(object):
                         ADS1115.RATE_860:   0.021
                     }
 
+        cls.__SPS = {
+                        ADS1115.RATE_8:     8,
+                        ADS1115.RATE_16:    16,
+                        ADS1115.RATE_32:    32,
+                        ADS1115.RATE_64:    64,
+                        ADS1115.RATE_128:   128,
+                        ADS1115.RATE_250:   250,
+                        ADS1115.RATE_475:   475,
+                        ADS1115.RATE_860:   860
+                    }
+
 
     @classmethod
     def gain(cls, index):
         return cls.__GAIN[index]
 
 
+    @classmethod
+    def gains(cls):
+        """
+        gain settings, narrowest full scale first
+        """
+        return cls.__GAIN
+
+
+    @classmethod
+    def full_scale(cls, gain):
+        return cls.__FULL_SCALE[gain]
+
+
+    @classmethod
+    def gain_code(cls, gain):
+        """
+        the compact (0 - 5) form of a gain setting, as used by RawCapture
+        """
+        return gain >> 9
+
+
+    @classmethod
+    def lsb_table(cls):
+        """
+        volts per bit, indexed by gain code
+        """
+        return cls.__LSB
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __init__(self, addr, rate):
@@ -135,9 +187,19 @@ class ADS1115(object):
         self.__addr = addr
         self.__rate = rate
         self.__gain = None
+        self.__lsb = None
 
         self.__config = ADS1115.__MODE_SINGLE | self.__rate | ADS1115.__COMP_QUEUE_0
 
+        # ready detection...
+        self.__timer = ConversionTimer(ADS1115.__TCONV[self.__rate])
+
+        self.__started = None
+        self.__polls = 0
+        self.__ready = False
+
+        self.__profile = None                       # PhaseProfile or None
+
         # write config...
         try:
             self.obtain_lock()
@@ -152,14 +214,64 @@ class ADS1115(object):
     def start_conversion(self, mux, gain):
         """
         start single-shot conversion
-        wait for conv_time before reading
+        wait for conv_time, or wait_conversion(), before reading
         """
-        self.__gain = gain
+        self.obtain_lock()
+        self.__start(mux, gain)
 
-        start = ADS1115.__OS_START | mux | gain | self.__config
 
-        self.obtain_lock()
-        self.__write_config(start)
+    def conversion_ready(self):
+        """
+        poll the OS bit of the config register
+        raises ValueError if the conversion has not completed within the timeout
+        """
+        if self.__ready:
+            return True
+
+        self.__polls += 1
+
+        config = self.__read_config()
+        elapsed = time.time() - self.__started
+
+        if config & ADS1115.__OS_START:
+            self.__ready = True
+            self.__timer.record(elapsed, self.__polls)
+
+            return True
+
+        if self.__timer.timed_out(elapsed):
+            raise ValueError("ADS1115:conversion_ready: conversion not ready.")
+
+        return False
+
+
+    def wait_conversion(self):
+        """
+        sleep for the learned conversion time, then poll until ready
+        returned value is the number of polls
+        """
+        while True:
+            delay = self.next_poll - time.time()
+
+            if delay > 0:
+                self.__sleep(delay)
+
+            if self.conversion_ready():
+                return self.__polls
+
+
+    async def wait_conversion_async(self):
+        """
+        as wait_conversion(), but awaits the learned conversion time and each back-off
+        """
+        while True:
+            delay = self.next_poll - time.time()
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if self.conversion_ready():
+                return self.__polls
 
 
     def read_conversion(self):
@@ -167,18 +279,27 @@ class ADS1115(object):
         read most recent conversion
         returned value is voltage
         """
+        return self.read_conversion_code() * self.__lsb
+
+
+    def read_conversion_code(self):
+        """
+        read most recent conversion
+        returned value is the signed conversion code
+        """
         try:
-            config = self.__read_config()
+            if not self.__ready:
+                config = self.__read_config()
 
-            if not (config & ADS1115.__OS_START):
-                raise ValueError("ADS1115:read_conversion: conversion not ready.")
+                if not (config & ADS1115.__OS_START):
+                    raise ValueError("ADS1115:read_conversion: conversion not ready.")
 
-            v = self.__read_conv()
+            code = self.__read_code()
 
         finally:
             self.release_lock()
 
-        return v
+        return code
 
 
     def convert(self, mux, gain):
@@ -189,77 +310,184 @@ class ADS1115(object):
         """
         try:
             self.start_conversion(mux, gain)
+            self.wait_conversion()
 
-            while True:
-                time.sleep(ADS1115.__TCONV[ADS1115.RATE_860])
-                config = self.__read_config()
-
-                if config & ADS1115.__OS_START:
-                    break
+            v = self.__read_code() * self.__lsb
 
         finally:
             self.release_lock()
 
-        v = self.__read_conv()
+        return v
+
+
+    async def convert_async(self, mux, gain):
+        """
+        as convert(..), but awaits the conversion
+        warning: the lock is held while awaiting - the ADC must not be shared between concurrent coroutines
+        returned value is voltage
+        """
+        await self.obtain_lock_async()
+
+        try:
+            self.__start(mux, gain)
+
+            await self.wait_conversion_async()
+
+            v = self.__read_code() * self.__lsb
+
+        finally:
+            self.release_lock()
 
         return v
 
 
+    def start_continuous(self, mux, gain):
+        """
+        start continuous conversion - the lock is held until stop_continuous()
+        """
+        self.__gain = gain
+        self.__lsb = ADS1115.__LSB[gain >> 9]
+
+        config = (self.__config & ~ADS1115.__MODE_SINGLE) | mux | gain
+
+        self.obtain_lock()
+        self.__write_config(config)
+
+
+    def read_continuous(self):
+        """
+        read the most recent continuous conversion
+        returned value is the signed conversion code
+        """
+        return self.__read_code()
+
+
+    def stop_continuous(self):
+        """
+        return to single-shot mode (power-down), and release the lock
+        """
+        try:
+            self.__write_config(self.__config)
+
+        finally:
+            self.release_lock()
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
+    def __start(self, mux, gain):
+        self.__gain = gain
+        self.__lsb = ADS1115.__LSB[gain >> 9]
+
+        start = ADS1115.__OS_START | mux | gain | self.__config
+
+        self.__write_config(start)
+
+        self.__started = time.time()
+        self.__polls = 0
+        self.__ready = False
+
+
+    @PhaseProfile.timed(PhaseProfile.CONVERSION_WAIT)
+    def __sleep(self, delay):
+        time.sleep(delay)
+
+
+    @PhaseProfile.timed(PhaseProfile.I2C)
     def __read_config(self):
         try:
-            I2C.start_tx(self.__addr)
+            I2CMutex.start_tx(self.__addr)
             msb, lsb = I2C.read_cmd(ADS1115.__REG_CONFIG, 2)
 
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
         config = (msb << 8) | lsb
         return config
 
 
+    @PhaseProfile.timed(PhaseProfile.I2C)
     def __write_config(self, config):
         try:
-            I2C.start_tx(self.__addr)
+            I2CMutex.start_tx(self.__addr)
             I2C.write(ADS1115.__REG_CONFIG, config >> 8, config & 0xff)
 
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
 
-    def __read_conv(self):
+    @PhaseProfile.timed(PhaseProfile.I2C)
+    def __read_code(self):
         try:
-            I2C.start_tx(self.__addr)
+            I2CMutex.start_tx(self.__addr)
             msb, lsb = I2C.read_cmd(ADS1115.__REG_CONV, 2)
 
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
-        # render voltage...
         unsigned = (msb << 8) | lsb
 
         # print("unsigned: 0x%04x" % unsigned)
 
-        signed = struct.unpack('h', struct.pack('H', unsigned))
+        return unsigned - 0x10000 if unsigned & 0x8000 else unsigned
 
-        v = (signed[0] / 32767.5) * ADS1115.__FULL_SCALE[self.__gain]
 
-        return v
+    # ----------------------------------------------------------------------------------------------------------------
 
+    def session(self):
+        """
+        a BusSession holding the lock of this ADC
+        """
+        return BusSession((self, ))
 
-    # ----------------------------------------------------------------------------------------------------------------
 
-    def obtain_lock(self):
-        Lock.acquire(self.__lock_name, ADS1115.__LOCK_TIMEOUT)
+    def obtain_lock(self, timeout=None):
+        """
+        timeout, if given, is limited to the lock timeout of the ADC
+        """
+        if BusSession.holds(self.lock_name):
+            return
+
+        self.__acquire_lock(ADS1115.__LOCK_TIMEOUT if timeout is None else min(timeout, ADS1115.__LOCK_TIMEOUT))
+
+
+    async def obtain_lock_async(self, timeout=None):
+        """
+        as obtain_lock(..), but the lock is waited for in the event loop's default executor - if cancelled while
+        waiting, the lock is released once it has been acquired
+        """
+        if BusSession.holds(self.lock_name):
+            return
+
+        acquisition = asyncio.get_running_loop().run_in_executor(None, self.obtain_lock, timeout)
+
+        try:
+            await asyncio.shield(acquisition)
+
+        except asyncio.CancelledError:
+            acquisition.add_done_callback(self.__abandon_lock)
+            raise
 
 
     def release_lock(self):
-        Lock.release(self.__lock_name)
+        if BusSession.holds(self.lock_name):
+            return
+
+        Lock.release(self.lock_name)
+
+
+    def __abandon_lock(self, acquisition):
+        if not acquisition.cancelled() and acquisition.exception() is None:
+            self.release_lock()
+
+
+    @PhaseProfile.timed(PhaseProfile.LOCK_WAIT)
+    def __acquire_lock(self, timeout):
+        Lock.acquire(self.lock_name, timeout)
 
 
     @property
-    def __lock_name(self):
+    def lock_name(self):
         return self.__class__.__name__ + "-" + ("0x%02x" % self.__addr)
 
 
@@ -280,8 +508,47 @@ class ADS1115(object):
         return ADS1115.__TCONV[self.__rate]
 
 
+    @property
+    def sps(self):
+        return ADS1115.__SPS[self.__rate]
+
+
+    @property
+    def next_poll(self):
+        """
+        the time at which the conversion in progress should next be polled
+        """
+        if self.__polls == 0:
+            return self.__started + self.__timer.expected
+
+        return time.time() + self.__timer.backoff(self.__polls)
+
+
+    @property
+    def polls(self):
+        """
+        the number of ready polls made for the most recent conversion
+        """
+        return self.__polls
+
+
+    @property
+    def timer(self):
+        return self.__timer
+
+
+    @property
+    def profile(self):
+        return self.__profile
+
+
+    @profile.setter
+    def profile(self, profile):
+        self.__profile = profile
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "ADS1115:{addr:0x%0.2x, rate:0x%0.4x, config:0x%0.4x}" % \
-                    (self.addr, self.rate, self.__config)
+        return "ADS1115:{addr:0x%0.2x, rate:0x%0.4x, config:0x%0.4x, timer:%s}" % \
+                    (self.addr, self.rate, self.__config, self.__timer)
@@ -0,0 +1,161 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+High-rate acquisition of a single ADS1115 channel: the ADC is placed in continuous-conversion mode, and a background
+thread reads each conversion at the ADC's data rate into a preallocated ring buffer of raw int16 codes.
+
+The ADC lock is held for as long as the stream runs. Each read is a single I2C transaction made under the I2CMutex,
+so other drivers in the process may share the bus with the stream - their transactions interleave with its reads.
+
+example:
+stream = ADS1115Stream(ADS1115(ADS1115.ADDR_WRK, ADS1115.RATE_860), ADS1115.MUX_A3_GND, ADS1115.GAIN_1p024, 8600)
+"""
+
+import time
+
+from threading import Event, Thread
+
+import numpy as np
+
+from scs_dfe.data.ring_buffer import RingBuffer
+from scs_dfe.gas.ads1115 import ADS1115
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ADS1115Stream(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, adc, mux, gain, capacity):
+        """
+        Constructor
+        """
+        self.__adc = adc                                    # ADS1115
+        self.__mux = mux                                    # int
+        self.__gain = gain                                  # int
+
+        self.__buffer = RingBuffer(capacity, 'h')           # RingBuffer of signed conversion codes
+
+        self.__stop = Event()
+        self.__thread = None
+
+        self.__errors = 0                                   # int   failed reads
+        self.__overruns = 0                                 # int   periods missed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start(self):
+        if self.running:
+            return
+
+        self.__stop.clear()
+        self.__buffer.clear()
+
+        self.__adc.start_continuous(self.__mux, self.__gain)
+
+        self.__thread = Thread(target=self.__run, name=self.__class__.__name__, daemon=True)
+        self.__thread.start()
+
+
+    def stop(self):
+        if self.__thread is None:
+            return
+
+        self.__stop.set()
+        self.__thread.join()
+        self.__thread = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def last(self, n):
+        """
+        returns (recs, codes) for the most recent n conversions, oldest first
+        """
+        return self.__buffer.last(n)
+
+
+    def since(self, rec):
+        """
+        returns (recs, codes) for conversions made at or after rec (epoch seconds), oldest first
+        """
+        return self.__buffer.since(rec)
+
+
+    def volts(self, codes):
+        """
+        returns an ndarray of float
+        """
+        lsb = ADS1115.lsb_table()[ADS1115.gain_code(self.__gain)]
+
+        return np.frombuffer(codes, dtype=np.int16) * lsb
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __run(self):
+        period = 1.0 / self.__adc.sps
+        due = time.time() + period                          # the first conversion completes after one period
+
+        try:
+            while not self.__stop.is_set():
+                delay = due - time.time()
+
+                if delay > 0:
+                    time.sleep(delay)
+
+                try:
+                    self.__buffer.append(time.time(), self.__adc.read_continuous())
+
+                except OSError:
+                    self.__errors += 1
+
+                due += period
+
+                # fell behind - skip the missed periods, rather than reading the same conversion repeatedly...
+                now = time.time()
+
+                if due < now:
+                    missed = int((now - due) / period) + 1
+
+                    self.__overruns += missed
+                    due += missed * period
+
+        finally:
+            self.__adc.stop_continuous()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def running(self):
+        return self.__thread is not None and self.__thread.is_alive()
+
+
+    @property
+    def count(self):
+        return self.__buffer.count
+
+
+    @property
+    def errors(self):
+        return self.__errors
+
+
+    @property
+    def overruns(self):
+        return self.__overruns
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ADS1115Stream:{adc:%s, mux:0x%04x, gain:0x%04x, running:%s, buffer:%s, errors:%d, overruns:%d}" % \
+               (self.__adc, self.__mux, self.__gain, self.running, self.__buffer, self.errors, self.overruns)
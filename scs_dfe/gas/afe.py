@@ -3,16 +3,55 @@ Created on 10 Jul 2016
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 
-Warning: If an Ox sensor is present, the NO2 sensor must have a lower sensor number (SN) than the Ox sensor,
-otherwise the NO2 cross-sensitivity concentration will not be found.
+Timing instrumentation is off unless a PhaseProfile is assigned to profile.
+
+The temperature used for compensation is selected by an AFETempSource policy - the Pt1000 conversion is made only if
+the policy needs it, and runs concurrently with the gas conversions, as does any SHT sample.
+
+If auto_range is set, the ADS1115 gain of each channel is selected from its previous reading, rather than fixed by
+the sensor calibration - see GainRanger.
+
+A sample may be given a deadline: channels whose conversions cannot be completed in time are not started, and are
+reported as null datums. The number of times each channel has been skipped is available.
+
+The ADC locks are acquired once for each sample, rather than once for each conversion - see BusSession - and are
+released when the sweep is complete, before calibration. A caller may hold session() across several samples. Samples
+requested concurrently by several threads or tasks are serialised by the session.
+
+If an Ox sensor is present, the NO2 sample is evaluated first, and used for its NO2 cross-sensitivity correction.
+When sampling station-by-station, or a subset of stations, a recent NO2 sample may be reused - see NO2Cache.
+
+Stations may be sampled at different intervals - see AFEScheduler.
+
+WE / AE voltages may be passed through streaming filters before calibration - see AFEFilter.
+
+The raw readings of each sample may be written to a journal, for later recalculation - see AFEJournal, AFEReplay -
+with the compensation temperature and the NO2 concentration used for cross-sensitivity correction. The WE / AE
+voltages are journalled as converted: a replay does not reproduce the effect of a raw_filter.
 """
 
+import asyncio
 import time
 
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+
+import numpy as np
+
 from scs_core.gas.afe_datum import AFEDatum
 
+from scs_dfe.data.phase_profile import PhaseProfile
+
 from scs_dfe.gas.ads1115 import ADS1115
+from scs_dfe.gas.afe_journal import AFEJournal
+from scs_dfe.gas.afe_sweep import AFESweep
+from scs_dfe.gas.afe_temp_source import AFETempSource
+from scs_dfe.gas.burst_datum import BurstDatum
+from scs_dfe.gas.bus_session import BusSession
+from scs_dfe.gas.gain_ranger import GainRanger
 from scs_dfe.gas.mcp342x import MCP342X
+from scs_dfe.gas.no2_cache import NO2Cache
+from scs_dfe.gas.raw_capture import RawCapture
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -22,24 +61,14 @@ class AFE(object):
     Alphasense Analogue Front-End (AFE) with Ti ADS1115 ADC (gases), Microchip Technology MCP342X ADC (Pt1000 temp)
     """
     __RATE = ADS1115.RATE_8
+    __BURST_RATE = ADS1115.RATE_128
 
     __MUX = (ADS1115.MUX_A3_GND, ADS1115.MUX_A2_GND, ADS1115.MUX_A1_GND, ADS1115.MUX_A0_GND)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    @classmethod
-    def __no2_sample(cls, samples):
-        for sample in samples:
-            if sample[0] == 'NO2':
-                return sample[1]
-
-        return None
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-
-    def __init__(self, pt1000_conf, pt1000, sensors):
+    def __init__(self, pt1000_conf, pt1000, sensors, no2_max_age=None, auto_range=False, temp_source=None):
         """
         Constructor
         """
@@ -47,6 +76,21 @@ class AFE(object):
         self.__pt1000 = pt1000
         self.__sensors = sensors
 
+        # sensor lookups...
+        self.__indices = [index for index in range(len(sensors)) if sensors[index] is not None]
+
+        no2_indices = [index for index in self.__indices if sensors[index].gas_name == 'NO2']
+        self.__no2_index = no2_indices[0] if no2_indices else None
+
+        # deadline skip counts...
+        self.__skips = OrderedDict((index, 0) for index in self.__indices)
+        self.__pt1000_skips = 0
+        self.__deadline_samples = 0
+
+        self.__no2_cache = NO2Cache(no2_max_age)
+
+        self.__temp_source = AFETempSource() if temp_source is None else temp_source
+
         self.__wrk_adc = ADS1115(ADS1115.ADDR_WRK, AFE.__RATE)
         self.__aux_adc = ADS1115(ADS1115.ADDR_AUX, AFE.__RATE)
 
@@ -54,59 +98,93 @@ class AFE(object):
 
         self.__tconv = self.__wrk_adc.tconv
 
+        self.__ranger = GainRanger() if auto_range else None
+
+        self.__sweep = AFESweep(self.__wrk_adc, self.__aux_adc, self.__pt1000_adc, self.__ranger)
+        self.__burst_sweep = None                   # AFESweep at __BURST_RATE, created on first use
+        self.__burst_adcs = ()
+
+        self.__session = BusSession((self.__wrk_adc, self.__aux_adc, self.__pt1000_adc))
+        self.__burst_session = None
+
+        self.__raw = None                           # sensor_index: (we_v, ae_v) for the sweep in progress
+        self.__last_raw = OrderedDict()             # sensor_index: (we_v, ae_v) for the most recent sweep
+        self.__last_tmp_v = None                    # float     Pt1000 voltage for the most recent sweep
+
+        self.__profile = None                       # PhaseProfile or None
+        self.__raw_filter = None                    # AFEFilter or None
+        self.__journal = None                       # AFEJournal or None
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def sample(self, sht_datum=None):
-        pt1000_datum = self.sample_temp()
+    def session(self):
+        """
+        the BusSession for the AFE ADCs - may be entered to hold the locks across several samples
+        """
+        return self.__session
 
-        temp = pt1000_datum.temp if sht_datum is None else sht_datum.temp       # use SHT temp if available
 
-        samples = []
-        no2_sample = None
+    # ----------------------------------------------------------------------------------------------------------------
 
-        for sensor_index in range(len(self.__sensors)):
-            sensor = self.__sensors[sensor_index]
+    def sample(self, sht_datum=None, deadline=None):
+        """
+        deadline: optional epoch seconds - sensors that cannot be sampled in time are reported as null datums
+        """
+        return self.__sample(self.__indices, sht_datum, deadline)
 
-            if sensor is None:
-                continue
 
-            # cross-sensitivity sample...
-            if sensor.has_no2_cross_sensitivity():
-                no2_sample = AFE.__no2_sample(samples)
+    def sample_station(self, sn, sht_datum=None, deadline=None):
+        return self.__sample([sn - 1], sht_datum, deadline)
+
 
-            # sample...
-            sample = sensor.sample(self, temp, sensor_index, no2_sample)
+    def sample_stations(self, sns, sht_datum=None, deadline=None):
+        """
+        sample the given sensor numbers only, converting them in the given order
+        """
+        return self.__sample([sn - 1 for sn in sns], sht_datum, deadline)
 
-            samples.append((sensor.gas_name, sample))
 
-        return AFEDatum(pt1000_datum, *samples)
+    def sample_burst(self, n):
+        """
+        n back-to-back WE / AE conversions per sensor, at the burst rate
+        returns an AFEDatum of BurstDatum
+        """
+        indices, channels = self.__burst_channels(n)
+        sweep = self.__get_burst_sweep()
 
+        with self.__sweep_profile(), self.__burst_session:
+            tmp_v, codes = sweep.run(channels, self.__pt1000 is not None, raw=True)
 
-    def sample_station(self, sn, sht_datum=None):
-        index = sn - 1
+        return self.__burst_datum(n, indices, channels, tmp_v, codes)
 
-        pt1000_datum = self.sample_temp()
 
-        temp = pt1000_datum.temp if sht_datum is None else sht_datum.temp       # use SHT temp if available
+    # ----------------------------------------------------------------------------------------------------------------
 
-        sensor = self.__sensors[index]
+    async def sample_async(self, sht_datum=None, deadline=None):
+        return await self.__sample_async(self.__indices, sht_datum, deadline)
 
-        if sensor is None:
-            return AFEDatum(pt1000_datum)
 
-        # cross-sensitivity sample...
-        if sensor.has_no2_cross_sensitivity():
-            no2_index, no2_sensor = self.__no2_sensor()
-            no2_sample = no2_sensor.sample(self, temp, no2_index)
-        else:
-            no2_sample = None
+    async def sample_station_async(self, sn, sht_datum=None, deadline=None):
+        return await self.__sample_async([sn - 1], sht_datum, deadline)
+
+
+    async def sample_stations_async(self, sns, sht_datum=None, deadline=None):
+        return await self.__sample_async([sn - 1 for sn in sns], sht_datum, deadline)
 
-        # sample...
-        sample = sensor.sample(self, temp, index, no2_sample)
 
-        return AFEDatum(pt1000_datum, (sensor.gas_name, sample))
+    async def sample_burst_async(self, n):
+        indices, channels = self.__burst_channels(n)
+        sweep = self.__get_burst_sweep()
 
+        with self.__sweep_profile():
+            async with self.__burst_session:
+                tmp_v, codes = await sweep.run_async(channels, self.__pt1000 is not None, raw=True)
+
+        return self.__burst_datum(n, indices, channels, tmp_v, codes)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
 
     def null_datum(self):
         pt1000_datum = self.sample_temp()
@@ -138,15 +216,365 @@ class AFE(object):
     # ----------------------------------------------------------------------------------------------------------------
 
     def sample_raw_wrk_aux(self, sensor_index, gain_index):
+        if self.__raw is not None and sensor_index in self.__raw:
+            we_v, ae_v = self.__raw[sensor_index]
+
+        else:
+            we_v, ae_v = self.__range_wrk_aux(sensor_index, gain_index)
+
+        if self.__raw_filter is None:
+            return we_v, ae_v
+
+        return self.__raw_filter.update(self.__sensors[sensor_index].gas_name, we_v, ae_v)
+
+
+    def sample_raw_wrk(self, sensor_index, gain_index):
+        if self.__raw is not None and sensor_index in self.__raw:
+            we_v = self.__raw[sensor_index][0]
+
+        else:
+            we_v = self.__range_wrk(sensor_index, gain_index)
+
+        if self.__raw_filter is None:
+            return we_v
+
+        return self.__raw_filter.update(self.__sensors[sensor_index].gas_name, we_v, None)[0]
+
+
+    def sample_raw_tmp(self):
+        if self.__pt1000_adc is None:
+            return None
+
+        try:
+            self.__pt1000_adc.start_conversion()
+
+            self.__pt1000_adc.wait_conversion()
+
+            return self.__pt1000_adc.read_conversion()
+
+        finally:
+            self.__pt1000_adc.release_lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __sample(self, indices, sht_datum, deadline):
+        with self.__sweep_profile():
+            with self.__locked(deadline) as locked:
+                if not locked:
+                    return self.__skipped_datum(indices)
+
+                conversion_indices = self.__conversion_indices(indices, sht_datum)
+                pt1000_datum, raw, sht_datum = self.__acquire(conversion_indices, sht_datum, deadline)
+
+            # the locks are released before calibration...
+            return self.__datum(pt1000_datum, raw, sht_datum, deadline is not None, indices)
+
+
+    async def __sample_async(self, indices, sht_datum, deadline):
+        with self.__sweep_profile():
+            async with self.__locked_async(deadline) as locked:
+                if not locked:
+                    return self.__skipped_datum(indices)
+
+                conversion_indices = self.__conversion_indices(indices, sht_datum)
+                pt1000_datum, raw, sht_datum = await self.__acquire_async(conversion_indices, sht_datum, deadline)
+
+            # the locks are released before calibration...
+            return self.__datum(pt1000_datum, raw, sht_datum, deadline is not None, indices)
+
+
+    @contextmanager
+    def __locked(self, deadline):
+        try:
+            self.__session.open(deadline)
+
+        except TimeoutError:
+            yield False
+            return
+
+        try:
+            yield True
+
+        finally:
+            self.__session.close()
+
+
+    @asynccontextmanager
+    async def __locked_async(self, deadline):
+        try:
+            await self.__session.open_async(deadline)
+
+        except TimeoutError:
+            yield False
+            return
+
+        try:
+            yield True
+
+        finally:
+            self.__session.close()
+
+
+    def __acquire(self, indices, sht_datum, deadline):
+        convert_pt1000, sht = self.__temp_source.plan(sht_datum, self.__pt1000 is not None)
+
+        during = None if sht is None else lambda: AFE.__sample_sht(sht)
+
+        tmp_v, raw = self.__sweep.run(self.__channels(indices), convert_pt1000, during=during, deadline=deadline)
+
+        if sht is not None:
+            sht_datum = self.__sweep.during_value
+
+        self.__last_raw = raw
+        self.__last_tmp_v = tmp_v
+        self.__count_skips(deadline)
+
+        return self.__pt1000_datum(tmp_v) if convert_pt1000 else None, raw, sht_datum
+
+
+    async def __acquire_async(self, indices, sht_datum, deadline):
+        convert_pt1000, sht = self.__temp_source.plan(sht_datum, self.__pt1000 is not None)
+
+        sweep = self.__sweep.run_async(self.__channels(indices), convert_pt1000, deadline=deadline)
+
+        if sht is None:
+            tmp_v, raw = await sweep
+
+        else:
+            (tmp_v, raw), sht_datum = await asyncio.gather(sweep, AFE.__sample_sht_async(sht))
+
+        self.__last_raw = raw
+        self.__last_tmp_v = tmp_v
+        self.__count_skips(deadline)
+
+        return self.__pt1000_datum(tmp_v) if convert_pt1000 else None, raw, sht_datum
+
+
+    def __count_skips(self, deadline):
+        if deadline is None:
+            return
+
+        self.__deadline_samples += 1
+
+        for sensor_index in self.__sweep.skipped:
+            self.__skips[sensor_index] += 1
+
+        if self.__sweep.tmp_skipped:
+            self.__pt1000_skips += 1
+
+
+    def __write_journal(self, sht_datum, raw, temp, no2_sample, no2_source):
+        """
+        the raw voltages are journalled as converted - before any raw_filter
+        """
+        if self.__journal is None:
+            return
+
+        gains = {}
+
+        for sensor_index in raw:
+            gain = ADS1115.gain(self.__sensors[sensor_index].adc_gain_index)
+
+            gains[sensor_index] = gain if self.__ranger is None else self.__ranger.selected.get(sensor_index, gain)
+
+        sht_temp = None if sht_datum is None else sht_datum.temp
+        no2_cnc = None if no2_sample is None else no2_sample.cnc
+
+        self.__journal.write(time.time(), self.__last_tmp_v, sht_temp, temp, no2_cnc, no2_source, raw, gains)
+
+
+    def __skipped_datum(self, indices):
+        """
+        the locks could not be obtained by the deadline
+        """
+        self.__deadline_samples += 1
+        self.__last_raw = OrderedDict()
+
+        samples = []
+
+        for sensor_index in indices:
+            sensor = self.__sensors[sensor_index]
+
+            if sensor is None:
+                continue
+
+            self.__skips[sensor_index] += 1
+            samples.append((sensor.gas_name, sensor.null_datum()))
+
+        if self.__pt1000 is None:
+            return self.__afe_datum(None, *samples)
+
+        self.__pt1000_skips += 1
+
+        return self.__afe_datum(self.__pt1000.null_datum(), *samples)
+
+
+    @staticmethod
+    def __sample_sht(sht):
+        try:
+            return sht.sample()
+
+        except OSError:
+            return None
+
+
+    @staticmethod
+    async def __sample_sht_async(sht):
         try:
-            gain = ADS1115.gain(gain_index)
+            return await sht.sample_async()
+
+        except OSError:
+            return None
+
+
+    def __conversion_indices(self, indices, sht_datum):
+        """
+        NO2 first - if it is requested, or is needed by a cross-sensitive sensor and the NO2 cache cannot serve the
+        temperature that the sample is expected to use
+        """
+        others = [index for index in indices if self.__sensors[index] is not None and index != self.__no2_index]
+
+        if self.__no2_index is None:
+            return others
+
+        if self.__no2_index in indices:
+            return [self.__no2_index] + others
+
+        if self.__needs_no2(indices) and \
+                not self.__no2_cache.serves(self.__temp_source.expected_temp(sht_datum)):
+            return [self.__no2_index] + others
+
+        return others
+
+
+    def __needs_no2(self, indices):
+        return any(self.__sensors[index] is not None and self.__sensors[index].has_no2_cross_sensitivity()
+                   for index in indices)
+
+
+    def __datum(self, pt1000_datum, raw, sht_datum, partial, indices):
+        temp = self.__temp_source.temp(pt1000_datum, sht_datum)
+
+        samples = []
+
+        try:
+            self.__raw = raw
+
+            # cross-sensitivity sample...
+            if self.__no2_index in indices or self.__needs_no2(indices):
+                no2_sample, no2_source = self.__no2_sample(temp, raw, partial)
+            else:
+                no2_sample, no2_source = None, AFEJournal.NO2_NONE
+
+            for sensor_index in indices:
+                sensor = self.__sensors[sensor_index]
+
+                if sensor is None:
+                    continue
+
+                if sensor_index == self.__no2_index:
+                    sample = sensor.null_datum() if no2_sample is None else no2_sample
+
+                else:
+                    sample = self.__sensor_sample(sensor, temp, sensor_index, raw, partial, no2_sample)
+
+                samples.append((sensor.gas_name, sample))
+
+        finally:
+            self.__raw = None
+
+        self.__write_journal(sht_datum, raw, temp, no2_sample, no2_source)
+
+        return self.__afe_datum(pt1000_datum, *samples)
+
+
+    def __sensor_sample(self, sensor, temp, sensor_index, raw, partial, no2_sample):
+        if partial:
+            if sensor_index not in raw:
+                return sensor.null_datum()
+
+            if sensor.has_no2_cross_sensitivity() and self.__no2_index is not None and no2_sample is None:
+                return sensor.null_datum()
+
+        return self.__calibrate(sensor, temp, sensor_index, no2_sample)
 
-            mux = AFE.__MUX[sensor_index]
 
+    def __no2_sample(self, temp, raw, partial):
+        """
+        the cached NO2 sample, if the sweep did not include NO2 and the cache serves the temperature, otherwise a new
+        NO2 sample - from the sweep, or, if the temperature moved during the sweep, from a conversion made now - None
+        if partial, and NO2 was not converted
+        returns (no2_sample, AFEJournal NO2 source)
+        """
+        if self.__no2_index is None:
+            return None, AFEJournal.NO2_NONE
+
+        if self.__no2_index not in raw:
+            cached_sample = self.__no2_cache.sample(temp)
+
+            if cached_sample is not None:
+                return cached_sample, AFEJournal.NO2_CACHED
+
+            if partial:
+                return None, AFEJournal.NO2_NONE
+
+        no2_sample = self.__calibrate(self.__sensors[self.__no2_index], temp, self.__no2_index)
+
+        self.__no2_cache.update(no2_sample, temp)
+
+        return no2_sample, AFEJournal.NO2_CONVERTED
+
+
+    def __range_wrk_aux(self, sensor_index, gain_index):
+        mux = AFE.__MUX[sensor_index]
+        gain = self.__gain(sensor_index, gain_index)
+
+        we_v, ae_v = self.__convert_wrk_aux(mux, gain)
+
+        if self.__ranger is not None:
+            if self.__ranger.saturated(gain, we_v, ae_v):
+                self.__ranger.reconverting()
+
+                gain = self.__ranger.widest_gain()
+                we_v, ae_v = self.__convert_wrk_aux(mux, gain)
+
+            self.__ranger.record(sensor_index, gain, we_v, ae_v)
+
+        return we_v, ae_v
+
+
+    def __range_wrk(self, sensor_index, gain_index):
+        mux = AFE.__MUX[sensor_index]
+        gain = self.__gain(sensor_index, gain_index)
+
+        we_v = self.__convert_wrk(mux, gain)
+
+        if self.__ranger is not None:
+            if self.__ranger.saturated(gain, we_v):
+                self.__ranger.reconverting()
+
+                gain = self.__ranger.widest_gain()
+                we_v = self.__convert_wrk(mux, gain)
+
+            self.__ranger.record(sensor_index, gain, we_v)
+
+        return we_v
+
+
+    def __gain(self, sensor_index, gain_index):
+        gain = ADS1115.gain(gain_index)
+
+        return gain if self.__ranger is None else self.__ranger.gain(sensor_index, gain)
+
+
+    def __convert_wrk_aux(self, mux, gain):
+        try:
             self.__wrk_adc.start_conversion(mux, gain)
             self.__aux_adc.start_conversion(mux, gain)
 
-            time.sleep(self.__tconv)
+            self.__wrk_adc.wait_conversion()
+            self.__aux_adc.wait_conversion()
 
             we_v = self.__wrk_adc.read_conversion()
             ae_v = self.__aux_adc.read_conversion()
@@ -158,47 +586,209 @@ class AFE(object):
             self.__aux_adc.release_lock()
 
 
-    def sample_raw_wrk(self, sensor_index, gain_index):
+    def __convert_wrk(self, mux, gain):
         try:
-            gain = ADS1115.gain(gain_index)
+            self.__wrk_adc.start_conversion(mux, gain)
 
-            mux = AFE.__MUX[sensor_index]
+            self.__wrk_adc.wait_conversion()
 
-            self.__wrk_adc.start_conversion(mux, gain)
+            return self.__wrk_adc.read_conversion()
 
-            time.sleep(self.__tconv)
+        finally:
+            self.__wrk_adc.release_lock()
 
-            we_v = self.__wrk_adc.read_conversion()
 
-            return we_v
+    def __burst_channels(self, n):
+        if n < 1:
+            raise ValueError("AFE:sample_burst: n must be at least 1.")
+
+        channels = [((sensor_index, i), mux, gain)
+                    for sensor_index, mux, gain in self.__channels(self.__indices) for i in range(n)]
+
+        return self.__indices, channels
+
+
+    def __burst_datum(self, n, indices, channels, tmp_v, codes):
+        # voltages...
+        wrk_capture = RawCapture(ADS1115.lsb_table())
+        aux_capture = RawCapture(ADS1115.lsb_table())
+
+        for (_, _, gain), (we_code, ae_code) in zip(channels, codes.values()):
+            wrk_capture.append(we_code, ADS1115.gain_code(gain))
+            aux_capture.append(ae_code, ADS1115.gain_code(gain))
+
+        # statistics...
+        values = np.stack((wrk_capture.volts(), aux_capture.volts()), axis=-1).reshape((len(indices), n, 2))
+
+        bursts = BurstDatum.construct_all(values)
+
+        samples = [(self.__sensors[index].gas_name, burst) for index, burst in zip(indices, bursts)]
+
+        return self.__afe_datum(self.__pt1000_datum(tmp_v), *samples)
+
+
+    def __get_burst_sweep(self):
+        if self.__burst_sweep is None:
+            wrk_adc = ADS1115(ADS1115.ADDR_WRK, AFE.__BURST_RATE)
+            aux_adc = ADS1115(ADS1115.ADDR_AUX, AFE.__BURST_RATE)
+
+            self.__burst_adcs = (wrk_adc, aux_adc)
+
+            self.__burst_sweep = AFESweep(wrk_adc, aux_adc, self.__pt1000_adc)
+            self.__burst_session = BusSession((wrk_adc, aux_adc, self.__pt1000_adc))
+
+            self.__set_profile(self.__burst_sweep, *self.__burst_adcs)
+
+        return self.__burst_sweep
+
+
+    def __channels(self, indices):
+        channels = []
+
+        for sensor_index in indices:
+            sensor = self.__sensors[sensor_index]
+
+            if sensor is None:
+                continue
+
+            channels.append((sensor_index, AFE.__MUX[sensor_index], ADS1115.gain(sensor.adc_gain_index)))
+
+        return channels
+
+
+    @PhaseProfile.timed(PhaseProfile.CALIBRATION)
+    def __calibrate(self, sensor, temp, sensor_index, no2_sample=None):
+        return sensor.sample(self, temp, sensor_index, no2_sample)
+
+
+    @PhaseProfile.timed(PhaseProfile.DATUM)
+    def __afe_datum(self, pt1000_datum, *samples):
+        return AFEDatum(pt1000_datum, *samples)
+
+
+    @contextmanager
+    def __sweep_profile(self):
+        if self.__profile is None:
+            yield
+            return
+
+        self.__profile.start_sweep()
+
+        try:
+            yield
 
         finally:
-            self.__wrk_adc.release_lock()
+            self.__profile.end_sweep()
 
 
-    def sample_raw_tmp(self):
-        if self.__pt1000_adc is None:
+    @PhaseProfile.timed(PhaseProfile.CALIBRATION)
+    def __pt1000_datum(self, tmp_v):
+        if self.__pt1000 is None:
             return None
 
-        try:
-            self.__pt1000_adc.start_conversion()
+        if tmp_v is None:
+            return self.__pt1000.null_datum()
 
-            time.sleep(self.__pt1000_adc.tconv)
+        return self.__pt1000.datum(tmp_v)
 
-            return self.__pt1000_adc.read_conversion()
 
-        finally:
-            self.__pt1000_adc.release_lock()
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __set_profile(self, *instrumented):
+        for item in instrumented:
+            if item is not None:
+                item.profile = self.__profile
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __no2_sensor(self):
-        for index in range(len(self.__sensors)):
-            if self.__sensors[index].gas_name == 'NO2':
-                return index, self.__sensors[index]
+    @property
+    def sensors(self):
+        return self.__sensors
+
+
+    @property
+    def ranger(self):
+        return self.__ranger
+
+
+    @property
+    def temp_source(self):
+        return self.__temp_source
+
+
+    @property
+    def last_raw(self):
+        """
+        OrderedDict of gas_name: (we_v, ae_v) for the channels converted by the most recent sample
+        """
+        return OrderedDict((self.__sensors[index].gas_name, self.__last_raw[index])
+                           for index in self.__indices if index in self.__last_raw)
+
+
+    @property
+    def skipped(self):
+        """
+        the number of deadline-limited samples in which the Pt1000, and each sensor, were skipped
+        """
+        skipped = OrderedDict()
+
+        if self.__pt1000 is not None:
+            skipped['pt1000'] = self.__pt1000_skips
+
+        for sensor_index, count in self.__skips.items():
+            skipped[self.__sensors[sensor_index].gas_name] = count
+
+        return skipped
+
+
+    @property
+    def deadline_samples(self):
+        return self.__deadline_samples
+
+
+    @property
+    def raw_filter(self):
+        """
+        AFEFilter applied to WE / AE voltages before calibration, or None - last_raw, and the journal, are not
+        filtered
+        """
+        return self.__raw_filter
+
+
+    @raw_filter.setter
+    def raw_filter(self, raw_filter):
+        self.__raw_filter = raw_filter
+
+
+    @property
+    def journal(self):
+        """
+        AFEJournal to which the raw readings of each sample are written, with the compensation temperature and NO2
+        cross-sensitivity concentration, or None
+        """
+        return self.__journal
+
+
+    @journal.setter
+    def journal(self, journal):
+        self.__journal = journal
+
+
+    @property
+    def profile(self):
+        """
+        PhaseProfile, or None if instrumentation is off
+        """
+        return self.__profile
+
+
+    @profile.setter
+    def profile(self, profile):
+        self.__profile = profile
 
-        return None
+        self.__set_profile(self.__wrk_adc, self.__aux_adc, self.__pt1000_adc, self.__sweep,
+                           self.__burst_sweep, *self.__burst_adcs)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -206,5 +796,7 @@ class AFE(object):
     def __str__(self, *args, **kwargs):
         sensors = '[' + ', '.join(str(sensor) for sensor in self.__sensors) + ']'
 
-        return "AFE:{pt1000:%s, sensors:%s, tconv:%0.3f, wrk_adc:%s, aux_adc:%s, pt1000_adc:%s}" % \
-            (self.__pt1000, sensors, self.__tconv, self.__wrk_adc, self.__aux_adc, self.__pt1000_adc)
+        return "AFE:{pt1000:%s, sensors:%s, tconv:%0.3f, wrk_adc:%s, aux_adc:%s, pt1000_adc:%s, no2_cache:%s, " \
+               "ranger:%s}" % \
+            (self.__pt1000, sensors, self.__tconv, self.__wrk_adc, self.__aux_adc, self.__pt1000_adc,
+             self.__no2_cache, self.__ranger)
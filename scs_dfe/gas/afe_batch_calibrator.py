@@ -0,0 +1,214 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Calibration and temperature compensation of batches of raw A4 WE / AE voltages, as arrays - for the reprocessing of
+stored raw voltages after a change of calibration or baseline. The arithmetic is that of A4Datum.construct(..) and
+A4TempComp (Alphasense Application Note AAN 803-02), evaluated in one NumPy pass per sensor:
+
+weT = weV - we_elc_mv / 1000
+aeT = aeV - ae_elc_mv / 1000
+weC = A4TempComp algorithm 1 - 4, with cf_t interpolated from the A4TempComp table, or NaN above its range
+weC -= no2_cnc * we_no2_x_sens_mv / 1000, for sensors with NO2 cross-sensitivity
+cnc = weC / (we_sens_mv / 1000) + baseline offset
+
+Results are unrounded - A4Datum rounds weC to 5 and cnc to 1 decimal place. As on the per-sample path, the NO2
+concentration used for cross-sensitivity correction is rounded to 1 decimal place. Where the per-sample path would
+give a null weC / cnc, the result is NaN.
+
+A NaN NO2 concentration means that there was no NO2 sample, and gives a NaN result for a cross-sensitive sensor -
+a 0.0 concentration gives no correction. calibrate_all(..) uses the NO2 concentration recalculated from the NO2
+voltages, where they were converted - a NO2 sample whose concentration is null then gives no correction, as on the
+per-sample path - and the given NO2 concentrations elsewhere, for example where the sample used the NO2Cache.
+
+Sensors that are not A4 sensors - for example, PIDs - are not supported.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from scs_core.gas.a4_temp_comp import A4TempComp
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AFEBatchCalibrator(object):
+    """
+    classdocs
+    """
+
+    __TEMP_MIN =            -30.0           # °C    first point of the A4TempComp table
+    __TEMP_INTERVAL =        10.0           # °C    A4TempComp table interval
+
+    __CNC_PRECISION =        1              # decimal places of an A4Datum cnc
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __tc(sensor):
+        try:
+            return True, A4TempComp.find(sensor.sensor_code)
+
+        except ValueError:
+            return False, None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, afe_calib, afe_baseline):
+        """
+        Constructor
+        """
+        self.__sensors = afe_calib.sensors(afe_baseline)        # array of Sensor, in station order
+
+        self.__supported = []                                   # array of bool
+        self.__tcs = []                                         # array of A4TempComp or None
+
+        for sensor in self.__sensors:
+            supported, tc = (False, None) if sensor is None else AFEBatchCalibrator.__tc(sensor)
+
+            self.__supported.append(supported)
+            self.__tcs.append(tc)
+
+        no2_indices = [index for index, sensor in enumerate(self.__sensors)
+                       if self.__supported[index] and sensor.gas_name == 'NO2']
+
+        self.__no2_index = no2_indices[0] if no2_indices else None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def calibrate(self, sensor_index, temp, we_v, ae_v, no2_cnc=None):
+        """
+        temp, we_v, ae_v, no2_cnc: array-like, of equal length - or scalars, which are broadcast
+        no2_cnc: NaN where there was no NO2 sample
+        returns (we_c, cnc) as arrays of float
+        """
+        sensor = self.__sensors[sensor_index]
+
+        if not self.__supported[sensor_index]:
+            raise ValueError("AFEBatchCalibrator.calibrate: sensor %d is not an A4 sensor." % (sensor_index + 1))
+
+        temp, we_v, ae_v = np.broadcast_arrays(np.asarray(temp, dtype=float), np.asarray(we_v, dtype=float),
+                                               np.asarray(ae_v, dtype=float))
+
+        calib = sensor.calib
+        tc = self.__tcs[sensor_index]
+
+        if calib is None or tc is None:
+            nans = np.full(we_v.shape, np.nan)
+            return nans, nans.copy()
+
+        # temperature compensation...
+        we_t = we_v - (calib.we_elc_mv / 1000.0)
+        ae_t = ae_v - (calib.ae_elc_mv / 1000.0)
+
+        cf_t = self.__cf_t(tc, temp)
+
+        if tc.algorithm == 1:
+            we_c = we_t - cf_t * ae_t
+
+        elif tc.algorithm == 2:
+            we_c = we_t - cf_t * (calib.we_cal_mv / calib.ae_cal_mv) * ae_t
+
+        elif tc.algorithm == 3:
+            we_c = we_t - cf_t * (calib.we_cal_mv - calib.ae_cal_mv) * ae_t
+
+        elif tc.algorithm == 4:
+            we_c = we_t - calib.we_cal_mv - cf_t
+
+        else:
+            raise ValueError("AFEBatchCalibrator.calibrate: unrecognised algorithm: %d." % tc.algorithm)
+
+        with np.errstate(invalid='ignore'):
+            we_c = np.where(temp <= AFEBatchCalibrator.__temp_max(tc), we_c, np.nan)      # as A4TempComp.in_range
+
+        # NO2 cross-sensitivity...
+        if no2_cnc is not None and sensor.has_no2_cross_sensitivity():
+            no2_cnc = np.round(np.asarray(no2_cnc, dtype=float), AFEBatchCalibrator.__CNC_PRECISION)
+
+            we_c = we_c - (np.broadcast_to(no2_cnc, we_c.shape) * calib.we_no2_x_sens_mv) / 1000.0
+
+        # concentration...
+        offset = 0 if sensor.baseline is None else sensor.baseline.offset
+
+        cnc = we_c / (calib.we_sens_mv / 1000.0) + offset
+
+        return we_c, cnc
+
+
+    def calibrate_all(self, temp, we_v, ae_v, no2_cnc=None):
+        """
+        temp: array-like of length n
+        we_v, ae_v: array-like of shape (n, stations)
+        no2_cnc: optional array-like of length n - the NO2 concentration for cross-sensitivity correction where the
+        NO2 voltages were not converted, NaN where there was no NO2 sample
+        returns OrderedDict of gas_name: (we_c, cnc), for each A4 sensor, in station order
+        """
+        we_v = np.asarray(we_v, dtype=float)
+        ae_v = np.asarray(ae_v, dtype=float)
+
+        given_cnc = np.full(len(we_v), np.nan) if no2_cnc is None else np.asarray(no2_cnc, dtype=float)
+
+        results = {}
+
+        # NO2 first, for cross-sensitivity...
+        no2_cnc = given_cnc
+
+        if self.__no2_index is not None:
+            no2_we_v = we_v[:, self.__no2_index]
+
+            results[self.__no2_index] = self.calibrate(self.__no2_index, temp, no2_we_v, ae_v[:, self.__no2_index])
+
+            recalculated_cnc = np.nan_to_num(results[self.__no2_index][1], nan=0.0)    # a null cnc: no correction
+            no2_cnc = np.where(np.isnan(no2_we_v), given_cnc, recalculated_cnc)
+
+        for index, sensor in enumerate(self.__sensors):
+            if not self.__supported[index] or index in results:
+                continue
+
+            cross = no2_cnc if sensor.has_no2_cross_sensitivity() else None
+
+            results[index] = self.calibrate(index, temp, we_v[:, index], ae_v[:, index], no2_cnc=cross)
+
+        return OrderedDict((self.__sensors[index].gas_name, results[index]) for index in sorted(results))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __temp_max(cls, tc):
+        return cls.__TEMP_MIN + cls.__TEMP_INTERVAL * (len(tc.values) - 1)
+
+
+    @classmethod
+    def __cf_t(cls, tc, temp):
+        """
+        the A4TempComp factor, interpolated linearly, and held at its first value below the range of the table
+        """
+        table_temps = cls.__TEMP_MIN + cls.__TEMP_INTERVAL * np.arange(len(tc.values))
+
+        return np.interp(temp, table_temps, np.asarray(tc.values, dtype=float))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def sensors(self):
+        return self.__sensors
+
+
+    @property
+    def gas_names(self):
+        return [sensor.gas_name for index, sensor in enumerate(self.__sensors) if self.__supported[index]]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        sensors = '[' + ', '.join(str(sensor) for sensor in self.__sensors) + ']'
+
+        return "AFEBatchCalibrator:{no2_index:%s, sensors:%s}" % (self.__no2_index, sensors)
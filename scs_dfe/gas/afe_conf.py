@@ -3,10 +3,12 @@ Created on 16 Jul 2017
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 
-specifies whether on not a Pt1000 temperature sensor is present on the AFE
+specifies whether on not a Pt1000 temperature sensor is present on the AFE, and the maximum age (seconds) of an NO2
+sample that may be reused for NO2 cross-sensitivity correction when sampling station-by-station (null: no reuse), and
+whether the ADS1115 gain of each channel is auto-ranged, and the temperature source policy - see AFETempSource
 
 example JSON:
-{"pt1000-present": true}
+{"pt1000-present": true, "no2-max-age": 60, "auto-range": false, "temp-source": "fresh"}
 """
 
 from collections import OrderedDict
@@ -16,7 +18,12 @@ from scs_core.gas.afe_baseline import AFEBaseline
 from scs_core.gas.afe_calib import AFECalib
 from scs_core.gas.pt1000_calib import Pt1000Calib
 
+from scs_dfe.data.conf_cache import ConfCache
+
+from scs_dfe.climate.sht_conf import SHTConf
+
 from scs_dfe.gas.afe import AFE
+from scs_dfe.gas.afe_temp_source import AFETempSource
 from scs_dfe.gas.pt1000 import Pt1000
 from scs_dfe.gas.pt1000_conf import Pt1000Conf
 
@@ -35,6 +42,16 @@ class AFEConf(PersistentJSONable):
         return host.conf_dir() + cls.__FILENAME
 
 
+    @classmethod
+    def load(cls, host):
+        return ConfCache.load(cls, host)
+
+
+    def save(self, host):
+        super().save(host)
+        ConfCache.invalidate(self.filename(host))           # the inotify event may not have arrived yet
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
@@ -43,19 +60,25 @@ class AFEConf(PersistentJSONable):
             return AFEConf(True)
 
         pt1000_present = jdict.get('pt1000-present')
+        no2_max_age = jdict.get('no2-max-age')
+        auto_range = jdict.get('auto-range', False)
+        temp_source = jdict.get('temp-source')
 
-        return AFEConf(pt1000_present)
+        return AFEConf(pt1000_present, no2_max_age, auto_range, temp_source)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, pt1000_present):
+    def __init__(self, pt1000_present, no2_max_age=None, auto_range=False, temp_source=None):
         """
         Constructor
         """
         super().__init__()
 
         self.__pt1000_present = bool(pt1000_present)
+        self.__no2_max_age = no2_max_age                        # float seconds or None
+        self.__auto_range = bool(auto_range)
+        self.__temp_source = temp_source                        # string or None
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -66,19 +89,34 @@ class AFEConf(PersistentJSONable):
         pt1000 = self.pt1000(host)
 
         # sensors...
-        afe_calib = AFECalib.load(host)
-        afe_baseline = AFEBaseline.load(host)
+        afe_calib = ConfCache.load(AFECalib, host)
+        afe_baseline = ConfCache.load(AFEBaseline, host)
 
         sensors = afe_calib.sensors(afe_baseline)
 
-        return AFE(pt1000_conf, pt1000, sensors)
+        # temperature...
+        temp_source = self.afe_temp_source(host)
+
+        return AFE(pt1000_conf, pt1000, sensors, self.no2_max_age, self.auto_range, temp_source)
+
+
+    def afe_temp_source(self, host):    # TODO: remove host
+        if self.temp_source is None or self.temp_source == AFETempSource.PT1000:
+            return AFETempSource(self.temp_source)
+
+        sht_conf = SHTConf.load(host)
+
+        if sht_conf is None:
+            return AFETempSource(self.temp_source)
+
+        return AFETempSource(self.temp_source, sht_conf.int_sht(), sht_conf.ext_sht())
 
 
     def pt1000(self, host):            # TODO: remove host
         if not self.pt1000_present:
             return None
 
-        pt1000_calib = Pt1000Calib.load(host)
+        pt1000_calib = ConfCache.load(Pt1000Calib, host)
 
         return Pt1000(pt1000_calib)
 
@@ -90,12 +128,30 @@ class AFEConf(PersistentJSONable):
         return self.__pt1000_present
 
 
+    @property
+    def no2_max_age(self):
+        return self.__no2_max_age
+
+
+    @property
+    def auto_range(self):
+        return self.__auto_range
+
+
+    @property
+    def temp_source(self):
+        return self.__temp_source
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def as_json(self):
         jdict = OrderedDict()
 
         jdict['pt1000-present'] = self.pt1000_present
+        jdict['no2-max-age'] = self.no2_max_age
+        jdict['auto-range'] = self.auto_range
+        jdict['temp-source'] = self.temp_source
 
         return jdict
 
@@ -103,4 +159,5 @@ class AFEConf(PersistentJSONable):
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "AFEConf:{pt1000_present:%s}" %  self.pt1000_present
+        return "AFEConf:{pt1000_present:%s, no2_max_age:%s, auto_range:%s, temp_source:%s}" %  \
+               (self.pt1000_present, self.no2_max_age, self.auto_range, self.temp_source)
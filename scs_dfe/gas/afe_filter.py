@@ -0,0 +1,158 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A streaming filter stage for the raw WE / AE voltages of each AFE channel, applied by AFE.sample_raw_wrk_aux(..)
+before calibration. Each electrode of each channel has its own chain of filters, built from the filter specifications
+on first use. Memory per channel is constant, and each update is O(1) - O(log n) for the median and Hampel filters.
+
+The state of every filter is included in the JSON, so that a sampling process can save(host) on exit and load(host)
+on start, without resetting its filters. The filter is not loaded through the ConfCache - its state is not shared.
+
+filter types:
+mavg        moving average                  {"type": "mavg", "length": 5}
+ewma        exponential IIR low-pass        {"type": "ewma", "alpha": 0.2}
+median      running median                  {"type": "median", "length": 5}
+hampel      Hampel spike rejection          {"type": "hampel", "length": 7, "threshold": 3.0, "min-limit": 0.0001875}
+
+example JSON:
+{"filters": [{"type": "hampel", "length": 7, "threshold": 3.0}, {"type": "ewma", "alpha": 0.2}],
+"channels": {"NO2": {"we": [{"type": "hampel", ...}, {"type": "ewma", ...}], "ae": [...]}}}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import PersistentJSONable
+
+from scs_dfe.data.ewma_filter import EWMAFilter
+from scs_dfe.data.hampel_filter import HampelFilter
+from scs_dfe.data.moving_average import MovingAverage
+from scs_dfe.data.running_median import RunningMedian
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AFEFilter(PersistentJSONable):
+    """
+    classdocs
+    """
+
+    __TYPES = OrderedDict((cls.TYPE, cls) for cls in (MovingAverage, EWMAFilter, RunningMedian, HampelFilter))
+
+    __ELECTRODES = ('we', 'ae')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    __FILENAME = "afe_filter.json"
+
+    @classmethod
+    def filename(cls, host):
+        return host.conf_dir() + cls.__FILENAME
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        if not jdict:
+            return AFEFilter(())
+
+        specs = jdict.get('filters', [])
+
+        channels = OrderedDict()
+
+        for gas_name, electrodes in jdict.get('channels', {}).items():
+            channels[gas_name] = tuple([cls.__filter(filter_jdict) for filter_jdict in electrodes.get(electrode, [])]
+                                       for electrode in cls.__ELECTRODES)
+
+        return AFEFilter(specs, channels)
+
+
+    @classmethod
+    def __filter(cls, jdict):
+        try:
+            filter_class = cls.__TYPES[jdict.get('type')]
+
+        except KeyError:
+            raise ValueError("AFEFilter: unknown filter type: %s" % jdict.get('type'))
+
+        return filter_class.construct_from_jdict(jdict)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, specs, channels=None):
+        """
+        Constructor
+        """
+        super().__init__()
+
+        self.__specs = [OrderedDict(spec) for spec in specs]        # list of filter specification jdicts
+
+        for spec in self.__specs:
+            AFEFilter.__filter(spec)                                # validate
+
+        self.__channels = OrderedDict() if channels is None else channels   # gas_name: (we chain, ae chain)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def update(self, gas_name, we_v, ae_v):
+        """
+        returns the filtered (we_v, ae_v) - an electrode whose value is None is not filtered
+        """
+        if gas_name not in self.__channels:
+            self.__channels[gas_name] = tuple([AFEFilter.__filter(spec) for spec in self.__specs]
+                                              for _ in AFEFilter.__ELECTRODES)
+
+        we_chain, ae_chain = self.__channels[gas_name]
+
+        return AFEFilter.__apply(we_chain, we_v), AFEFilter.__apply(ae_chain, ae_v)
+
+
+    def reset(self):
+        self.__channels = OrderedDict()
+
+
+    @staticmethod
+    def __apply(chain, value):
+        if value is None:
+            return None
+
+        for stage in chain:
+            value = stage.update(value)
+
+        return value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['filters'] = self.specs
+
+        jdict['channels'] = OrderedDict((gas_name, OrderedDict(zip(AFEFilter.__ELECTRODES, chains)))
+                                        for gas_name, chains in self.__channels.items())
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def specs(self):
+        return self.__specs
+
+
+    @property
+    def gas_names(self):
+        return list(self.__channels.keys())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AFEFilter:{specs:%s, gas_names:%s}" % (self.specs, self.gas_names)
@@ -0,0 +1,191 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An append-only binary journal of the raw readings of an AFE - one fixed-size record per sample, so that history can
+be recalculated after a change of calibration or baseline - see AFEReplay.
+
+The file is a header, followed by little-endian packed records:
+
+rec         float64     epoch seconds
+tmp_v       float64     Pt1000 Volts, NaN if not converted
+sht_temp    float64     SHT °C, NaN if no SHT sample was used
+temp        float64     °C used for temperature compensation, NaN if none
+no2_cnc     float64     NO2 ppb used for cross-sensitivity correction, NaN if none, or if null
+we_v        float64[4]  WE Volts by station, NaN if not converted
+ae_v        float64[4]  AE Volts by station, NaN if not converted
+gain        uint8[4]    ADS1115 PGA setting by station (register bits 11:9), 0xff if not converted
+no2         uint8       source of the NO2 sample: 0 none, 1 converted for this sample, 2 NO2Cache
+
+WE / AE voltages are journalled as converted, before any AFEFilter.
+
+The records of a journal are read as a read-only NumPy memory map. A partial record at the end of the file - for
+example, following a power failure - is ignored.
+"""
+
+import math
+import os
+import struct
+
+import numpy as np
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AFEJournal(object):
+    """
+    classdocs
+    """
+
+    STATIONS =          4
+
+    NOT_CONVERTED =     0xff
+
+    NO2_NONE =          0
+    NO2_CONVERTED =     1
+    NO2_CACHED =        2
+
+    DTYPE = np.dtype([('rec', '<f8'), ('tmp_v', '<f8'), ('sht_temp', '<f8'), ('temp', '<f8'), ('no2_cnc', '<f8'),
+                      ('we_v', '<f8', (STATIONS, )), ('ae_v', '<f8', (STATIONS, )), ('gain', 'u1', (STATIONS, )),
+                      ('no2', 'u1')])
+
+    __MAGIC =           b'SCSAFEJ2'
+    __HEADER =          struct.Struct('<8sI')                   # magic, record size
+    __RECORD =          struct.Struct('<5d4d4d4BB')
+
+    __PGA_SHIFT =       9
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def records(cls, filename):
+        """
+        returns a read-only memory map of the records in the journal, as a structured array of DTYPE
+        """
+        with open(filename, 'rb') as f:
+            cls.__check_header(f.read(cls.__HEADER.size), filename)
+
+        count = (os.path.getsize(filename) - cls.__HEADER.size) // cls.DTYPE.itemsize
+
+        if count == 0:
+            return np.empty(0, dtype=cls.DTYPE)
+
+        return np.memmap(filename, dtype=cls.DTYPE, mode='r', offset=cls.__HEADER.size, shape=(count, ))
+
+
+    @classmethod
+    def __check_header(cls, header, filename):
+        if len(header) < cls.__HEADER.size:
+            raise ValueError("AFEJournal: %s has no header." % filename)
+
+        magic, record_size = cls.__HEADER.unpack(header)
+
+        if magic != cls.__MAGIC or record_size != cls.DTYPE.itemsize:
+            raise ValueError("AFEJournal: %s is not an AFE journal of this version." % filename)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, filename):
+        """
+        Constructor
+        """
+        self.__filename = filename                  # string
+        self.__file = None                          # file, opened on first write
+
+        self.__written = 0                          # int       records written by this instance
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open(self):
+        if self.__file is not None:
+            return
+
+        self.__file = open(self.__filename, 'ab')
+
+        if self.__file.tell() == 0:
+            self.__file.write(AFEJournal.__HEADER.pack(AFEJournal.__MAGIC, AFEJournal.DTYPE.itemsize))
+
+        else:
+            with open(self.__filename, 'rb') as f:
+                AFEJournal.__check_header(f.read(AFEJournal.__HEADER.size), self.__filename)
+
+            self.__truncate_partial()
+
+        self.__file.flush()
+
+
+    def close(self):
+        if self.__file is None:
+            return
+
+        self.__file.close()
+        self.__file = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def write(self, rec, tmp_v, sht_temp, temp, no2_cnc, no2, raw, gains):
+        """
+        no2: NO2_NONE, NO2_CONVERTED or NO2_CACHED
+        raw: dict of sensor_index: (we_v, ae_v) for the converted channels
+        gains: dict of sensor_index: ADS1115 gain register value
+        """
+        self.open()
+
+        we_vs = [math.nan] * AFEJournal.STATIONS
+        ae_vs = [math.nan] * AFEJournal.STATIONS
+        pgas = [AFEJournal.NOT_CONVERTED] * AFEJournal.STATIONS
+
+        for sensor_index, (we_v, ae_v) in raw.items():
+            we_vs[sensor_index] = we_v
+            ae_vs[sensor_index] = ae_v
+
+            gain = gains.get(sensor_index)
+
+            if gain is not None:
+                pgas[sensor_index] = gain >> AFEJournal.__PGA_SHIFT
+
+        self.__file.write(AFEJournal.__RECORD.pack(rec, self.__float(tmp_v), self.__float(sht_temp),
+                                                   self.__float(temp), self.__float(no2_cnc),
+                                                   *we_vs, *ae_vs, *pgas, no2))
+        self.__file.flush()
+
+        self.__written += 1
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __float(value):
+        return math.nan if value is None else value
+
+
+    def __truncate_partial(self):
+        size = self.__file.tell()
+        partial = (size - AFEJournal.__HEADER.size) % AFEJournal.DTYPE.itemsize
+
+        if partial:
+            self.__file.truncate(size - partial)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def written(self):
+        return self.__written
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AFEJournal:{filename:%s, open:%s, written:%d}" % \
+               (self.filename, self.__file is not None, self.written)
@@ -0,0 +1,228 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Samples the AFE continuously in a separate process, publishing the most recent sample, with the raw WE / AE voltages
+of its sweep, through a SeqlockSlot in shared memory. Readers take neither the I2C bus nor any lock.
+
+Each sweep is given the sample period as its deadline, so that a slow sweep returns a partial datum rather than
+delaying the schedule.
+
+The sample is published as a fixed-layout binary record, rather than a pickled AFEDatum - the AFEDatum is built by
+the reader, and only when it is asked for. Layout, little-endian, with NaN for null values:
+
+rec                                                 float64
+pt1000                                              uint8       0: none, 1: present
+pt1000 v, pt1000 temp                               float64[2]
+then, for each of the four stations:
+kind                                                uint8       0: no sensor, 1: A4, 2: PID
+weV, aeV, weC, cnc, raw we_v, raw ae_v              float64[6]
+"""
+
+import math
+import struct
+import time
+
+from collections import OrderedDict
+
+from scs_core.gas.a4_datum import A4Datum
+from scs_core.gas.afe_datum import AFEDatum
+from scs_core.gas.pid_datum import PIDDatum
+from scs_core.gas.pt1000_datum import Pt1000Datum
+
+from scs_core.sync.interval_timer import IntervalTimer
+from scs_core.sync.synchronised_process import SynchronisedProcess
+
+from scs_dfe.data.seqlock_slot import SeqlockSlot
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AFEMonitor(SynchronisedProcess):
+    """
+    classdocs
+    """
+
+    __STATIONS = 4
+
+    __HEADER = struct.Struct('<dB2d')               # rec, pt1000, pt1000 v, pt1000 temp
+    __STATION = struct.Struct('<B6d')               # kind, weV, aeV, weC, cnc, raw we_v, raw ae_v
+
+    __RECORD_SIZE = __HEADER.size + __STATIONS * __STATION.size
+
+    __NONE = 0
+    __A4 = 1
+    __PID = 2
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __float(value):
+        return math.nan if value is None else value
+
+
+    @staticmethod
+    def __value(value):
+        return None if math.isnan(value) else value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, afe, sample_period):
+        """
+        Constructor
+        """
+        SynchronisedProcess.__init__(self, SeqlockSlot(AFEMonitor.__RECORD_SIZE))
+
+        self.__afe = afe
+        self.__sample_period = sample_period        # float     seconds
+
+        self.__gas_names = [None if sensor is None else sensor.gas_name for sensor in afe.sensors]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self):
+        try:
+            record = bytearray(AFEMonitor.__RECORD_SIZE)
+
+            timer = IntervalTimer(self.__sample_period)
+
+            while timer.true():
+                datum = self.__afe.sample(deadline=time.time() + self.__sample_period)
+
+                self.__pack(record, time.time(), datum, self.__afe.last_raw)
+                self._value.write(record)
+
+        except KeyboardInterrupt:
+            pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def latest(self):
+        """
+        returns (rec, AFEDatum, OrderedDict of gas_name: (we_v, ae_v)) for the most recent sweep, or None
+        """
+        record = self._value.read()
+
+        if record is None:
+            return None
+
+        rec = AFEMonitor.__HEADER.unpack_from(record)[0]
+
+        return rec, self.__datum(record), self.__raw(record)
+
+
+    def sample(self):
+        record = self._value.read()
+
+        return None if record is None else self.__datum(record)
+
+
+    def raw(self):
+        record = self._value.read()
+
+        return None if record is None else self.__raw(record)
+
+
+    def close(self):
+        self._value.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __pack(self, record, rec, datum, raw):
+        pt1000 = datum.pt1000
+        pt1000_v, pt1000_temp = (None, None) if pt1000 is None else (pt1000.v, pt1000.temp)
+
+        AFEMonitor.__HEADER.pack_into(record, 0, rec, pt1000 is not None, self.__float(pt1000_v),
+                                      self.__float(pt1000_temp))
+
+        offset = AFEMonitor.__HEADER.size
+
+        for gas_name in self.__gas_names:
+            sample = None if gas_name is None else datum.sns.get(gas_name)
+            raw_we_v, raw_ae_v = raw.get(gas_name, (None, None))
+
+            if sample is None:
+                kind, we_v, ae_v, we_c, cnc = AFEMonitor.__NONE, None, None, None, None
+
+            elif isinstance(sample, PIDDatum):
+                kind, we_v, ae_v, we_c, cnc = AFEMonitor.__PID, sample.we_v, None, sample.we_c, sample.cnc
+
+            else:
+                kind, we_v, ae_v, we_c, cnc = AFEMonitor.__A4, sample.we_v, sample.ae_v, sample.we_c, sample.cnc
+
+            AFEMonitor.__STATION.pack_into(record, offset, kind, *(self.__float(value) for value in
+                                                                  (we_v, ae_v, we_c, cnc, raw_we_v, raw_ae_v)))
+
+            offset += AFEMonitor.__STATION.size
+
+
+    def __datum(self, record):
+        _, pt1000_present, pt1000_v, pt1000_temp = AFEMonitor.__HEADER.unpack_from(record)
+
+        pt1000 = Pt1000Datum(self.__value(pt1000_v), self.__value(pt1000_temp)) if pt1000_present else None
+
+        samples = []
+
+        for gas_name, fields in zip(self.__gas_names, self.__stations(record)):
+            kind, we_v, ae_v, we_c, cnc, _, _ = fields
+
+            if kind == AFEMonitor.__NONE:
+                continue
+
+            if kind == AFEMonitor.__PID:
+                sample = PIDDatum(self.__value(we_v), self.__value(we_c), self.__value(cnc))
+
+            else:
+                sample = A4Datum(self.__value(we_v), self.__value(ae_v), self.__value(we_c), self.__value(cnc))
+
+            samples.append((gas_name, sample))
+
+        return AFEDatum(pt1000, *samples)
+
+
+    def __raw(self, record):
+        raw = OrderedDict()
+
+        for gas_name, fields in zip(self.__gas_names, self.__stations(record)):
+            raw_we_v, raw_ae_v = fields[5:]
+
+            if math.isnan(raw_we_v) and math.isnan(raw_ae_v):
+                continue
+
+            raw[gas_name] = (self.__value(raw_we_v), self.__value(raw_ae_v))
+
+        return raw
+
+
+    def __stations(self, record):
+        offset = AFEMonitor.__HEADER.size
+
+        for _ in range(AFEMonitor.__STATIONS):
+            yield AFEMonitor.__STATION.unpack_from(record, offset)
+
+            offset += AFEMonitor.__STATION.size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def sweeps(self):
+        return self._value.seq
+
+
+    @property
+    def sample_period(self):
+        return self.__sample_period
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AFEMonitor:{sample_period:%s, sweeps:%d, slot:%s, afe:%s}" % \
+               (self.sample_period, self.sweeps, self._value, self.__afe)
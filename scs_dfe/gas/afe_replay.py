@@ -0,0 +1,133 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Recalculates gas concentrations from an AFEJournal, with the calibration and baseline given to the
+AFEBatchCalibrator, in chunks of records, so that memory use is bounded for journals of any length.
+
+The temperature for each record is selected as by AFETempSource:
+
+None / fresh
+            the temperature used for compensation when the record was sampled, else the SHT temperature, if one was
+            recorded, else the Pt1000 temperature
+pt1000      the Pt1000 temperature
+int-sht / ext-sht
+            the SHT temperature, if one was recorded, else the Pt1000 temperature
+
+The Pt1000 temperature is recalculated by Pt1000.temps(..).
+
+The NO2 concentration for cross-sensitivity correction is recalculated where the NO2 voltages were journalled, and is
+otherwise the journalled concentration - for example, that of a cached NO2 sample. A journalled NO2 sample with a
+null concentration gives no correction; a record without a NO2 sample gives NaN for a cross-sensitive sensor.
+
+WE / AE voltages are journalled before any AFEFilter - a replay of filtered sampling is not filtered.
+"""
+
+import numpy as np
+
+from scs_dfe.gas.afe_journal import AFEJournal
+from scs_dfe.gas.afe_temp_source import AFETempSource
+from scs_dfe.gas.pt1000 import Pt1000
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AFEReplay(object):
+    """
+    classdocs
+    """
+
+    DEFAULT_CHUNK_SIZE = 1000000                    # records
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, calibrator, pt1000_calib=None, temp_source=None):
+        """
+        Constructor
+        """
+        if temp_source is not None and temp_source not in AFETempSource.POLICIES:
+            raise ValueError("AFEReplay: unknown temp source: %s" % temp_source)
+
+        self.__calibrator = calibrator              # AFEBatchCalibrator
+        self.__pt1000 = None if pt1000_calib is None else Pt1000(pt1000_calib)
+        self.__temp_source = temp_source            # string or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def replay(self, filename, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        yields (rec, temp, OrderedDict of gas_name: (we_c, cnc)) as arrays, for each chunk of the journal
+        """
+        records = AFEJournal.records(filename)
+
+        for start in range(0, len(records), chunk_size):
+            chunk = records[start:start + chunk_size]
+
+            yield self.calibrate(chunk)
+
+
+    def calibrate(self, records):
+        """
+        records: structured array of AFEJournal.DTYPE
+        returns (rec, temp, OrderedDict of gas_name: (we_c, cnc))
+        """
+        temp = self.temps(records)
+
+        results = self.__calibrator.calibrate_all(temp, records['we_v'], records['ae_v'],
+                                                  no2_cnc=self.no2_cncs(records))
+
+        return np.asarray(records['rec']), temp, results
+
+
+    def temps(self, records):
+        pt1000_temp = self.__pt1000_temps(records['tmp_v'])
+
+        if self.__temp_source == AFETempSource.PT1000:
+            return pt1000_temp
+
+        sht_temp = np.asarray(records['sht_temp'])
+        temp = np.where(np.isnan(sht_temp), pt1000_temp, sht_temp)
+
+        if self.__temp_source in (AFETempSource.INT_SHT, AFETempSource.EXT_SHT):
+            return temp
+
+        sampled_temp = np.asarray(records['temp'])
+
+        return np.where(np.isnan(sampled_temp), temp, sampled_temp)
+
+
+    @staticmethod
+    def no2_cncs(records):
+        """
+        the journalled NO2 concentrations - 0.0 where the NO2 sample was null, NaN where there was no NO2 sample
+        """
+        no2_cnc = np.asarray(records['no2_cnc'])
+        sampled = np.asarray(records['no2']) != AFEJournal.NO2_NONE
+
+        return np.where(sampled, np.nan_to_num(no2_cnc, nan=0.0), np.nan)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __pt1000_temps(self, tmp_v):
+        if self.__pt1000 is None:
+            return np.full(len(tmp_v), np.nan)
+
+        return self.__pt1000.temps(tmp_v)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def temp_source(self):
+        return self.__temp_source
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AFEReplay:{temp_source:%s, pt1000:%s, calibrator:%s}" % \
+               (self.temp_source, self.__pt1000, self.__calibrator)
@@ -0,0 +1,159 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Samples the stations of one AFE on independent schedules. Each scheduled station has an interval, in seconds, and a
+priority - lower values are converted first, so that when a sample has a deadline, it is the lower-priority stations
+that are skipped. Stations with equal priority are ordered by interval, shortest first.
+
+On each call to sample(..), only the stations that are due are converted. Stations that are not due - or that were
+skipped - are carried forward from their most recent sample, and the age of each sample is reported in the
+ScheduledAFEDatum. A skipped station remains due.
+
+The NO2 station is converted ahead of any other, if a cross-sensitive station needs it and the NO2 cache is not
+fresh - see AFE.
+
+example schedules:
+{1: (10.0, 0), 2: (10.0, 0), 3: (60.0, 1), 4: (300.0, 2)}
+"""
+
+import time
+
+from collections import OrderedDict
+
+from scs_dfe.gas.scheduled_afe_datum import ScheduledAFEDatum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AFEScheduler(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, afe, schedules):
+        """
+        Constructor
+        """
+        sensors = afe.sensors
+
+        for sn in schedules:
+            if sn < 1 or sn > len(sensors) or sensors[sn - 1] is None:
+                raise ValueError("AFEScheduler: no sensor at station %s" % sn)
+
+        self.__afe = afe                                            # AFE
+        self.__schedules = OrderedDict(sorted(schedules.items()))   # sn: (interval, priority)
+
+        self.__due = OrderedDict((sn, None) for sn in self.__schedules)     # sn: float epoch seconds, None for now
+        self.__samples = OrderedDict()                              # sn: (sample, rec)
+
+        self.__pt1000 = None                                        # most recent Pt1000Datum, or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def sample(self, sht_datum=None, deadline=None, now=None):
+        """
+        convert the stations that are due, and return a ScheduledAFEDatum for all scheduled stations
+        """
+        now = time.time() if now is None else now
+
+        due = self.due(now)
+
+        if due:
+            datum = self.__afe.sample_stations(due, sht_datum=sht_datum, deadline=deadline)
+            self.__update(datum, due, now)
+
+        return self.__datum(now)
+
+
+    async def sample_async(self, sht_datum=None, deadline=None, now=None):
+        now = time.time() if now is None else now
+
+        due = self.due(now)
+
+        if due:
+            datum = await self.__afe.sample_stations_async(due, sht_datum=sht_datum, deadline=deadline)
+            self.__update(datum, due, now)
+
+        return self.__datum(now)
+
+
+    def due(self, now=None):
+        """
+        the stations that are due at now, in conversion order
+        """
+        now = time.time() if now is None else now
+
+        due = [sn for sn, due_time in self.__due.items() if due_time is None or due_time <= now]
+
+        return sorted(due, key=lambda sn: (self.__schedules[sn][1], self.__schedules[sn][0], sn))
+
+
+    def next_due(self):
+        """
+        the epoch time at which the next station falls due, or None if a station is due now
+        """
+        if None in self.__due.values():
+            return None
+
+        return min(self.__due.values())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __update(self, datum, due, now):
+        converted = self.__afe.last_raw
+
+        for sn in due:
+            gas_name = self.__afe.sensors[sn - 1].gas_name
+
+            if gas_name not in converted:
+                continue                                            # skipped: remains due
+
+            self.__samples[sn] = (datum.sns[gas_name], now)
+
+            interval = self.__schedules[sn][0]
+            due_time = now if self.__due[sn] is None else self.__due[sn] + interval
+
+            self.__due[sn] = due_time if due_time > now else now + interval
+
+        if datum.pt1000 is not None and converted:
+            self.__pt1000 = datum.pt1000
+
+
+    def __datum(self, now):
+        samples = []
+        ages = []
+
+        for sn in self.__schedules:
+            sensor = self.__afe.sensors[sn - 1]
+
+            if sn in self.__samples:
+                sample, rec = self.__samples[sn]
+                age = now - rec
+
+            else:
+                sample = sensor.null_datum()
+                age = None
+
+            samples.append((sensor.gas_name, sample))
+            ages.append((sensor.gas_name, age))
+
+        return ScheduledAFEDatum(self.__pt1000, ages, *samples)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def schedules(self):
+        return self.__schedules
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AFEScheduler:{schedules:%s, due:%s, afe:%s}" % (self.schedules, self.__due, self.__afe)
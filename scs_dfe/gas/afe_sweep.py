@@ -0,0 +1,380 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A pipelined acquisition plan for the AFE: the Pt1000 MCP342X conversion runs concurrently with the WRK / AUX ADS1115
+conversions, and each gas channel is started as soon as the previous channel has been read, so that the bus is never
+idle while a conversion could be running. Each ADC is polled for readiness at its learned conversion time.
+
+The plan is a generator of sleep intervals - the caller decides how to wait.
+
+If a GainRanger is given, the gain of each gas channel is selected from its previous reading, and a saturated reading
+is re-converted once, at the widest range. Raw (code) readings are not auto-ranged.
+
+If a deadline is given, a conversion is started only if its learned conversion time allows it to be read before the
+deadline - channels that are not started are reported as skipped. A saturated reading is then re-converted only if
+the re-conversion fits, otherwise the reading is used as it is. The during callable of run(..) is called only if its
+most recent duration allows it to return before the deadline.
+"""
+
+import asyncio
+import time
+
+from collections import OrderedDict
+from heapq import heappop, heappush
+from itertools import count
+
+from scs_dfe.data.phase_profile import PhaseProfile
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AFESweep(object):
+    """
+    classdocs
+    """
+
+    __TMP = None                    # plan key for the Pt1000 conversion
+
+    __READ_TIME = 0.005             # seconds - allowance for reading a conversion, when working to a deadline
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, wrk_adc, aux_adc, pt1000_adc, ranger=None):
+        """
+        Constructor
+        """
+        self.__wrk_adc = wrk_adc                    # ADS1115
+        self.__aux_adc = aux_adc                    # ADS1115
+        self.__pt1000_adc = pt1000_adc              # MCP342X or None
+        self.__ranger = ranger                      # GainRanger or None
+        self.__profile = None                       # PhaseProfile or None
+
+        self.__tmp_polls = None                     # int
+        self.__polls = OrderedDict()                # key: (wrk polls, aux polls)
+        self.__during_value = None
+        self.__during_time = 0.0                    # float     seconds, most recent call of during
+
+        self.__skipped = []                         # keys of channels skipped due to the deadline
+        self.__tmp_skipped = False                  # bool
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self, channels, temp=True, raw=False, during=None, deadline=None):
+        """
+        channels: iterable of (key, mux, gain), in the order in which they should be converted - key is usually the
+        sensor_index, but may be any distinct value
+        during: optional callable, called once while the first conversion is in progress - its return value is
+        available as during_value, which is None if it was skipped because of the deadline
+        deadline: optional epoch seconds - channels that cannot be read by the deadline are skipped
+        returns (pt1000 voltage, OrderedDict of key: (we_v, ae_v)) - or (we_code, ae_code) if raw is True
+        """
+        steps = self.steps(channels, temp, raw, deadline)
+
+        self.__during_value = None
+
+        try:
+            while True:
+                delay = next(steps)
+
+                if during is not None:
+                    start_time = time.time()
+                    self.__call_during(during, deadline)
+                    during = None
+
+                    delay -= time.time() - start_time
+
+                if delay > 0:
+                    self.__sleep(delay)
+
+        except StopIteration as ex:
+            result = ex.value
+
+        finally:
+            steps.close()
+
+        if during is not None:                      # there was no conversion to overlap
+            self.__call_during(during, deadline)
+
+        return result
+
+
+    async def run_async(self, channels, temp=True, raw=False, deadline=None):
+        """
+        as run(..), but awaits each interval - if cancelled, the ADC locks are released
+        the ADC locks should be held by a BusSession opened with open_async(..) - otherwise, each conversion waits for
+        its lock on the event loop
+        """
+        steps = self.steps(channels, temp, raw, deadline)
+
+        try:
+            while True:
+                delay = next(steps)
+
+                if self.__profile is None:
+                    await asyncio.sleep(delay)
+                    continue
+
+                start_time = time.perf_counter()
+                await asyncio.sleep(delay)
+                self.__profile.record(PhaseProfile.CONVERSION_WAIT, time.perf_counter() - start_time)
+
+        except StopIteration as ex:
+            return ex.value
+
+        finally:
+            steps.close()
+
+
+    def steps(self, channels, temp=True, raw=False, deadline=None):
+        """
+        generator: yields the interval to wait before the next plan action, returns as run(..)
+        """
+        pending = list(channels)
+        plan = []                                   # heap of (due, seq, key)
+        seq = count()
+
+        ranger = None if raw else self.__ranger
+
+        tmp_v = None
+        readings = OrderedDict()
+
+        tmp_started = False
+
+        current = None                              # (key, mux, gain) of the gas channel in progress
+        reconverted = False
+
+        self.__tmp_polls = None
+        self.__polls = OrderedDict()
+
+        self.__skipped = []
+        self.__tmp_skipped = False
+
+        try:
+            # Pt1000...
+            if temp and self.__pt1000_adc is not None and not self.__fits(deadline, self.__pt1000_adc):
+                self.__tmp_skipped = True
+
+            elif temp and self.__pt1000_adc is not None:
+                self.__pt1000_adc.start_conversion()
+                tmp_started = True
+
+                heappush(plan, (self.__pt1000_adc.next_poll, next(seq), AFESweep.__TMP))
+
+            # first gas channel...
+            self.__skip_late(pending, deadline)
+
+            if pending:
+                current = self.__select(pending.pop(0), ranger)
+                heappush(plan, self.__start(current, next(seq)))
+
+            # run...
+            while plan:
+                due, _, key = plan[0]
+
+                delay = due - time.time()
+
+                if delay > 0:
+                    yield delay
+
+                heappop(plan)
+
+                # Pt1000...
+                if key is AFESweep.__TMP:
+                    try:
+                        if not self.__pt1000_adc.conversion_ready():
+                            heappush(plan, (self.__pt1000_adc.next_poll, next(seq), key))
+                            continue
+
+                        tmp_v = self.__pt1000_adc.read_conversion()
+                        tmp_started = False
+
+                    except OSError:
+                        tmp_v = None
+
+                    self.__tmp_polls = self.__pt1000_adc.polls
+                    continue
+
+                # gas channel...
+                unready_adc = self.__unready_adc()
+
+                if unready_adc is not None:
+                    heappush(plan, (unready_adc.next_poll, next(seq), key))
+                    continue
+
+                reading = self.__read_wrk_aux_codes() if raw else self.__read_wrk_aux()
+
+                # auto-range...
+                if ranger is not None:
+                    _, mux, gain = current
+
+                    if not reconverted and ranger.saturated(gain, *reading) and \
+                            self.__fits(deadline, self.__wrk_adc, self.__aux_adc):
+                        ranger.reconverting()
+                        reconverted = True
+
+                        current = (key, mux, ranger.widest_gain())
+                        heappush(plan, self.__start(current, next(seq)))
+                        continue
+
+                    ranger.record(key, gain, *reading)
+
+                readings[key] = reading
+                self.__polls[key] = (self.__wrk_adc.polls, self.__aux_adc.polls)
+
+                # next gas channel...
+                reconverted = False
+
+                self.__skip_late(pending, deadline)
+
+                if pending:
+                    current = self.__select(pending.pop(0), ranger)
+                    heappush(plan, self.__start(current, next(seq)))
+
+        finally:
+            self.__wrk_adc.release_lock()
+            self.__aux_adc.release_lock()
+
+            if tmp_started:
+                self.__pt1000_adc.release_lock()
+
+        return tmp_v, readings
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @PhaseProfile.timed(PhaseProfile.CONVERSION_WAIT)
+    def __sleep(self, delay):
+        time.sleep(delay)
+
+
+    def __call_during(self, during, deadline):
+        if deadline is not None and time.time() + self.__during_time > deadline:
+            return
+
+        start_time = time.time()
+        self.__during_value = during()
+        self.__during_time = time.time() - start_time
+
+
+    def __fits(self, deadline, *adcs):
+        if deadline is None:
+            return True
+
+        expected = max(adc.timer.expected for adc in adcs)
+
+        return time.time() + expected + AFESweep.__READ_TIME <= deadline
+
+
+    def __skip_late(self, pending, deadline):
+        if pending and not self.__fits(deadline, self.__wrk_adc, self.__aux_adc):
+            self.__skipped.extend(key for key, _, _ in pending)
+            del pending[:]
+
+
+    @staticmethod
+    def __select(channel, ranger):
+        if ranger is None:
+            return channel
+
+        key, mux, gain = channel
+
+        return key, mux, ranger.gain(key, gain)
+
+
+    def __start(self, channel, seq):
+        key, mux, gain = channel
+
+        self.__wrk_adc.start_conversion(mux, gain)
+        self.__aux_adc.start_conversion(mux, gain)
+
+        return self.__wrk_adc.next_poll, seq, key
+
+
+    def __unready_adc(self):
+        for adc in (self.__wrk_adc, self.__aux_adc):
+            if not adc.conversion_ready():
+                return adc
+
+        return None
+
+
+    def __read_wrk_aux(self):
+        we_v = self.__wrk_adc.read_conversion()
+        ae_v = self.__aux_adc.read_conversion()
+
+        return we_v, ae_v
+
+
+    def __read_wrk_aux_codes(self):
+        we_code = self.__wrk_adc.read_conversion_code()
+        ae_code = self.__aux_adc.read_conversion_code()
+
+        return we_code, ae_code
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def ranger(self):
+        return self.__ranger
+
+
+    @property
+    def profile(self):
+        return self.__profile
+
+
+    @profile.setter
+    def profile(self, profile):
+        self.__profile = profile
+
+
+    @property
+    def during_value(self):
+        """
+        the value returned by the during callable of the most recent run(..)
+        """
+        return self.__during_value
+
+
+    @property
+    def skipped(self):
+        """
+        keys of the gas channels skipped due to the deadline, in the most recent sweep
+        """
+        return self.__skipped
+
+
+    @property
+    def tmp_skipped(self):
+        """
+        True if the Pt1000 conversion was skipped due to the deadline, in the most recent sweep
+        """
+        return self.__tmp_skipped
+
+
+    @property
+    def tmp_polls(self):
+        """
+        ready polls made for the Pt1000 conversion of the most recent sweep
+        """
+        return self.__tmp_polls
+
+
+    @property
+    def polls(self):
+        """
+        ready polls made for each gas channel of the most recent sweep
+        """
+        return self.__polls
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AFESweep:{wrk_adc:%s, aux_adc:%s, pt1000_adc:%s, ranger:%s}" % \
+               (self.__wrk_adc, self.__aux_adc, self.__pt1000_adc, self.__ranger)
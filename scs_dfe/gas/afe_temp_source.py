@@ -0,0 +1,165 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The temperature source policy for AFE temperature compensation:
+
+None        the Pt1000 is converted; an SHTDatum supplied by the caller takes precedence (the original behaviour)
+pt1000      the Pt1000 only
+int-sht     the SHT in the A4 package - the Pt1000 is not converted
+ext-sht     the SHT exposed to air - the Pt1000 is not converted
+fresh       a supplied SHTDatum, else the most recent temperature from any source, if no older than max_age, else
+            the Pt1000, else an SHT
+
+If an SHT is to be sampled, the AFE samples it while the first gas conversion is in progress. If the policy requires
+an SHT that is not available, the Pt1000 is used.
+"""
+
+import time
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AFETempSource(object):
+    """
+    classdocs
+    """
+
+    PT1000 =            'pt1000'
+    INT_SHT =           'int-sht'
+    EXT_SHT =           'ext-sht'
+    FRESH =             'fresh'
+
+    POLICIES =          (PT1000, INT_SHT, EXT_SHT, FRESH)
+
+    DEFAULT_MAX_AGE =   60.0                # seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, policy=None, int_sht=None, ext_sht=None, max_age=DEFAULT_MAX_AGE):
+        """
+        Constructor
+        """
+        if policy is not None and policy not in AFETempSource.POLICIES:
+            raise ValueError("AFETempSource: unknown policy: %s" % policy)
+
+        self.__policy = policy              # string or None
+        self.__int_sht = int_sht            # SHT31 or None
+        self.__ext_sht = ext_sht            # SHT31 or None
+        self.__max_age = max_age            # float     seconds
+
+        self.__temp = None                  # float     °C      most recent temperature
+        self.__rec = None                   # float     epoch seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def plan(self, sht_datum, pt1000_present):
+        """
+        returns (convert_pt1000, sht) - sht is the SHT31 to be sampled during the sweep, or None
+        """
+        if self.__policy is None:
+            return pt1000_present, None
+
+        if self.__policy == AFETempSource.PT1000:
+            return pt1000_present, None
+
+        if self.__policy == AFETempSource.INT_SHT:
+            return self.__sht_plan(sht_datum, pt1000_present, self.__int_sht)
+
+        if self.__policy == AFETempSource.EXT_SHT:
+            return self.__sht_plan(sht_datum, pt1000_present, self.__ext_sht)
+
+        # FRESH...
+        if sht_datum is not None or self.is_fresh():
+            return False, None
+
+        if pt1000_present:
+            return True, None
+
+        return False, self.__int_sht if self.__int_sht is not None else self.__ext_sht
+
+
+    def temp(self, pt1000_datum, sht_datum):
+        """
+        the temperature to be used for compensation, given the readings obtained according to plan(..)
+        """
+        if self.__policy == AFETempSource.PT1000:
+            temp = None if pt1000_datum is None else pt1000_datum.temp
+
+        elif sht_datum is not None:
+            temp = sht_datum.temp
+
+        elif pt1000_datum is not None:
+            temp = pt1000_datum.temp
+
+        elif self.__policy == AFETempSource.FRESH and self.is_fresh():
+            return self.__temp
+
+        else:
+            temp = None
+
+        if temp is not None:
+            self.__temp = temp
+            self.__rec = time.time()
+
+        return temp
+
+
+    def expected_temp(self, sht_datum):
+        """
+        the temperature that a sample is expected to use, before its readings are obtained - the supplied SHTDatum,
+        if the policy would use it, otherwise the most recent temperature, or None
+        """
+        if sht_datum is not None and self.__policy != AFETempSource.PT1000:
+            return sht_datum.temp
+
+        return self.__temp
+
+
+    def is_fresh(self, now=None):
+        if self.__rec is None:
+            return False
+
+        now = time.time() if now is None else now
+
+        return now - self.__rec <= self.__max_age
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __sht_plan(sht_datum, pt1000_present, sht):
+        if sht_datum is not None:
+            return False, None
+
+        if sht is not None:
+            return False, sht
+
+        return pt1000_present, None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def policy(self):
+        return self.__policy
+
+
+    @property
+    def max_age(self):
+        return self.__max_age
+
+
+    @property
+    def last_temp(self):
+        return self.__temp
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "AFETempSource:{policy:%s, int_sht:%s, ext_sht:%s, max_age:%s, last_temp:%s, rec:%s}" % \
+               (self.policy, self.__int_sht, self.__ext_sht, self.max_age, self.last_temp, self.__rec)
@@ -0,0 +1,150 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+summary statistics for an oversampled burst of WE / AE conversions on one AFE channel
+
+example JSON:
+{"n": 16, "weV": {"avg": 0.29411, "sd": 4.2e-05, "min": 0.29403, "max": 0.29419},
+"aeV": {"avg": 0.26845, "sd": 3.9e-05, "min": 0.26838, "max": 0.26852}}
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from scs_core.data.datum import Datum
+from scs_core.data.json import JSONable
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BurstDatum(JSONable):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct_all(cls, values):
+        """
+        values: array of shape (channels, n, 2) - WE and AE voltages for n conversions on each channel
+        returns a list of BurstDatum, one per channel
+        """
+        values = np.asarray(values, dtype=float)
+
+        n = values.shape[1]
+
+        avg = values.mean(axis=1)
+        sd = values.std(axis=1, ddof=1) if n > 1 else np.zeros_like(avg)
+        low = values.min(axis=1)
+        high = values.max(axis=1)
+
+        return [cls(n, avg[i, 0], sd[i, 0], low[i, 0], high[i, 0], avg[i, 1], sd[i, 1], low[i, 1], high[i, 1])
+                for i in range(values.shape[0])]
+
+
+    @classmethod
+    def null_datum(cls):
+        return cls(0, None, None, None, None, None, None, None, None)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, n, we_avg, we_sd, we_min, we_max, ae_avg, ae_sd, ae_min, ae_max):
+        """
+        Constructor
+        """
+        self.__n = int(n)                               # int       conversions in the burst
+
+        self.__we_avg = Datum.float(we_avg, 6)          # float     Volts
+        self.__we_sd = Datum.float(we_sd, 7)            # float     Volts
+        self.__we_min = Datum.float(we_min, 6)          # float     Volts
+        self.__we_max = Datum.float(we_max, 6)          # float     Volts
+
+        self.__ae_avg = Datum.float(ae_avg, 6)          # float     Volts
+        self.__ae_sd = Datum.float(ae_sd, 7)            # float     Volts
+        self.__ae_min = Datum.float(ae_min, 6)          # float     Volts
+        self.__ae_max = Datum.float(ae_max, 6)          # float     Volts
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['n'] = self.n
+        jdict['weV'] = BurstDatum.__stats(self.we_avg, self.we_sd, self.we_min, self.we_max)
+        jdict['aeV'] = BurstDatum.__stats(self.ae_avg, self.ae_sd, self.ae_min, self.ae_max)
+
+        return jdict
+
+
+    @staticmethod
+    def __stats(avg, sd, low, high):
+        jdict = OrderedDict()
+
+        jdict['avg'] = avg
+        jdict['sd'] = sd
+        jdict['min'] = low
+        jdict['max'] = high
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def n(self):
+        return self.__n
+
+
+    @property
+    def we_avg(self):
+        return self.__we_avg
+
+
+    @property
+    def we_sd(self):
+        return self.__we_sd
+
+
+    @property
+    def we_min(self):
+        return self.__we_min
+
+
+    @property
+    def we_max(self):
+        return self.__we_max
+
+
+    @property
+    def ae_avg(self):
+        return self.__ae_avg
+
+
+    @property
+    def ae_sd(self):
+        return self.__ae_sd
+
+
+    @property
+    def ae_min(self):
+        return self.__ae_min
+
+
+    @property
+    def ae_max(self):
+        return self.__ae_max
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BurstDatum:{n:%d, we_avg:%s, we_sd:%s, we_min:%s, we_max:%s, " \
+               "ae_avg:%s, ae_sd:%s, ae_min:%s, ae_max:%s}" % \
+               (self.n, self.we_avg, self.we_sd, self.we_min, self.we_max,
+                self.ae_avg, self.ae_sd, self.ae_min, self.ae_max)
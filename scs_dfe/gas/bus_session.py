@@ -0,0 +1,322 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A bus session holds the named locks of a set of I2C devices - typically the ADCs of an AFE sweep - for its duration,
+so that individual conversions need not acquire and release them. Locks are acquired in lock name order, so that two
+sessions over overlapping sets of devices cannot deadlock.
+
+A session is owned by the context - the thread, or asyncio task - that opened it. Within that context, and tasks
+created from it while it is open, the obtain_lock() / release_lock() calls that the devices make for themselves are
+skipped, for any device instance with the same lock name, and the session may be re-entered. Any other context that
+opens the session waits until it has been closed.
+
+Each context keeps its own depth. The locks are released when every open(..) has been matched by a close(), in
+whichever context - a task that re-entered its parent's session may close it after the parent. Ownership is tied to
+the acquisition of the locks: once they are released, a context that inherited ownership no longer owns the session,
+and must open it again.
+
+Time spent waiting for the locks is reported separately from the time for which they are held.
+
+If a deadline is given to open(..), lock waits are limited to the time remaining, and failure to acquire the locks
+in time raises TimeoutError.
+
+Coroutines should use open_async(..), or async with - the locks are then waited for in the event loop's default
+executor, rather than on the event loop.
+"""
+
+import asyncio
+import threading
+import time
+
+from contextvars import ContextVar
+
+from scs_host.lock.lock_timeout import LockTimeout
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BusSession(object):
+    """
+    classdocs
+    """
+
+    __owned = ContextVar('BusSession.owned', default={})     # session: (generation, depth) in this context
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def holds(cls, lock_name):
+        return any(lock_name in session.__held for session in cls.__owned.get() if session.owned)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, devices):
+        """
+        Constructor
+        """
+        unique = {device.lock_name: device for device in devices if device is not None}
+
+        self.__devices = [unique[lock_name] for lock_name in sorted(unique)]
+
+        self.__mutex = threading.Lock()                 # held while the session is open
+        self.__state = threading.Lock()                 # guards generation and depth
+
+        self.__acquired = []                            # devices whose locks were acquired by this session
+        self.__held = frozenset()                       # their lock names, once attributed to the owning context
+        self.__generation = 0                           # int       incremented whenever the locks are released
+        self.__depth = 0                                # int       open(..) calls not yet matched by close()
+        self.__opened = None                            # float     time at which locks were held
+
+        self.__sessions = 0                             # int
+        self.__lock_wait = 0.0                          # float     seconds, most recent session
+        self.__held_time = 0.0                          # float     seconds, most recent session
+        self.__total_lock_wait = 0.0                    # float     seconds
+        self.__total_held_time = 0.0                    # float     seconds
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __enter__(self):
+        self.open()
+
+        return self
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+        return False
+
+
+    async def __aenter__(self):
+        await self.open_async()
+
+        return self
+
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+        return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def open(self, deadline=None):
+        """
+        acquire the locks - deadline, if given, is in epoch seconds
+        """
+        if self.__reenter():
+            return
+
+        start_time = time.time()
+
+        self.__acquire(self.__pending(), deadline)
+        self.__enter_context(start_time)
+
+
+    async def open_async(self, deadline=None):
+        """
+        as open(..), but the locks are waited for in the event loop's default executor - if cancelled while waiting,
+        any locks that are acquired are released
+        """
+        if self.__reenter():
+            return
+
+        start_time = time.time()
+
+        acquisition = asyncio.get_running_loop().run_in_executor(None, self.__acquire, self.__pending(), deadline)
+
+        try:
+            await asyncio.shield(acquisition)
+
+        except asyncio.CancelledError:
+            acquisition.add_done_callback(self.__abandon)
+            raise
+
+        self.__enter_context(start_time)
+
+
+    def close(self):
+        owned = dict(BusSession.__owned.get())
+
+        with self.__state:
+            generation, depth = owned.get(self, (None, 0))
+
+            if generation != self.__generation:
+                raise RuntimeError("BusSession: close() by a context that does not own the session")
+
+            if depth > 1:
+                owned[self] = (generation, depth - 1)
+            else:
+                del owned[self]
+
+            BusSession.__owned.set(owned)
+
+            self.__depth -= 1
+
+            if self.__depth > 0:
+                return
+
+            self.__generation += 1                      # ownership inherited by other contexts lapses
+            self.__held = frozenset()
+
+        self.__release()
+
+        self.__held_time = time.time() - self.__opened
+
+        self.__sessions += 1
+        self.__total_lock_wait += self.__lock_wait
+        self.__total_held_time += self.__held_time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __reenter(self):
+        owned = dict(BusSession.__owned.get())
+
+        with self.__state:
+            generation, depth = owned.get(self, (None, 0))
+
+            if generation != self.__generation:
+                return False
+
+            owned[self] = (generation, depth + 1)
+            self.__depth += 1
+
+        BusSession.__owned.set(owned)
+
+        return True
+
+
+    def __pending(self):
+        return [device for device in self.__devices if not BusSession.holds(device.lock_name)]
+
+
+    def __acquire(self, pending, deadline):
+        """
+        may be run on any thread - the locks are attributed to the owning context by __enter_context(..)
+        """
+        if not self.__mutex.acquire(timeout=-1 if deadline is None else max(deadline - time.time(), 0.0)):
+            raise TimeoutError("BusSession: the session was not released by its owner by the deadline")
+
+        try:
+            for device in pending:
+                if deadline is None:
+                    device.obtain_lock()
+
+                else:
+                    remaining = deadline - time.time()
+
+                    if remaining <= 0:
+                        raise TimeoutError("BusSession: deadline passed before %s was acquired" % device.lock_name)
+
+                    try:
+                        device.obtain_lock(remaining)
+
+                    except LockTimeout as ex:
+                        raise TimeoutError("BusSession: %s was not acquired by the deadline" % device.lock_name) \
+                            from ex
+
+                self.__acquired.append(device)
+
+        except BaseException:
+            self.__release()
+            raise
+
+
+    def __enter_context(self, start_time):
+        owned = dict(BusSession.__owned.get())
+
+        with self.__state:
+            self.__held = frozenset(device.lock_name for device in self.__acquired)
+            self.__depth = 1
+
+            owned[self] = (self.__generation, 1)
+
+        BusSession.__owned.set(owned)
+
+        self.__opened = time.time()
+        self.__lock_wait = self.__opened - start_time
+
+
+    def __abandon(self, acquisition):
+        if not acquisition.cancelled() and acquisition.exception() is None:
+            self.__release()
+
+
+    def __release(self):
+        try:
+            for device in reversed(self.__acquired):
+                device.release_lock()
+
+        finally:
+            self.__acquired = []
+            self.__mutex.release()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def lock_names(self):
+        return [device.lock_name for device in self.__devices]
+
+
+    @property
+    def active(self):
+        return self.__depth > 0
+
+
+    @property
+    def owned(self):
+        """
+        True if the current context opened the session, or inherited it from a context that did, and its locks have not
+        since been released
+        """
+        generation, _ = BusSession.__owned.get().get(self, (None, 0))
+
+        return generation == self.__generation
+
+
+    @property
+    def sessions(self):
+        return self.__sessions
+
+
+    @property
+    def lock_wait(self):
+        """
+        seconds spent acquiring locks, most recent session
+        """
+        return self.__lock_wait
+
+
+    @property
+    def held_time(self):
+        """
+        seconds for which locks were held, most recent session
+        """
+        return self.__held_time
+
+
+    @property
+    def total_lock_wait(self):
+        return self.__total_lock_wait
+
+
+    @property
+    def total_held_time(self):
+        return self.__total_held_time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "BusSession:{lock_names:%s, sessions:%d, lock_wait:%0.6f, held_time:%0.3f, total_lock_wait:%0.6f, " \
+               "total_held_time:%0.3f}" % \
+               (self.lock_names, self.sessions, self.lock_wait, self.held_time, self.total_lock_wait,
+                self.total_held_time)
@@ -0,0 +1,105 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Learns the actual conversion time of an individual ADC chip, so that its ready flag can be polled as soon as the data
+may be valid, rather than after the datasheet worst case.
+
+A conversion that is found ready on the first poll, made on schedule, may have finished earlier, so the estimate is
+shortened slightly; a conversion that needs further polls moves the estimate towards the observed time.
+"""
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ConversionTimer(object):
+    """
+    classdocs
+    """
+
+    __LEARNING_RATE =       0.1             # weight given to each new observation
+    __PROBE_FACTOR =        0.98            # applied when a conversion is ready at the first poll
+
+    __MIN_BACKOFF =         0.0005          # seconds
+    __MAX_BACKOFF =         0.004           # seconds
+
+    __TIMEOUT_FACTOR =      2.0             # multiple of the datasheet conversion time
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, tconv):
+        """
+        Constructor
+        """
+        self.__tconv = tconv                # float     datasheet conversion time       seconds
+        self.__expected = tconv             # float     learned conversion time         seconds
+
+        self.__conversions = 0              # int
+        self.__total_polls = 0              # int
+        self.__polls = 0                    # int       polls needed by the most recent conversion
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def backoff(self, polls):
+        """
+        interval before the next poll, given the number of polls already made
+        """
+        return min(ConversionTimer.__MIN_BACKOFF * (2 ** max(polls - 1, 0)), ConversionTimer.__MAX_BACKOFF)
+
+
+    def timed_out(self, elapsed):
+        return elapsed > self.__tconv * ConversionTimer.__TIMEOUT_FACTOR
+
+
+    def record(self, elapsed, polls):
+        self.__conversions += 1
+        self.__total_polls += polls
+        self.__polls = polls
+
+        if polls == 1:
+            if elapsed < self.__expected + ConversionTimer.__MIN_BACKOFF:      # polled on schedule
+                self.__expected *= ConversionTimer.__PROBE_FACTOR
+        else:
+            self.__expected += ConversionTimer.__LEARNING_RATE * (elapsed - self.__expected)
+
+        self.__expected = min(self.__expected, self.__tconv)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def tconv(self):
+        return self.__tconv
+
+
+    @property
+    def expected(self):
+        return self.__expected
+
+
+    @property
+    def conversions(self):
+        return self.__conversions
+
+
+    @property
+    def polls(self):
+        return self.__polls
+
+
+    @property
+    def mean_polls(self):
+        if self.__conversions == 0:
+            return None
+
+        return self.__total_polls / self.__conversions
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ConversionTimer:{tconv:%0.3f, expected:%0.4f, conversions:%d, polls:%d, mean_polls:%s}" % \
+               (self.tconv, self.expected, self.conversions, self.polls, self.mean_polls)
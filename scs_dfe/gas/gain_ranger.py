@@ -0,0 +1,112 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Auto-ranging gain selection for ADS1115 channels.
+
+The peak WE / AE magnitude of the last reading on each channel is remembered, and the next conversion on that channel
+uses the narrowest full-scale range that holds it with some headroom - so that small signals are not resolved with
+only a few LSBs. A reading that saturates is re-converted once, at the widest range.
+"""
+
+from scs_dfe.gas.ads1115 import ADS1115
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class GainRanger(object):
+    """
+    classdocs
+    """
+
+    __HEADROOM =        1.25            # the selected full scale must exceed the last peak by this factor
+    __SATURATION =      0.995           # fraction of full scale regarded as saturated
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__gains = ADS1115.gains()              # narrowest full scale first
+
+        self.__peaks = {}                           # key: float volts
+        self.__selected = {}                        # key: gain
+
+        self.__conversions = 0                      # int
+        self.__reconversions = 0                    # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def gain(self, key, default_gain):
+        """
+        the gain for the next conversion on the given channel - default_gain if there is no previous reading
+        """
+        peak = self.__peaks.get(key)
+
+        if peak is None:
+            return default_gain
+
+        for gain in self.__gains:
+            if peak * GainRanger.__HEADROOM < ADS1115.full_scale(gain):
+                return gain
+
+        return self.widest_gain()
+
+
+    def widest_gain(self):
+        return self.__gains[-1]
+
+
+    def saturated(self, gain, *volts):
+        limit = ADS1115.full_scale(gain) * GainRanger.__SATURATION
+
+        return any(abs(v) >= limit for v in volts)
+
+
+    def reconverting(self):
+        self.__reconversions += 1
+
+
+    def record(self, key, gain, *volts):
+        self.__conversions += 1
+
+        self.__peaks[key] = max(abs(v) for v in volts)
+        self.__selected[key] = gain
+
+
+    def clear(self):
+        self.__peaks = {}
+        self.__selected = {}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def selected(self):
+        """
+        the gain used for the most recent reading on each channel
+        """
+        return self.__selected
+
+
+    @property
+    def conversions(self):
+        return self.__conversions
+
+
+    @property
+    def reconversions(self):
+        return self.__reconversions
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        selected = '{' + ', '.join('%s: 0x%04x' % (key, gain) for key, gain in self.__selected.items()) + '}'
+
+        return "GainRanger:{selected:%s, conversions:%d, reconversions:%d}" % \
+               (selected, self.conversions, self.reconversions)
@@ -4,9 +4,16 @@ Created on 18 May 2017
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
 """
 
-import struct
+import asyncio
 import time
 
+from scs_dfe.board.i2c_mutex import I2CMutex
+
+from scs_dfe.data.phase_profile import PhaseProfile
+
+from scs_dfe.gas.bus_session import BusSession
+from scs_dfe.gas.conversion_timer import ConversionTimer
+
 from scs_host.bus.i2c import I2C
 from scs_host.lock.lock import Lock
 
@@ -36,6 +43,7 @@ class MCP342X(object):
     __MODE_SINGLE =     0x00        # ---0 ----     (default)
 
     __GAIN =            None
+    __LSB =             None
     __TCONV =           None
 
 
@@ -55,6 +63,9 @@ class MCP342X(object):
                         MCP342X.GAIN_8:     8.0,
                     }
 
+        # volts per bit, indexed by gain code...
+        cls.__LSB = tuple(2.048 / 32767.5 / cls.__GAIN[gain] for gain in range(4))
+
         cls.__TCONV = {
                         MCP342X.RATE_15:    0.080,
                         MCP342X.RATE_60:    0.020,
@@ -62,6 +73,22 @@ class MCP342X(object):
                     }
 
 
+    @classmethod
+    def gain_code(cls, gain):
+        """
+        the compact (0 - 3) form of a gain setting, as used by RawCapture
+        """
+        return gain
+
+
+    @classmethod
+    def lsb_table(cls):
+        """
+        volts per bit, indexed by gain code
+        """
+        return cls.__LSB
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __init__(self, addr, gain, rate):
@@ -72,9 +99,19 @@ class MCP342X(object):
         self.__addr = addr
         self.__gain = gain
         self.__rate = rate
+        self.__lsb = MCP342X.__LSB[gain]
 
         self.__config = MCP342X.__MODE_SINGLE | self.__rate | self.__gain
 
+        # ready detection...
+        self.__timer = ConversionTimer(MCP342X.__TCONV[self.__rate])
+
+        self.__started = None
+        self.__polls = 0
+        self.__ready = False
+
+        self.__profile = None                       # PhaseProfile or None
+
         # write config...
         try:
             self.obtain_lock()
@@ -90,10 +127,68 @@ class MCP342X(object):
         """
         start single-shot conversion
         """
-        start = MCP342X.__START | self.__config
-
         self.obtain_lock()
-        self.__write(start)
+        self.__start()
+
+
+    def conversion_ready(self):
+        """
+        poll the RDY bit of the config byte
+        raises ValueError if the conversion has not completed within the timeout
+        """
+        if self.__ready:
+            return True
+
+        self.__polls += 1
+
+        try:
+            I2CMutex.start_tx(self.addr)
+            _, config = self.__read()
+
+        finally:
+            I2CMutex.end_tx()
+
+        elapsed = time.time() - self.__started
+
+        if not (config & MCP342X.__START):
+            self.__ready = True
+            self.__timer.record(elapsed, self.__polls)
+
+            return True
+
+        if self.__timer.timed_out(elapsed):
+            raise ValueError(self.__class__.__name__ + ":conversion_ready: conversion not ready.")
+
+        return False
+
+
+    def wait_conversion(self):
+        """
+        sleep for the learned conversion time, then poll until ready
+        returned value is the number of polls
+        """
+        while True:
+            delay = self.next_poll - time.time()
+
+            if delay > 0:
+                self.__sleep(delay)
+
+            if self.conversion_ready():
+                return self.__polls
+
+
+    async def wait_conversion_async(self):
+        """
+        as wait_conversion(), but awaits the learned conversion time and each back-off
+        """
+        while True:
+            delay = self.next_poll - time.time()
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if self.conversion_ready():
+                return self.__polls
 
 
     def read_conversion(self):
@@ -101,18 +196,26 @@ class MCP342X(object):
         read most recent conversion
         returned value is voltage
         """
+        return self.read_conversion_code() * self.__lsb
+
+
+    def read_conversion_code(self):
+        """
+        read most recent conversion
+        returned value is the signed conversion code
+        """
         try:
-            I2C.start_tx(self.addr)
-            v, config = self.__read()
+            I2CMutex.start_tx(self.addr)
+            code, config = self.__read()
 
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
             self.release_lock()
 
         if config & MCP342X.__START:
             raise ValueError(self.__class__.__name__ + ":read_conversion: conversion not ready.")
 
-        return v
+        return code
 
 
     def convert(self):
@@ -124,56 +227,144 @@ class MCP342X(object):
         self.start_conversion()
 
         try:
-            I2C.start_tx(self.addr)
+            self.wait_conversion()
+
+            try:
+                I2CMutex.start_tx(self.addr)
+                code, _ = self.__read()
+
+            finally:
+                I2CMutex.end_tx()
+
+        finally:
+            self.release_lock()
+
+        return code * self.__lsb
+
+
+    async def convert_async(self):
+        """
+        as convert(), but awaits the conversion
+        warning: the lock is held while awaiting - the ADC must not be shared between concurrent coroutines
+        returned value is voltage
+        """
+        await self.obtain_lock_async()
+
+        try:
+            self.__start()
 
-            while True:
-                v, config = self.__read()
+            await self.wait_conversion_async()
 
-                if not (config & MCP342X.__START):
-                    break
+            try:
+                I2CMutex.start_tx(self.addr)
+                code, _ = self.__read()
 
-                time.sleep(MCP342X.RATE_240)
+            finally:
+                I2CMutex.end_tx()
 
         finally:
-            I2C.end_tx()
             self.release_lock()
 
-        return v
+        return code * self.__lsb
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    def __start(self):
+        start = MCP342X.__START | self.__config
+
+        self.__write(start)
+
+        self.__started = time.time()
+        self.__polls = 0
+        self.__ready = False
+
+
+    @PhaseProfile.timed(PhaseProfile.CONVERSION_WAIT)
+    def __sleep(self, delay):
+        time.sleep(delay)
+
+
+    @PhaseProfile.timed(PhaseProfile.I2C)
     def __read(self):
         # get data...
         msb, lsb, config = I2C.read(3)
 
         unsigned = (msb << 8) | lsb
 
-        # render voltage...
-        signed = struct.unpack('h', struct.pack('H', unsigned))
-
-        v = (signed[0] / 32767.5) * 2.048 / MCP342X.__GAIN[self.__gain]
+        # signed code...
+        code = unsigned - 0x10000 if unsigned & 0x8000 else unsigned
 
-        return v, config
+        return code, config
 
 
+    @PhaseProfile.timed(PhaseProfile.I2C)
     def __write(self, config):
         try:
-            I2C.start_tx(self.addr)
+            I2CMutex.start_tx(self.addr)
             I2C.write(config)
 
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def obtain_lock(self):
-        Lock.acquire(self.__class__.__name__, MCP342X.__LOCK_TIMEOUT)
+    def session(self):
+        """
+        a BusSession holding the lock of this ADC
+        """
+        return BusSession((self, ))
+
+
+    def obtain_lock(self, timeout=None):
+        """
+        timeout, if given, is limited to the lock timeout of the ADC
+        """
+        if BusSession.holds(self.lock_name):
+            return
+
+        self.__acquire_lock(MCP342X.__LOCK_TIMEOUT if timeout is None else min(timeout, MCP342X.__LOCK_TIMEOUT))
+
+
+    async def obtain_lock_async(self, timeout=None):
+        """
+        as obtain_lock(..), but the lock is waited for in the event loop's default executor - if cancelled while
+        waiting, the lock is released once it has been acquired
+        """
+        if BusSession.holds(self.lock_name):
+            return
+
+        acquisition = asyncio.get_running_loop().run_in_executor(None, self.obtain_lock, timeout)
+
+        try:
+            await asyncio.shield(acquisition)
+
+        except asyncio.CancelledError:
+            acquisition.add_done_callback(self.__abandon_lock)
+            raise
 
 
     def release_lock(self):
-        Lock.release(self.__class__.__name__)
+        if BusSession.holds(self.lock_name):
+            return
+
+        Lock.release(self.lock_name)
+
+
+    def __abandon_lock(self, acquisition):
+        if not acquisition.cancelled() and acquisition.exception() is None:
+            self.release_lock()
+
+
+    @PhaseProfile.timed(PhaseProfile.LOCK_WAIT)
+    def __acquire_lock(self, timeout):
+        Lock.acquire(self.lock_name, timeout)
+
+
+    @property
+    def lock_name(self):
+        return self.__class__.__name__
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -198,8 +389,42 @@ class MCP342X(object):
         return MCP342X.__TCONV[self.__rate]
 
 
+    @property
+    def next_poll(self):
+        """
+        the time at which the conversion in progress should next be polled
+        """
+        if self.__polls == 0:
+            return self.__started + self.__timer.expected
+
+        return time.time() + self.__timer.backoff(self.__polls)
+
+
+    @property
+    def polls(self):
+        """
+        the number of ready polls made for the most recent conversion
+        """
+        return self.__polls
+
+
+    @property
+    def timer(self):
+        return self.__timer
+
+
+    @property
+    def profile(self):
+        return self.__profile
+
+
+    @profile.setter
+    def profile(self, profile):
+        self.__profile = profile
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return self.__class__.__name__ + ":{addr:0x%02x, gain:0x%0.4x, rate:0x%0.4x, config:0x%0.4x}" % \
-                                         (self.addr, self.gain, self.rate, self.__config)
+        return self.__class__.__name__ + ":{addr:0x%02x, gain:0x%0.4x, rate:0x%0.4x, config:0x%0.4x, timer:%s}" % \
+                                         (self.addr, self.gain, self.rate, self.__config, self.__timer)
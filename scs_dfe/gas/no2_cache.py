@@ -0,0 +1,118 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The most recent NO2 sample, kept so that the NO2 cross-sensitivity correction of an Ox sensor may reuse it, rather
+than performing a fresh NO2 conversion. A sample is reused only within the freshness window, and only if the
+temperature has not moved significantly since it was taken.
+
+A max_age of None disables reuse.
+"""
+
+import time
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class NO2Cache(object):
+    """
+    classdocs
+    """
+
+    __MAX_TEMP_DELTA =      1.0             # °C
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, max_age):
+        """
+        Constructor
+        """
+        self.__max_age = max_age            # float     seconds
+
+        self.__sample = None                # sensor datum
+        self.__rec = None                   # float     epoch seconds
+        self.__temp = None                  # float     °C
+
+        self.__hits = 0                     # int
+        self.__misses = 0                   # int
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def update(self, sample, temp, rec=None):
+        self.__sample = sample
+        self.__temp = temp
+        self.__rec = time.time() if rec is None else rec
+
+
+    def is_fresh(self, now=None):
+        if self.__max_age is None or self.__sample is None:
+            return False
+
+        now = time.time() if now is None else now
+
+        return now - self.__rec <= self.__max_age
+
+
+    def serves(self, temp, now=None):
+        """
+        True if the cached sample may be used at the given temperature - hits and misses are not counted
+        """
+        return self.is_fresh(now) and self.__temp_matches(temp)
+
+
+    def sample(self, temp, now=None):
+        """
+        returns the cached sample if it may be used at the given temperature, otherwise None
+        """
+        if self.serves(temp, now):
+            self.__hits += 1
+            return self.__sample
+
+        self.__misses += 1
+        return None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __temp_matches(self, temp):
+        if temp is None or self.__temp is None:
+            return temp is None and self.__temp is None
+
+        return abs(temp - self.__temp) <= NO2Cache.__MAX_TEMP_DELTA
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def max_age(self):
+        return self.__max_age
+
+
+    @property
+    def rec(self):
+        return self.__rec
+
+
+    @property
+    def temp(self):
+        return self.__temp
+
+
+    @property
+    def hits(self):
+        return self.__hits
+
+
+    @property
+    def misses(self):
+        return self.__misses
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "NO2Cache:{max_age:%s, rec:%s, temp:%s, hits:%d, misses:%d}" % \
+               (self.max_age, self.rec, self.temp, self.hits, self.misses)
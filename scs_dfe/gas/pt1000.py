@@ -2,8 +2,14 @@
 Created on 30 Sep 2016
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+For arrays of voltages - high-rate logging or bulk replay - temps(..) applies the Pt1000Datum relation, V = V20 +
+0.001 * (T - 20), to the whole array in one vectorised operation, using the v20 of the current calibration. Results
+are rounded as Pt1000Datum temperatures.
 """
 
+import numpy as np
+
 from scs_core.gas.pt1000_datum import Pt1000Datum
 
 
@@ -14,6 +20,12 @@ class Pt1000(object):
     classdocs
     """
 
+    __SCALE =           1000.0              # °C / Volt     as Pt1000Datum
+    __V20_TEMP =        20.0                # °C    at v20
+
+    __PRECISION =       1                   # decimal places of a Pt1000Datum temp
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
@@ -35,9 +47,25 @@ class Pt1000(object):
     def sample(self, afe):
         v = afe.sample_raw_tmp()
 
+        return self.datum(v)
+
+
+    def datum(self, v):
         return Pt1000Datum.construct(self.__calib, v)
 
 
+    def temps(self, vs):
+        """
+        vs: array-like of Volts - NaN for no reading
+        returns an array of °C, rounded as Pt1000Datum - NaN where vs is NaN
+        """
+        vs = np.asarray(vs, dtype=float)
+
+        temps = (vs - self.__calib.v20) * Pt1000.__SCALE + Pt1000.__V20_TEMP
+
+        return np.round(temps, Pt1000.__PRECISION)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -45,6 +73,11 @@ class Pt1000(object):
         return self.__calib
 
 
+    @calib.setter
+    def calib(self, calib):
+        self.__calib = calib
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
@@ -13,6 +13,8 @@ example documents:
 from collections import OrderedDict
 
 from scs_core.data.json import PersistentJSONable
+
+from scs_dfe.data.conf_cache import ConfCache
 from scs_dfe.gas.mcp342x import MCP342X
 
 
@@ -35,6 +37,16 @@ class Pt1000Conf(PersistentJSONable):
         return host.conf_dir() + cls.__FILENAME
 
 
+    @classmethod
+    def load(cls, host):
+        return ConfCache.load(cls, host)
+
+
+    def save(self, host):
+        super().save(host)
+        ConfCache.invalidate(self.filename(host))           # the inotify event may not have arrived yet
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
@@ -0,0 +1,94 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+A compact capture of ADC conversion codes: int16 codes with their uint8 gain codes, decoded to volts in a single
+vectorised step using the ADC's LSB table. Works with ADS1115 or MCP342X - see lsb_table() and gain_code().
+
+The codes and gains properties are zero-copy memoryviews of the underlying buffers. The capture cannot be appended to
+while any such view is held.
+
+example:
+capture = RawCapture(ADS1115.lsb_table())
+capture.append(adc.read_conversion_code(), ADS1115.gain_code(gain))
+"""
+
+from array import array
+
+import numpy as np
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RawCapture(object):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, lsb_table):
+        """
+        Constructor
+        """
+        self.__lsb = np.array(lsb_table, dtype=float)          # ndarray of float    volts per bit, by gain code
+
+        self.__codes = array('h')                               # array of int16      conversion codes
+        self.__gains = array('B')                               # array of uint8      gain codes
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, code, gain_code):
+        self.__codes.append(code)
+        self.__gains.append(gain_code)
+
+
+    def extend(self, codes, gain_code):
+        start = len(self.__codes)
+
+        self.__codes.extend(codes)
+        self.__gains.extend([gain_code] * (len(self.__codes) - start))
+
+
+    def clear(self):
+        del self.__codes[:]
+        del self.__gains[:]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def volts(self):
+        """
+        returns an ndarray of float
+        """
+        if not self.__codes:
+            return np.empty(0, dtype=float)
+
+        codes = np.frombuffer(self.__codes, dtype=np.int16)
+        gains = np.frombuffer(self.__gains, dtype=np.uint8)
+
+        return codes * self.__lsb[gains]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def codes(self):
+        return memoryview(self.__codes)
+
+
+    @property
+    def gains(self):
+        return memoryview(self.__gains)
+
+
+    def __len__(self):
+        return len(self.__codes)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "RawCapture:{lsb:%s, length:%d}" % (self.__lsb.tolist(), len(self))
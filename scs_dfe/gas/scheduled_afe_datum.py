@@ -0,0 +1,58 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+An AFEDatum produced by an AFEScheduler - sensors that were not due are carried forward from their most recent
+sample, and the age of every sample is reported, in seconds.
+
+example JSON:
+{"src": "AFE", "pt1": {"v": 0.3253, "tmp": 22.7}, "sns": {"NO2": {...}, "CO": {...}},
+"age": {"NO2": 0.0, "CO": 24.1}}
+"""
+
+from collections import OrderedDict
+
+from scs_core.gas.afe_datum import AFEDatum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ScheduledAFEDatum(AFEDatum):
+    """
+    classdocs
+    """
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, pt1000, ages, *sns):
+        """
+        Constructor
+        """
+        super().__init__(pt1000, *sns)
+
+        self.__ages = OrderedDict(ages)             # OrderedDict of gas_name: float seconds, or None if never sampled
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = super().as_json()
+
+        jdict['age'] = OrderedDict((gas_name, None if age is None else round(age, 1))
+                                   for gas_name, age in self.ages.items())
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def ages(self):
+        return self.__ages
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "ScheduledAFEDatum:{pt1000:%s, sns:%s, ages:%s}" % (self.pt1000, self.sns, self.ages)
@@ -26,6 +26,8 @@ $GPGSV,3,3,12,27,04,013,13,28,39,126,37,30,60,068,26,33,30,200,44*74
 $GPGLL,5049.36953,N,00007.38514,W,152926.00,A,D*7B
 """
 
+import asyncio
+
 from scs_core.position.gpgga import GPGGA
 from scs_core.position.gpgll import GPGLL
 from scs_core.position.gpgsa import GPGSA
@@ -151,6 +153,19 @@ class PAM7Q(object):
         return messages
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    async def report_async(self, message_class):
+        """
+        as report(..), with the serial reads run in the event loop's default executor
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.report, message_class)
+
+
+    async def report_all_async(self):
+        return await asyncio.get_running_loop().run_in_executor(None, self.report_all)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
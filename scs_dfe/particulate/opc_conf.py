@@ -5,14 +5,19 @@ Created on 11 Jul 2017
 
 settings for OPCMonitor
 
+bulk-transfer enables OPCN2 bulk SPI transfers - it should be set only where the host's SPI timing has been verified
+against the OPC, and is false if not specified.
+
 example JSON:
-{"model": "N2", "sample-period": 10, "power-saving": false}
+{"model": "N2", "sample-period": 10, "power-saving": false, "bulk-transfer": false}
 """
 
 from collections import OrderedDict
 
 from scs_core.data.json import PersistentJSONable
 
+from scs_dfe.data.conf_cache import ConfCache
+
 from scs_dfe.particulate.opc_monitor import OPCMonitor
 from scs_dfe.particulate.opc_n2 import OPCN2
 
@@ -31,6 +36,16 @@ class OPCConf(PersistentJSONable):
         return host.conf_dir() + cls.__FILENAME
 
 
+    @classmethod
+    def load(cls, host):
+        return ConfCache.load(cls, host)
+
+
+    def save(self, host):
+        super().save(host)
+        ConfCache.invalidate(self.filename(host))           # the inotify event may not have arrived yet
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
@@ -41,13 +56,14 @@ class OPCConf(PersistentJSONable):
         model = jdict.get('model')
         sample_period = jdict.get('sample-period')
         power_saving = jdict.get('power-saving')
+        bulk_transfer = jdict.get('bulk-transfer', False)
 
-        return OPCConf(model, sample_period, power_saving)
+        return OPCConf(model, sample_period, power_saving, bulk_transfer)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, model, sample_period, power_saving):
+    def __init__(self, model, sample_period, power_saving, bulk_transfer=False):
         """
         Constructor
         """
@@ -56,13 +72,14 @@ class OPCConf(PersistentJSONable):
         self.__model = model
         self.__sample_period = int(sample_period)
         self.__power_saving = bool(power_saving)
+        self.__bulk_transfer = bool(bulk_transfer)
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def opc_monitor(self):
         if self.model == 'N2':
-            opc = OPCN2()
+            opc = OPCN2(bulk_transfer=self.bulk_transfer)
         else:
             raise ValueError('unknown model: %s' % self.model)
 
@@ -92,6 +109,11 @@ class OPCConf(PersistentJSONable):
         return self.__power_saving
 
 
+    @property
+    def bulk_transfer(self):
+        return self.__bulk_transfer
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def as_json(self):
@@ -100,6 +122,7 @@ class OPCConf(PersistentJSONable):
         jdict['model'] = self.__model
         jdict['sample-period'] = self.__sample_period
         jdict['power-saving'] = self.__power_saving
+        jdict['bulk-transfer'] = self.__bulk_transfer
 
         return jdict
 
@@ -107,5 +130,5 @@ class OPCConf(PersistentJSONable):
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "OPCConf:{model:%s, sample_period:%s, power_saving:%s}" %  \
-               (self.model, self.sample_period, self.power_saving)
+        return "OPCConf:{model:%s, sample_period:%s, power_saving:%s, bulk_transfer:%s}" %  \
+               (self.model, self.sample_period, self.power_saving, self.bulk_transfer)
@@ -2,18 +2,38 @@
 Created on 9 Jul 2017
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Samples the OPC in a separate process, publishing each histogram through a SeqlockRing in shared memory. A record is
+the sample time, as epoch seconds, followed by the OPCN2Frame of the histogram. Readers take no lock, never block the
+sampling process, and decode only the records they read.
+
+The ring holds the most recent history samples - samples_since(..) and new_samples() return those not yet read.
+OPCWindow statistics over the most recent window_period are maintained by the sampling process as samples arrive,
+and published through a SeqlockSlot - window() costs the same however long the period. The statistics are those as
+at the most recent sample: window() adds their age, in seconds, as 'age', and returns None once the most recent sample
+is older than the window period. Statistics up to age seconds old may include samples that have since expired.
+
+If the OPCConf specifies power saving, and the sample period is long enough, the OPC is duty-cycled: it is woken ahead
+of each sample by the time it takes to boot, start, bring its fan up to speed and accumulate one integration period,
+and is stopped and powered down once the sample is taken - even if sampling fails. Counts accumulated while the fan
+stabilises are discarded. The monitor then powers the OPC itself: on() does nothing.
 """
 
-from collections import OrderedDict
-from multiprocessing import Manager
+import pickle
+import struct
+import time
 
-from scs_core.particulate.opc_datum import OPCDatum
+from scs_core.data.localized_datetime import LocalizedDatetime
 
 from scs_core.sync.interval_timer import IntervalTimer
 from scs_core.sync.synchronised_process import SynchronisedProcess
 
+from scs_dfe.data.seqlock_ring import SeqlockRing
+from scs_dfe.data.seqlock_slot import SeqlockSlot
+
+from scs_dfe.particulate.opc_n2_frame import OPCN2Frame
+from scs_dfe.particulate.opc_window import OPCWindow
 
-# TODO: should be able to start and stop the OPC on very long sampling intervals
 
 # --------------------------------------------------------------------------------------------------------------------
 
@@ -22,50 +42,178 @@ class OPCMonitor(SynchronisedProcess):
     classdocs
     """
 
+    DEFAULT_WINDOW_PERIOD = 60.0                    # seconds
+    DEFAULT_HISTORY = 64                            # samples
+
+    __REC = struct.Struct('<d')                     # epoch seconds
+    __RECORD_SIZE = __REC.size + OPCN2Frame.SIZE
+
+    __WINDOW_CAPACITY = 8192                        # bytes - pickled OPCWindow JSON
+    __AGE_PRECISION = 3                             # decimal places of window age
+
+    __MIN_DUTY_CYCLE_RATIO = 2.0                    # sample period / wake time, below which the OPC stays on
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __datum(cls, record):
+        rec, = cls.__REC.unpack_from(record)
+        frame = OPCN2Frame.construct(memoryview(record)[cls.__REC.size:])
+
+        return frame.datum(LocalizedDatetime.construct_from_timestamp(rec))
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self, opc, conf):
+    def __init__(self, opc, conf, window_period=DEFAULT_WINDOW_PERIOD, history=DEFAULT_HISTORY):
         """
         Constructor
         """
-        manager = Manager()
-
-        SynchronisedProcess.__init__(self, manager.list())
+        SynchronisedProcess.__init__(self, SeqlockRing(OPCMonitor.__RECORD_SIZE, history))
 
         self.__opc = opc
         self.__conf = conf
 
+        self.__window_period = window_period                        # float     seconds
+        self.__window_slot = SeqlockSlot(OPCMonitor.__WINDOW_CAPACITY)
+
+        self.__cursor = 0                                           # int       next sample number for new_samples()
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def run(self):
-        self.__opc.sample()     # reset counts
-
         try:
-            timer = IntervalTimer(self.__conf.sample_period)
-
-            while timer.true():
-                datum = self.__opc.sample()
+            window = OPCWindow(self.__window_period)
 
-                with self._lock:
-                    datum.as_list(self._value)
+            if self.duty_cycled:
+                self.__run_duty_cycled(window)
+            else:
+                self.__run_continuous(window)
 
         except KeyboardInterrupt:
             pass
 
 
+    def __run_continuous(self, window):
+        self.__opc.sample()     # reset counts
+
+        timer = IntervalTimer(self.__conf.sample_period)
+
+        while timer.true():
+            self.__publish(self.__opc.sample(), window)
+
+
+    def __run_duty_cycled(self, window):
+        period = self.__conf.sample_period
+        wake_time = self.wake_time
+        integration_time = self.__opc.DEFAULT_SAMPLE_PERIOD
+
+        sample_time = time.time() + wake_time
+
+        while True:
+            OPCMonitor.__sleep_until(sample_time - wake_time)
+
+            try:
+                self.__opc.power_on()
+                self.__opc.operations_on()
+
+                OPCMonitor.__sleep_until(sample_time - integration_time)
+                self.__opc.sample()                     # discard counts accumulated during stabilisation
+
+                OPCMonitor.__sleep_until(sample_time)
+                self.__publish(self.__opc.sample(), window)
+
+            finally:
+                try:
+                    self.__opc.operations_off()
+
+                finally:
+                    self.__opc.power_off()
+
+            # schedule...
+            sample_time += period
+
+            while sample_time - wake_time < time.time():     # a wake-up has been missed
+                sample_time += period
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __sleep_until(wake):
+        delay = wake - time.time()
+
+        if delay > 0:
+            time.sleep(delay)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def sample(self):
-        with self._lock:
-            value = self._value
+        latest = self._value.latest()
+
+        if latest is None:
+            return None
+
+        _, record = latest
+
+        return OPCMonitor.__datum(record)
+
+
+    def samples_since(self, number):
+        """
+        returns a list of (number, OPCDatum) for the samples numbered number or later that are still held, oldest first
+        """
+        return [(n, OPCMonitor.__datum(record)) for n, record in self._value.since(number)]
 
-        return OPCDatum.construct_from_jdict(OrderedDict(value))
+
+    def new_samples(self):
+        """
+        returns a list of (number, OPCDatum) for the samples received since the previous call, oldest first
+        """
+        samples = self.samples_since(self.__cursor)
+
+        if samples:
+            self.__cursor = samples[-1][0] + 1
+
+        return samples
+
+
+    def window(self):
+        """
+        returns the OPCWindow JSON as at the most recent sample, with its age, or None if there is no sample in the
+        window period
+        """
+        payload = self.__window_slot.read()
+
+        if payload is None:
+            return None
+
+        jdict = pickle.loads(payload)
+
+        age = time.time() - jdict['rec']
+
+        if age > self.__window_period:
+            return None                                 # every sample has expired
+
+        jdict['age'] = round(age, OPCMonitor.__AGE_PRECISION)
+
+        return jdict
+
+
+    def close(self):
+        self._value.close()
+        self.__window_slot.close()
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def on(self):
+        if self.duty_cycled:
+            return                                      # powered by the monitor for each sample
+
         try:
             self.__opc.power_on()
             self.__opc.operations_on()
@@ -83,7 +231,74 @@ class OPCMonitor(SynchronisedProcess):
             pass
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __publish(self, datum, window):
+        rec = datum.rec.timestamp()
+        frame = self.__opc.last_frame
+
+        self._value.write(OPCMonitor.__REC.pack(rec) + frame.buffer)
+
+        window.append(rec, frame)
+        self.__window_slot.write(pickle.dumps(window.as_json(), pickle.HIGHEST_PROTOCOL))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def samples(self):
+        return self._value.count
+
+
+    @property
+    def history(self):
+        return self._value.capacity
+
+
+    @property
+    def window_period(self):
+        return self.__window_period
+
+
+    @property
+    def wake_time(self):
+        """
+        the time from wake-up to sample: boot, start, fan stabilisation and one integration period
+        """
+        return self.__opc.BOOT_TIME + self.__opc.START_TIME + self.__opc.FAN_UP_TIME + \
+            self.__opc.DEFAULT_SAMPLE_PERIOD
+
+
+    @property
+    def on_time(self):
+        """
+        the time for which the OPC is powered in each duty cycle: wake time, stop and fan run-down
+        """
+        return self.wake_time + self.__opc.STOP_TIME + self.__opc.FAN_DOWN_TIME
+
+
+    @property
+    def duty_cycled(self):
+        if not self.__conf.power_saving:
+            return False
+
+        return self.__conf.sample_period >= OPCMonitor.__MIN_DUTY_CYCLE_RATIO * self.on_time
+
+
+    @property
+    def duty_cycle(self):
+        """
+        the proportion of time for which the OPC is powered
+        """
+        if not self.duty_cycled:
+            return 1.0
+
+        return self.on_time / self.__conf.sample_period
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "OPCMonitor:{sample:%s, opc:%s, conf:%s}" % (self.sample(), self.__opc, self.__conf)
+        return "OPCMonitor:{sample:%s, samples:%d, window_period:%s, duty_cycle:%0.2f, ring:%s, opc:%s, conf:%s}" % \
+               (self.sample(), self.samples, self.window_period, self.duty_cycle, self._value, self.__opc,
+                self.__conf)
@@ -2,16 +2,23 @@
 Created on 4 Jul 2016
 
 @author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+By default, each byte of the histogram and firmware responses is read in a separate SPI transaction, following a
+delay of __TRANSFER_DELAY, as the OPC's inter-byte timing requires. With bulk_transfer=True, each response is read in
+a single transaction, as one bytes buffer - this should be enabled only on hosts whose SPI timing has been verified
+against the OPC.
+
+The histogram is decoded by OPCN2Frame - the most recent frame, including the flow rate and temperature / pressure
+fields that are not part of the OPCDatum, is available as last_frame.
 """
 
-import math
-import struct
+import asyncio
 import time
 
 from scs_core.data.localized_datetime import LocalizedDatetime
-from scs_core.particulate.opc_datum import OPCDatum
 
 from scs_dfe.board.io import IO
+from scs_dfe.particulate.opc_n2_frame import OPCN2Frame
 
 from scs_host.lock.lock import Lock
 from scs_host.sys.host_spi import HostSPI
@@ -30,6 +37,9 @@ class OPCN2(object):
     START_TIME =                         5.0       # seconds
     STOP_TIME =                          2.0       # seconds
 
+    FAN_UP_TIME =                       10.0       # seconds
+    FAN_DOWN_TIME =                      2.0       # seconds
+
     MIN_SAMPLE_PERIOD =                  5.0       # seconds
     MAX_SAMPLE_PERIOD =                 10.0       # seconds
     DEFAULT_SAMPLE_PERIOD =             10.0       # seconds
@@ -38,10 +48,6 @@ class OPCN2(object):
 
     __FLOW_RATE_VERSION =               16
 
-
-    __FAN_UP_TIME =                     10
-    __FAN_DOWN_TIME =                   2
-
     __PERIOD_CONVERSION =               45360       # should be 12000 (1/12MHz * 1000), but found by experiment
 
     __CMD_POWER =                       0x03
@@ -52,6 +58,9 @@ class OPCN2(object):
     __CMD_READ_HISTOGRAM =              0x30
     __CMD_GET_FIRMWARE_VERSION =        0x3f
 
+    __HISTOGRAM_SIZE =                  OPCN2Frame.SIZE
+    __FIRMWARE_SIZE =                   60          # bytes
+
     __SPI_CLOCK =                       488000
     __SPI_MODE =                        1
 
@@ -63,40 +72,50 @@ class OPCN2(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    @staticmethod
-    def __pack_int(byte_values):
-        packed = struct.unpack('h', struct.pack('BB', *byte_values))
-        return packed[0]
+    @classmethod
+    def obtain_lock(cls):
+        Lock.acquire(cls.__name__, OPCN2.__LOCK_TIMEOUT)
 
 
-    @staticmethod
-    def __pack_float(byte_values):
-        packed = struct.unpack('f', struct.pack('BBBB', *byte_values))
+    @classmethod
+    async def obtain_lock_async(cls):
+        """
+        as obtain_lock(), but the lock is waited for in the event loop's default executor - if cancelled while
+        waiting, the lock is released once it has been acquired
+        """
+        acquisition = asyncio.get_running_loop().run_in_executor(None, cls.obtain_lock)
 
-        return None if math.isnan(packed[0]) else packed[0]
+        try:
+            await asyncio.shield(acquisition)
 
+        except asyncio.CancelledError:
+            acquisition.add_done_callback(cls.__abandon_lock)
+            raise
 
-    # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
-    def obtain_lock(cls):
-        Lock.acquire(cls.__name__, OPCN2.__LOCK_TIMEOUT)
+    def release_lock(cls):
+        Lock.release(cls.__name__)
 
 
     @classmethod
-    def release_lock(cls):
-        Lock.release(cls.__name__)
+    def __abandon_lock(cls, acquisition):
+        if not acquisition.cancelled() and acquisition.exception() is None:
+            cls.release_lock()
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __init__(self):
+    def __init__(self, bulk_transfer=False):
         """
         Constructor
         """
         self.__io = IO()
         self.__spi = HostSPI(0, OPCN2.__SPI_MODE, OPCN2.__SPI_CLOCK)
 
+        self.__bulk_transfer = bulk_transfer        # bool
+        self.__last_frame = None                    # OPCN2Frame
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -109,6 +128,15 @@ class OPCN2(object):
             time.sleep(self.BOOT_TIME)
 
 
+    async def power_on_async(self):
+        initial_power_state = self.__io.opc_power
+
+        self.__io.opc_power = IO.LOW
+
+        if initial_power_state == IO.HIGH:
+            await asyncio.sleep(self.BOOT_TIME)
+
+
     def power_off(self):
         self.__io.opc_power = IO.HIGH
 
@@ -128,8 +156,7 @@ class OPCN2(object):
             self.__spi.xfer([OPCN2.__CMD_READ_HISTOGRAM])
             time.sleep(OPCN2.__CMD_DELAY)
 
-            for _ in range(62):
-                self.__read_byte()
+            self.__read_frame(OPCN2.__HISTOGRAM_SIZE)
 
         finally:
             self.__spi.close()
@@ -151,6 +178,43 @@ class OPCN2(object):
             self.release_lock()
 
 
+    async def operations_on_async(self):
+        await self.obtain_lock_async()
+
+        try:
+            self.__spi.open()
+
+            # start...
+            self.__spi.xfer([OPCN2.__CMD_POWER, OPCN2.__CMD_POWER_ON])
+            await asyncio.sleep(OPCN2.START_TIME)
+
+            # clear histogram...
+            self.__spi.xfer([OPCN2.__CMD_READ_HISTOGRAM])
+            await asyncio.sleep(OPCN2.__CMD_DELAY)
+
+            self.__read_frame(OPCN2.__HISTOGRAM_SIZE)
+
+        finally:
+            self.__spi.close()
+            self.release_lock()
+
+
+    async def operations_off_async(self):
+        await self.obtain_lock_async()
+
+        try:
+            self.__spi.open()
+
+            self.__spi.xfer([OPCN2.__CMD_POWER, OPCN2.__CMD_POWER_OFF])
+            await asyncio.sleep(OPCN2.STOP_TIME)
+
+            await asyncio.sleep(OPCN2.__CMD_DELAY)
+
+        finally:
+            self.__spi.close()
+            self.release_lock()
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def sample(self):
@@ -161,42 +225,31 @@ class OPCN2(object):
             self.__spi.xfer([OPCN2.__CMD_READ_HISTOGRAM])
             time.sleep(OPCN2.__CMD_DELAY)
 
-            # bins...
-            bins = [None] * 16
+            return self.__read_histogram()
 
-            for i in range(16):
-                bins[i] = self.__read_int()
+        finally:
+            time.sleep(OPCN2.__CMD_DELAY)
 
-            # bin MToFs...
-            bin_1_mtof = self.__read_byte()
-            bin_3_mtof = self.__read_byte()
-            bin_5_mtof = self.__read_byte()
-            bin_7_mtof = self.__read_byte()
+            self.__spi.close()
+            self.release_lock()
 
-            # flow rate...
-            self.__spi.read_bytes(4)
 
-            # temperature
-            self.__spi.read_bytes(4)
+    async def sample_async(self):
+        await self.obtain_lock_async()
 
-            # period...
-            period = self.__read_float()
+        try:
+            self.__spi.open()
 
-            # checksum...
-            self.__read_int()
+            self.__spi.xfer([OPCN2.__CMD_READ_HISTOGRAM])
+            await asyncio.sleep(OPCN2.__CMD_DELAY)
 
-            # PMx...
-            pm1 = self.__read_float()
-            pm2p5 = self.__read_float()
-            pm10 = self.__read_float()
+            datum = self.__read_histogram()
 
-            now = LocalizedDatetime.now()
+            await asyncio.sleep(OPCN2.__CMD_DELAY)
 
-            return OPCDatum(now, pm1, pm2p5, pm10, period, bins, bin_1_mtof, bin_3_mtof, bin_5_mtof, bin_7_mtof)
+            return datum
 
         finally:
-            time.sleep(OPCN2.__CMD_DELAY)
-
             self.__spi.close()
             self.release_lock()
 
@@ -209,11 +262,7 @@ class OPCN2(object):
             self.__spi.xfer([OPCN2.__CMD_GET_FIRMWARE_VERSION])
             time.sleep(OPCN2.__CMD_DELAY)
 
-            read_bytes = []
-
-            for _ in range(60):
-                time.sleep(OPCN2.__TRANSFER_DELAY)
-                read_bytes.extend(self.__spi.read_bytes(1))
+            read_bytes = self.__read_frame(OPCN2.__FIRMWARE_SIZE)
 
             report = '' . join(chr(b) for b in read_bytes)
 
@@ -228,34 +277,42 @@ class OPCN2(object):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def __read_byte(self):
-        time.sleep(OPCN2.__TRANSFER_DELAY)
-        read_bytes = self.__spi.read_bytes(1)
+    def __read_histogram(self):
+        self.__last_frame = OPCN2Frame.construct(self.__read_frame(OPCN2.__HISTOGRAM_SIZE))
+
+        return self.__last_frame.datum(LocalizedDatetime.now())
 
-        return read_bytes[0]
 
+    def __read_frame(self, count):
+        """
+        returns count bytes, as one bytes buffer
+        """
+        if self.__bulk_transfer:
+            time.sleep(OPCN2.__TRANSFER_DELAY)
+            return bytes(self.__spi.read_bytes(count))
 
-    def __read_int(self):
-        read_bytes = []
+        read_bytes = bytearray()
 
-        for _ in range(2):
+        for _ in range(count):
             time.sleep(OPCN2.__TRANSFER_DELAY)
             read_bytes.extend(self.__spi.read_bytes(1))
 
-        return OPCN2.__pack_int(read_bytes)
+        return bytes(read_bytes)
 
 
-    def __read_float(self):
-        read_bytes = []
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def bulk_transfer(self):
+        return self.__bulk_transfer
 
-        for _ in range(4):
-            time.sleep(OPCN2.__TRANSFER_DELAY)
-            read_bytes.extend(self.__spi.read_bytes(1))
 
-        return OPCN2.__pack_float(read_bytes)
+    @property
+    def last_frame(self):
+        return self.__last_frame
 
 
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
-        return "OPCN2:{io:%s, spi:%s}" % (self.__io, self.__spi)
+        return "OPCN2:{bulk_transfer:%s, io:%s, spi:%s}" % (self.bulk_transfer, self.__io, self.__spi)
@@ -0,0 +1,191 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+The 62-byte histogram response of an Alphasense OPC-N2, decoded in one pass of a precompiled struct over a
+memoryview of the buffer - the buffer is not copied.
+
+Layout, little-endian:
+
+bins                int16[16]   counts, as read by OPCN2 since 2016
+bin MToFs           uint8[4]    bins 1, 3, 5, 7
+flow rate           float32     sample flow rate, ml / s - valid from firmware version 16
+temperature / pressure
+                    uint32      alternately the temperature, as °C x 10, and the pressure, as Pa
+period              float32     sampling period, as reported by the OPC
+checksum            uint16      least significant 16 bits of the sum of the bin counts
+PM1, PM2.5, PM10    float32[3]  μg/m3
+
+NaN float fields are reported as None.
+"""
+
+import math
+import struct
+
+import numpy as np
+
+from scs_core.particulate.opc_datum import OPCDatum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class OPCN2Frame(object):
+    """
+    classdocs
+    """
+
+    BINS =                  16
+
+    __STRUCT =              struct.Struct('<16h4BfIfH3f')
+    SIZE =                  __STRUCT.size                       # 62 bytes
+
+    __BINS_DTYPE =          np.dtype('<i2')
+
+    __MIN_PRESSURE =        10000                               # Pa - lower values are temperatures
+    __TEMP_CONVERSION =     10.0
+
+    __CHECKSUM_MASK =       0xffff
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __float(value):
+        return None if math.isnan(value) else value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def construct(cls, buffer):
+        """
+        buffer: bytes-like object of at least SIZE bytes
+        """
+        view = memoryview(buffer)
+
+        if len(view) < cls.SIZE:
+            raise ValueError("OPCN2Frame: frame of %d bytes is shorter than %d." % (len(view), cls.SIZE))
+
+        fields = cls.__STRUCT.unpack_from(view)
+
+        bins = fields[0:16]
+        bin_mtofs = fields[16:20]
+        flow_rate, temp_pressure, period, checksum, pm1, pm2p5, pm10 = fields[20:]
+
+        if temp_pressure >= cls.__MIN_PRESSURE:
+            temp, pressure = None, temp_pressure
+        else:
+            temp, pressure = temp_pressure / cls.__TEMP_CONVERSION, None
+
+        return OPCN2Frame(view[:cls.SIZE], bins, bin_mtofs, cls.__float(flow_rate), temp, pressure,
+                          cls.__float(period), checksum, cls.__float(pm1), cls.__float(pm2p5), cls.__float(pm10))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, view, bins, bin_mtofs, flow_rate, temp, pressure, period, checksum, pm1, pm2p5, pm10):
+        """
+        Constructor
+        """
+        self.__view = view                          # memoryview of the frame
+
+        self.__bins = bins                          # tuple of int
+        self.__bin_mtofs = bin_mtofs                # tuple of int      bins 1, 3, 5, 7
+
+        self.__flow_rate = flow_rate                # float ml / s or None
+        self.__temp = temp                          # float °C or None
+        self.__pressure = pressure                  # int Pa or None
+
+        self.__period = period                      # float or None
+        self.__checksum = checksum                  # int
+
+        self.__pm1 = pm1                            # float μg/m3 or None
+        self.__pm2p5 = pm2p5                        # float μg/m3 or None
+        self.__pm10 = pm10                          # float μg/m3 or None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def datum(self, rec):
+        bin_1_mtof, bin_3_mtof, bin_5_mtof, bin_7_mtof = self.bin_mtofs
+
+        return OPCDatum(rec, self.pm1, self.pm2p5, self.pm10, self.period, list(self.bins),
+                        bin_1_mtof, bin_3_mtof, bin_5_mtof, bin_7_mtof)
+
+
+    def bins_array(self):
+        """
+        returns a read-only NumPy view of the bin counts - the frame buffer is not copied
+        """
+        return np.frombuffer(self.__view, dtype=OPCN2Frame.__BINS_DTYPE, count=OPCN2Frame.BINS)
+
+
+    def has_valid_checksum(self):
+        return sum(self.bins) & OPCN2Frame.__CHECKSUM_MASK == self.checksum
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def buffer(self):
+        return self.__view
+
+
+    @property
+    def bins(self):
+        return self.__bins
+
+
+    @property
+    def bin_mtofs(self):
+        return self.__bin_mtofs
+
+
+    @property
+    def flow_rate(self):
+        return self.__flow_rate
+
+
+    @property
+    def temp(self):
+        return self.__temp
+
+
+    @property
+    def pressure(self):
+        return self.__pressure
+
+
+    @property
+    def period(self):
+        return self.__period
+
+
+    @property
+    def checksum(self):
+        return self.__checksum
+
+
+    @property
+    def pm1(self):
+        return self.__pm1
+
+
+    @property
+    def pm2p5(self):
+        return self.__pm2p5
+
+
+    @property
+    def pm10(self):
+        return self.__pm10
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return "OPCN2Frame:{bins:%s, bin_mtofs:%s, flow_rate:%s, temp:%s, pressure:%s, period:%s, checksum:%s, " \
+               "pm1:%s, pm2p5:%s, pm10:%s}" % \
+               (list(self.bins), list(self.bin_mtofs), self.flow_rate, self.temp, self.pressure, self.period,
+                self.checksum, self.pm1, self.pm2p5, self.pm10)
@@ -0,0 +1,135 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Statistics of the OPC samples received in the most recent period, maintained incrementally as samples arrive: for
+each PM value and each bin, a SlidingWindow of count, total, mean, min and max. The total of a bin is its summed
+count over the period. Null PM values are not included.
+
+Samples may be OPCDatum or OPCN2Frame instances, and must be appended in time order.
+
+example JSON:
+{"period": 60.0, "rec": 1792310400.0, "n": 6, "pm1": {"n": 6, "sum": 7.5, "avg": 1.25, "min": 1.1, "max": 1.4}, ...
+ "bins": [{"n": 6, "sum": 74, "avg": 12.33, "min": 9, "max": 17}, ...]}
+"""
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONable
+
+from scs_dfe.data.sliding_window import SlidingWindow
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class OPCWindow(JSONable):
+    """
+    classdocs
+    """
+
+    PMS = ('pm1', 'pm2p5', 'pm10')
+
+    BINS = 16
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def __window_jdict(window):
+        jdict = OrderedDict()
+
+        jdict['n'] = window.count
+        jdict['sum'] = window.total
+        jdict['avg'] = window.mean
+        jdict['min'] = window.min
+        jdict['max'] = window.max
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, period):
+        """
+        Constructor
+        """
+        self.__period = period                                          # float     seconds
+
+        self.__recs = SlidingWindow(period)                             # SlidingWindow of sample recs
+        self.__pms = OrderedDict((pm, SlidingWindow(period)) for pm in OPCWindow.PMS)
+        self.__bins = [SlidingWindow(period) for _ in range(OPCWindow.BINS)]
+
+        self.__rec = None                                               # float     epoch seconds of latest sample
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def append(self, rec, sample):
+        """
+        rec: epoch seconds
+        """
+        self.__rec = rec
+
+        self.__recs.append(rec, rec)
+
+        for pm, window in self.__pms.items():
+            value = getattr(sample, pm)
+
+            if value is None:
+                window.expire(rec)
+            else:
+                window.append(rec, value)
+
+        for window, count in zip(self.__bins, sample.bins):
+            window.append(rec, count)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_json(self):
+        jdict = OrderedDict()
+
+        jdict['period'] = self.period
+        jdict['rec'] = self.rec
+        jdict['n'] = self.count
+
+        for pm, window in self.__pms.items():
+            jdict[pm] = self.__window_jdict(window)
+
+        jdict['bins'] = [self.__window_jdict(window) for window in self.__bins]
+
+        return jdict
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def pm(self, name):
+        return self.__pms[name]
+
+
+    def bin(self, index):
+        return self.__bins[index]
+
+
+    @property
+    def period(self):
+        return self.__period
+
+
+    @property
+    def rec(self):
+        return self.__rec
+
+
+    @property
+    def count(self):
+        return self.__recs.count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        pms = '{' + ', '.join('%s: %s' % (pm, window) for pm, window in self.__pms.items()) + '}'
+
+        return "OPCWindow:{period:%s, rec:%s, count:%d, pms:%s}" % (self.period, self.rec, self.count, pms)
@@ -8,6 +8,8 @@ Note: time shall always be stored as UTC, then localized on retrieval.
 
 from scs_core.data.rtc_datetime import RTCDatetime
 
+from scs_dfe.board.i2c_mutex import I2CMutex
+
 from scs_host.bus.i2c import I2C
 from scs_host.lock.lock import Lock
 
@@ -148,10 +150,10 @@ class DS1338(object):
     @classmethod
     def __read_reg(cls, addr):
         try:
-            I2C.start_tx(cls.__ADDR)
+            I2CMutex.start_tx(cls.__ADDR)
             value = I2C.read_cmd(addr, 1)
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
         return value
 
@@ -164,10 +166,10 @@ class DS1338(object):
     @classmethod
     def __write_reg(cls, addr, value):
         try:
-            I2C.start_tx(cls.__ADDR)
+            I2CMutex.start_tx(cls.__ADDR)
             I2C.write(addr, value)
         finally:
-            I2C.end_tx()
+            I2CMutex.end_tx()
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import tempfile
+import time
+
+from scs_dfe.data.conf_cache import ConfCache
+from scs_dfe.gas.pt1000_conf import Pt1000Conf
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestHost(object):
+    """
+    a host whose conf directory is a temporary directory
+    """
+
+    __CONF_DIR = tempfile.mkdtemp() + '/'
+
+    @classmethod
+    def conf_dir(cls):
+        return cls.__CONF_DIR
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+conf = Pt1000Conf(0x69)
+conf.save(TestHost)
+
+print(Pt1000Conf.load(TestHost))
+print("hits:%d misses:%d" % (ConfCache.hits(), ConfCache.misses()))
+print("-")
+
+start_time = time.time()
+
+for _ in range(10000):
+    Pt1000Conf.load(TestHost)
+
+elapsed = time.time() - start_time
+
+print("10000 loads: elapsed:%0.3f" % elapsed)
+print("hits:%d misses:%d" % (ConfCache.hits(), ConfCache.misses()))
+print("-")
+
+print("watch: %s" % ConfCache.watch())
+print("-")
+
+conf = Pt1000Conf(0x68)
+conf.save(TestHost)
+
+print(Pt1000Conf.load(TestHost))
+print("hits:%d misses:%d" % (ConfCache.hits(), ConfCache.misses()))
+print("-")
+
+ConfCache.unwatch()
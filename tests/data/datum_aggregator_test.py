@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Note: aggregates simulated 5-second SHT-like readings into 1-minute tumbling and 30-second sliding windows.
+"""
+
+import random
+
+from collections import OrderedDict
+
+from scs_core.data.json import JSONify
+
+from scs_dfe.data.datum_aggregator import DatumAggregator
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+aggregator = DatumAggregator(60.0, sliding_period=30.0, src='SHT')
+print(aggregator)
+print("-")
+
+start = 1760788800.0
+
+for i in range(36):
+    datum = OrderedDict((('hmd', round(random.gauss(50.0, 1.0), 1)), ('tmp', round(random.gauss(21.0, 0.2), 1))))
+
+    completed = aggregator.append(datum, start + i * 5.0)
+
+    if completed is not None:
+        print(JSONify.dumps(completed))
+        print("-")
+
+print("sliding: %s" % JSONify.dumps(aggregator.sliding()))
+print("-")
+
+print("flush: %s" % JSONify.dumps(aggregator.flush()))
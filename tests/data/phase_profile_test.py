@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import time
+
+from scs_core.data.json import JSONify
+
+from scs_dfe.data.phase_profile import PhaseProfile
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+profile = PhaseProfile()
+print(profile)
+print("-")
+
+for _ in range(5):
+    profile.start_sweep()
+
+    profile.record(PhaseProfile.LOCK_WAIT, 0.00002)
+
+    for _ in range(4):
+        profile.record(PhaseProfile.I2C, 0.0004)
+        profile.record(PhaseProfile.CONVERSION_WAIT, 0.125)
+
+    time.sleep(0.01)
+
+    profile.end_sweep()
+
+for phase in profile.phases:
+    histogram = profile.histogram(phase)
+    print("%s: count:%d mean per sweep:%0.6f" % (phase, profile.count(phase), histogram.mean))
+
+print("-")
+
+print(JSONify.dumps(profile))
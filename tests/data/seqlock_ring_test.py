@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Benchmark: a SeqlockRing vs. a Manager list proxy, with a writer in a separate process.
+"""
+
+import struct
+import time
+
+from multiprocessing import Manager, Process
+
+from scs_dfe.data.seqlock_ring import SeqlockRing
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+RECORD = struct.Struct('<d16h')
+
+WRITES = 2000
+READS = 2000
+
+
+def ring_writer(ring):
+    for i in range(WRITES):
+        ring.write(RECORD.pack(time.time(), *([i % 100] * 16)))
+
+
+def list_writer(proxy, lock):
+    for i in range(WRITES):
+        with lock:
+            proxy[:] = [time.time()] + [i % 100] * 16
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+start = time.perf_counter()
+ring = SeqlockRing(RECORD.size, 64)
+print("ring startup:%0.6f s" % (time.perf_counter() - start))
+print(ring)
+
+proc = Process(target=ring_writer, args=(ring, ))
+proc.start()
+
+while ring.count == 0:
+    time.sleep(0.001)
+
+start = time.perf_counter()
+torn = 0
+
+for _ in range(READS):
+    latest = ring.latest()
+
+    if latest is not None:
+        fields = RECORD.unpack(latest[1])
+        torn += len(set(fields[1:])) != 1
+
+read_time = (time.perf_counter() - start) / READS
+
+proc.join()
+
+print("ring read:%0.1f µs torn:%d" % (read_time * 1e6, torn))
+print("since(count - 10):%s" % [number for number, _ in ring.since(ring.count - 10)])
+print(ring)
+ring.close()
+print("-")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+start = time.perf_counter()
+manager = Manager()
+value = manager.list()
+lock = manager.Lock()
+print("manager startup:%0.6f s" % (time.perf_counter() - start))
+
+proc = Process(target=list_writer, args=(value, lock))
+proc.start()
+
+while len(value) == 0:
+    time.sleep(0.001)
+
+start = time.perf_counter()
+
+for _ in range(READS):
+    with lock:
+        copy = list(value)
+
+read_time = (time.perf_counter() - start) / READS
+
+proc.join()
+
+print("manager read:%0.1f µs" % (read_time * 1e6))
+manager.shutdown()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import time
+
+from scs_dfe.gas.ads1115 import ADS1115
+from scs_dfe.gas.ads1115_stream import ADS1115Stream
+
+from scs_host.bus.i2c import I2C
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+gain = ADS1115.GAIN_1p024
+rate = ADS1115.RATE_860
+
+mux = ADS1115.MUX_A3_GND
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+stream = None
+
+try:
+    I2C.open(Host.I2C_SENSORS)
+
+    wrk = ADS1115(ADS1115.ADDR_WRK, rate)
+    print("wrk: %s" % wrk)
+
+    stream = ADS1115Stream(wrk, mux, gain, 10 * wrk.sps)
+    print(stream)
+    print("-")
+
+    start_time = time.time()
+    stream.start()
+
+    time.sleep(2.0)
+
+    recs, codes = stream.last(5)
+    print("last: %s" % list(zip(recs, stream.volts(codes))))
+    print("-")
+
+    recs, codes = stream.since(start_time + 1.0)
+    print("since: %d samples, %0.1f SPS" % (len(recs), len(recs) / (recs[-1] - recs[0])))
+    print("-")
+
+finally:
+    if stream:
+        stream.stop()
+        print(stream)
+
+    I2C.close()
@@ -52,6 +52,13 @@ try:
 
     v_wrk = wrk.convert(mux, gain)
     print("wrk v: %0.6f" % v_wrk)
+    print("wrk polls: %d" % wrk.polls)
+    print("-")
+
+    for _ in range(10):
+        wrk.convert(mux, gain)
+
+    print("wrk timer: %s" % wrk.timer)
 
 finally:
     I2C.close()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Note: compares the batch calibration of simulated raw voltages with the per-sample path, using the host's AFE
+calibration and baseline.
+"""
+
+import time
+
+import numpy as np
+
+from scs_core.gas.afe_baseline import AFEBaseline
+from scs_core.gas.afe_calib import AFECalib
+
+from scs_dfe.gas.afe_batch_calibrator import AFEBatchCalibrator
+
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RawSource(object):
+    """
+    stands in for the AFE on the per-sample path
+    """
+
+    def __init__(self, we_v, ae_v):
+        self.we_v = we_v
+        self.ae_v = ae_v
+
+    def sample_raw_wrk_aux(self, _sensor_index, _gain_index):
+        return self.we_v, self.ae_v
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+calibrator = AFEBatchCalibrator(AFECalib.load(Host), AFEBaseline.load(Host))
+print(calibrator)
+print("-")
+
+n = 100000
+stations = len(calibrator.sensors)
+
+temp = np.random.uniform(-10.0, 45.0, n)
+we_v = np.random.uniform(0.25, 0.40, (n, stations))
+ae_v = np.random.uniform(0.25, 0.35, (n, stations))
+
+start_time = time.time()
+results = calibrator.calibrate_all(temp, we_v, ae_v)
+elapsed = time.time() - start_time
+
+print("batch: n:%d elapsed:%0.3f" % (n, elapsed))
+print("-")
+
+# per-sample comparison...
+no2_index = [sensor.gas_name for sensor in calibrator.sensors].index('NO2') \
+    if 'NO2' in calibrator.gas_names else None
+
+for i in range(100):
+    no2_sample = None
+
+    if no2_index is not None:
+        no2_sample = calibrator.sensors[no2_index].sample(RawSource(we_v[i, no2_index], ae_v[i, no2_index]),
+                                                          temp[i], no2_index)
+
+    for index, sensor in enumerate(calibrator.sensors):
+        if sensor is None or sensor.gas_name not in results:
+            continue
+
+        sample = sensor.sample(RawSource(we_v[i, index], ae_v[i, index]), temp[i], index, no2_sample)
+
+        we_c, cnc = results[sensor.gas_name]
+
+        if sample.cnc is not None and abs(round(cnc[i], 1) - sample.cnc) > 1e-9:
+            print("%s: %d: per-sample:%s batch:%0.1f" % (sensor.gas_name, i, sample.cnc, cnc[i]))
+
+print("compared")
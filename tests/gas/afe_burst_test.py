@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import time
+
+from scs_core.data.json import JSONify
+
+from scs_core.gas.afe_calib import AFECalib
+from scs_core.gas.pt1000_calib import Pt1000Calib
+
+from scs_dfe.gas.afe import AFE
+from scs_dfe.gas.pt1000 import Pt1000
+from scs_dfe.gas.pt1000_conf import Pt1000Conf
+
+from scs_host.bus.i2c import I2C
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+pt1000_conf = Pt1000Conf.load(Host)
+pt1000 = Pt1000(Pt1000Calib.load(Host))
+
+sensors = AFECalib.load(Host).sensors()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+try:
+    I2C.open(Host.I2C_SENSORS)
+
+    afe = AFE(pt1000_conf, pt1000, sensors)
+    print(afe)
+    print("-")
+
+    for n in (1, 4, 16):
+        start_time = time.time()
+        datum = afe.sample_burst(n)
+        elapsed = time.time() - start_time
+
+        print(JSONify.dumps(datum))
+        print("n:%d elapsed:%0.3f" % (n, elapsed))
+        print("-")
+
+finally:
+    I2C.close()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import json
+import random
+
+from scs_core.data.json import JSONify
+
+from scs_dfe.gas.afe_filter import AFEFilter
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+specs = [{"type": "hampel", "length": 7, "threshold": 3.0}, {"type": "ewma", "alpha": 0.2}]
+
+afe_filter = AFEFilter(specs)
+print(afe_filter)
+print("-")
+
+for i in range(20):
+    we_v = 0.300 + random.gauss(0.0, 0.0005) + (0.050 if i == 12 else 0.0)      # one spike
+    ae_v = 0.280 + random.gauss(0.0, 0.0005)
+
+    print("%2d: we:%0.5f ae:%0.5f -> we:%0.5f ae:%0.5f" % ((i, we_v, ae_v) + afe_filter.update('NO2', we_v, ae_v)))
+
+print("-")
+
+jstr = JSONify.dumps(afe_filter)
+print(jstr)
+print("-")
+
+restored = AFEFilter.construct_from_jdict(json.loads(jstr))
+print(restored)
+print("-")
+
+print("restored: %s" % (JSONify.dumps(restored) == jstr))
+print("-")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# a steady, quantised signal - a step of one LSB is followed, not rejected...
+
+lsb = 0.000125
+
+quantised = AFEFilter([{"type": "hampel", "length": 7, "threshold": 3.0}])
+
+for i in range(12):
+    we_v = 0.300 + (lsb if i >= 6 else 0.0)
+
+    print("%2d: we:%0.6f -> we:%0.6f" % (i, we_v, quantised.update('NO2', we_v, None)[0]))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Note: journals ten AFE samples, then replays them with the host's calibration and baseline.
+"""
+
+import os
+import tempfile
+
+from scs_core.gas.afe_baseline import AFEBaseline
+from scs_core.gas.afe_calib import AFECalib
+from scs_core.gas.pt1000_calib import Pt1000Calib
+
+from scs_dfe.gas.afe import AFE
+from scs_dfe.gas.afe_batch_calibrator import AFEBatchCalibrator
+from scs_dfe.gas.afe_journal import AFEJournal
+from scs_dfe.gas.afe_replay import AFEReplay
+from scs_dfe.gas.pt1000 import Pt1000
+from scs_dfe.gas.pt1000_conf import Pt1000Conf
+
+from scs_host.bus.i2c import I2C
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+pt1000_calib = Pt1000Calib.load(Host)
+afe_calib = AFECalib.load(Host)
+afe_baseline = AFEBaseline.load(Host)
+
+filename = os.path.join(tempfile.gettempdir(), "afe_journal_test.afej")
+
+journal = AFEJournal(filename)
+print(journal)
+print("-")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+try:
+    I2C.open(Host.I2C_SENSORS)
+
+    afe = AFE(Pt1000Conf.load(Host), Pt1000(pt1000_calib), afe_calib.sensors(afe_baseline))
+    afe.journal = journal
+
+    for _ in range(10):
+        print(afe.sample())
+
+    print("-")
+
+finally:
+    I2C.close()
+    journal.close()
+
+print(journal)
+print("=")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+records = AFEJournal.records(filename)
+print("records: %d" % len(records))
+print("-")
+
+replay = AFEReplay(AFEBatchCalibrator(afe_calib, afe_baseline), pt1000_calib)
+print(replay)
+print("-")
+
+for recs, temps, results in replay.replay(filename):
+    for i in range(len(recs)):
+        print("rec:%0.3f temp:%0.1f %s" % (recs[i], temps[i],
+                                           ', '.join('%s:%0.1f' % (gas_name, cnc[i])
+                                                     for gas_name, (_, cnc) in results.items())))
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import sys
+import time
+
+from scs_core.data.json import JSONify
+from scs_core.sync.interval_timer import IntervalTimer
+
+from scs_dfe.gas.afe_conf import AFEConf
+from scs_dfe.gas.afe_monitor import AFEMonitor
+
+from scs_host.bus.i2c import I2C
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+# run...
+
+if __name__ == '__main__':
+
+    monitor = None
+    proc = None
+
+    try:
+        I2C.open(Host.I2C_SENSORS)
+
+        afe_conf = AFEConf.load(Host)
+
+        monitor = AFEMonitor(afe_conf.afe(Host), 2.0)
+        print("main: %s" % monitor)
+
+        proc = monitor.start()
+
+        timer = IntervalTimer(5)
+
+        while timer.true():
+            start_time = time.time()
+            latest = monitor.latest()
+            elapsed = time.time() - start_time
+
+            if latest is not None:
+                rec, datum, raw = latest
+
+                print("main: rec:%0.3f elapsed:%0.6f sweeps:%d" % (rec, elapsed, monitor.sweeps))
+                print(JSONify.dumps(datum))
+                print("main: raw: %s" % raw)
+
+            print("main: -")
+            sys.stdout.flush()
+
+            if not proc.is_alive():
+                break
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        if proc:
+            proc.terminate()
+
+        if monitor:
+            monitor.close()
+
+        I2C.close()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Note: SN1 and SN2 are sampled every 10 seconds, SN3 every 60 seconds.
+"""
+
+import time
+
+from scs_core.data.json import JSONify
+
+from scs_core.gas.afe_calib import AFECalib
+from scs_core.gas.pt1000_calib import Pt1000Calib
+
+from scs_dfe.gas.afe import AFE
+from scs_dfe.gas.afe_scheduler import AFEScheduler
+from scs_dfe.gas.pt1000 import Pt1000
+from scs_dfe.gas.pt1000_conf import Pt1000Conf
+
+from scs_host.bus.i2c import I2C
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+pt1000_conf = Pt1000Conf.load(Host)
+pt1000 = Pt1000(Pt1000Calib.load(Host))
+
+sensors = AFECalib.load(Host).sensors()
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+try:
+    I2C.open(Host.I2C_SENSORS)
+
+    afe = AFE(pt1000_conf, pt1000, sensors)
+
+    scheduler = AFEScheduler(afe, {1: (10.0, 0), 2: (10.0, 0), 3: (60.0, 1)})
+    print(scheduler)
+    print("-")
+
+    for _ in range(8):
+        start_time = time.time()
+        datum = scheduler.sample(deadline=start_time + 5.0)
+        elapsed = time.time() - start_time
+
+        print(JSONify.dumps(datum))
+        print("elapsed:%0.3f" % elapsed)
+        print("-")
+
+        next_due = scheduler.next_due()
+
+        if next_due is not None:
+            time.sleep(max(0.0, next_due - time.time()))
+
+finally:
+    I2C.close()
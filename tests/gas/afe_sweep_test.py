@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Benchmark: serial vs. pipelined AFE sweep, against simulated ADCs - no I2C bus is required.
+"""
+
+import time
+
+from scs_dfe.gas.afe_sweep import AFESweep
+from scs_dfe.gas.conversion_timer import ConversionTimer
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimADC(object):
+    """
+    an ADC that takes a fixed time to convert, and fails if it is read too early
+    """
+
+    def __init__(self, name, tconv, actual):
+        self.__name = name
+        self.__tconv = tconv                        # datasheet worst case
+        self.__actual = actual                      # simulated real conversion time
+        self.__timer = ConversionTimer(tconv)
+
+        self.__started = None
+        self.__polls = 0
+
+    def start_conversion(self, *_):
+        self.__started = time.time()
+        self.__polls = 0
+
+    def conversion_ready(self):
+        self.__polls += 1
+        elapsed = time.time() - self.__started
+
+        if elapsed < self.__actual:
+            return False
+
+        self.__timer.record(elapsed, self.__polls)
+        return True
+
+    def read_conversion(self):
+        if time.time() - self.__started < self.__actual:
+            raise ValueError("%s: conversion not ready." % self.__name)
+
+        return 0.250
+
+    def release_lock(self):
+        pass
+
+    @property
+    def tconv(self):
+        return self.__tconv
+
+    @property
+    def next_poll(self):
+        if self.__polls == 0:
+            return self.__started + self.__timer.expected
+
+        return time.time() + self.__timer.backoff(self.__polls)
+
+    @property
+    def polls(self):
+        return self.__polls
+
+    def __str__(self, *args, **kwargs):
+        return "SimADC:{name:%s, actual:%0.3f, timer:%s}" % (self.__name, self.__actual, self.__timer)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def serial_sweep(wrk, aux, tmp, channels):
+    tmp.start_conversion()
+    time.sleep(tmp.tconv)
+    tmp_v = tmp.read_conversion()
+
+    raw = {}
+
+    for sensor_index, mux, gain in channels:
+        wrk.start_conversion(mux, gain)
+        aux.start_conversion(mux, gain)
+
+        time.sleep(wrk.tconv)
+
+        raw[sensor_index] = (wrk.read_conversion(), aux.read_conversion())
+
+    return tmp_v, raw
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+wrk_adc = SimADC("wrk", 0.145, 0.125)               # ADS1115 RATE_8
+aux_adc = SimADC("aux", 0.145, 0.125)
+pt1000_adc = SimADC("pt1000", 0.080, 0.067)         # MCP342X RATE_15
+
+sweep_channels = [(i, None, None) for i in range(4)]
+
+sweep = AFESweep(wrk_adc, aux_adc, pt1000_adc)
+print(sweep)
+print("-")
+
+for _ in range(10):
+    start_time = time.time()
+    serial_sweep(wrk_adc, aux_adc, pt1000_adc, sweep_channels)
+    serial_elapsed = time.time() - start_time
+
+    start_time = time.time()
+    sweep.run(sweep_channels)
+    pipelined_elapsed = time.time() - start_time
+
+    print("serial:%0.3f pipelined:%0.3f polls:%s" % (serial_elapsed, pipelined_elapsed, list(sweep.polls.values())))
+
+print("-")
+print(sweep)
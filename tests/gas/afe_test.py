@@ -91,5 +91,8 @@ try:
     print(jstr)
     print("-")
 
+    print("session: %s" % afe.session())
+    print("-")
+
 finally:
     I2C.close()
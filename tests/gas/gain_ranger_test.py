@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+from scs_dfe.gas.ads1115 import ADS1115
+from scs_dfe.gas.gain_ranger import GainRanger
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+ranger = GainRanger()
+print(ranger)
+print("-")
+
+gain = ranger.gain(0, ADS1115.GAIN_0p256)
+print("initial gain: 0x%04x" % gain)
+
+print("saturated: %s" % ranger.saturated(gain, 0.256, 0.210))
+print("widest gain: 0x%04x" % ranger.widest_gain())
+print("-")
+
+ranger.record(0, ranger.widest_gain(), 0.300, 0.250)
+
+gain = ranger.gain(0, ADS1115.GAIN_0p256)
+print("ranged gain: 0x%04x full scale: %0.3f" % (gain, ADS1115.full_scale(gain)))
+
+ranger.record(0, gain, 0.010, 0.008)
+
+gain = ranger.gain(0, ADS1115.GAIN_0p256)
+print("ranged gain: 0x%04x full scale: %0.3f" % (gain, ADS1115.full_scale(gain)))
+print("-")
+
+print(ranger)
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import time
+
+from scs_dfe.gas.no2_cache import NO2Cache
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+cache = NO2Cache(30.0)
+print(cache)
+print("-")
+
+print("fresh: %s" % cache.is_fresh())
+print("sample: %s" % cache.sample(20.0))
+print("-")
+
+now = time.time()
+cache.update({"weV": 0.312, "aeV": 0.298, "cnc": 14.2}, 20.0, rec=now)
+
+print("serves 20.5 C: %s" % cache.serves(20.5, now=now))
+print("serves 21.5 C: %s" % cache.serves(21.5, now=now))
+print("serves None: %s" % cache.serves(None, now=now))
+print("-")
+
+print("sample at 20.5 C: %s" % cache.sample(20.5, now=now))
+print("sample at 21.5 C: %s" % cache.sample(21.5, now=now))
+print("sample after 60 s: %s" % cache.sample(20.0, now=now + 60.0))
+print("-")
+
+print(cache)
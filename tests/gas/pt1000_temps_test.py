@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Note: compares the batch temperature decode of simulated Pt1000 voltages with Pt1000.datum(..).
+"""
+
+import time
+
+import numpy as np
+
+from scs_core.gas.pt1000_calib import Pt1000Calib
+
+from scs_dfe.gas.pt1000 import Pt1000
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+count = 100000
+
+calib = Pt1000Calib(None, 0.295)
+pt1000 = Pt1000(calib)
+print(pt1000)
+print("-")
+
+vs = np.random.uniform(0.250, 0.360, count)
+vs[::100] = np.nan
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+for v20 in (0.295, 0.310):
+    pt1000.calib = Pt1000Calib(None, v20)
+
+    start = time.time()
+    temps = pt1000.temps(vs)
+    batch_time = time.time() - start
+
+    start = time.time()
+    expected = np.array([np.nan if np.isnan(v) else pt1000.datum(float(v)).temp for v in vs])
+    sample_time = time.time() - start
+
+    diff = np.abs(temps - expected)
+
+    print("v20:%0.3f max diff:%s nan match:%s" %
+          (v20, np.nanmax(diff), np.array_equal(np.isnan(temps), np.isnan(expected))))
+    print("batch: %0.3f s per-sample: %0.3f s" % (batch_time, sample_time))
+    print("-")
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+"""
+
+import numpy as np
+
+from scs_dfe.gas.ads1115 import ADS1115
+from scs_dfe.gas.mcp342x import MCP342X
+from scs_dfe.gas.raw_capture import RawCapture
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+capture = RawCapture(ADS1115.lsb_table())
+print(capture)
+print("-")
+
+capture.append(16384, ADS1115.gain_code(ADS1115.GAIN_2p048))
+capture.append(-16384, ADS1115.gain_code(ADS1115.GAIN_2p048))
+capture.extend([1, 2, 3, 32767], ADS1115.gain_code(ADS1115.GAIN_0p256))
+
+print("volts: %s" % capture.volts())
+print("-")
+
+view = np.frombuffer(capture.codes, dtype=np.int16)        # zero-copy
+print("codes: %s" % view)
+del view
+print("=")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+capture = RawCapture(MCP342X.lsb_table())
+
+capture.append(4732, MCP342X.gain_code(MCP342X.GAIN_4))
+print("volts: %s" % capture.volts())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Note: a duty-cycled OPCMonitor, against a simulated OPC with timings scaled down by 100 - no OPC is required.
+"""
+
+import struct
+import time
+
+from scs_core.data.localized_datetime import LocalizedDatetime
+
+from scs_dfe.particulate.opc_monitor import OPCMonitor
+from scs_dfe.particulate.opc_conf import OPCConf
+from scs_dfe.particulate.opc_n2_frame import OPCN2Frame
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimOPC(object):
+    """
+    logs power and sampling events
+    """
+
+    BOOT_TIME = 0.04
+    START_TIME = 0.05
+    STOP_TIME = 0.02
+    FAN_UP_TIME = 0.1
+    FAN_DOWN_TIME = 0.02
+    DEFAULT_SAMPLE_PERIOD = 0.1
+
+    def __init__(self, start):
+        self.__start = start
+        self.__count = 0
+        self.last_frame = None
+
+    def power_on(self):
+        self.__log("power_on")
+        time.sleep(self.BOOT_TIME)
+
+    def operations_on(self):
+        self.__log("operations_on")
+        time.sleep(self.START_TIME)
+
+    def sample(self):
+        self.__count += 1
+        self.__log("sample %d" % self.__count)
+
+        self.last_frame = OPCN2Frame.construct(struct.pack('<16h4BfIfH3f', *([self.__count] * 16), 1, 3, 5, 7, 3.5,
+                                                           221, 2.6, 16 * self.__count, 1.0, 2.0, 3.0))
+
+        return self.last_frame.datum(LocalizedDatetime.now())
+
+    def operations_off(self):
+        self.__log("operations_off")
+        time.sleep(self.STOP_TIME)
+
+    def power_off(self):
+        self.__log("power_off")
+
+    def __log(self, event):
+        print("%0.3f: %s" % (time.time() - self.__start, event), flush=True)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+start_time = time.time()
+
+monitor = OPCMonitor(SimOPC(start_time), OPCConf('N2', 1, True))
+print("duty_cycled:%s wake_time:%0.2f on_time:%0.2f duty_cycle:%0.2f" %
+      (monitor.duty_cycled, monitor.wake_time, monitor.on_time, monitor.duty_cycle))
+print("-")
+
+proc = monitor.start()
+
+try:
+    time.sleep(3.5)
+
+    for number, datum in monitor.new_samples():
+        print("%d: rec:%0.3f bin 0:%s" % (number, datum.rec.timestamp() - start_time, datum.bins[0]))
+
+    window = monitor.window()
+    print("window: n:%s age:%s" % (window['n'], window['age']))
+
+finally:
+    proc.terminate()
+    monitor.close()
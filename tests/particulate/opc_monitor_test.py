@@ -60,5 +60,6 @@ if __name__ == '__main__':
     finally:
         if monitor:
             monitor.off()
+            monitor.close()
 
         I2C.close()
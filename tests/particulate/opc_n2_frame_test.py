@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Note: compares OPCN2Frame with a field-by-field decode of the same frame.
+"""
+
+import math
+import struct
+import time
+
+from scs_dfe.particulate.opc_n2_frame import OPCN2Frame
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def field_decode(frame):
+    def pack_int(byte_values):
+        return struct.unpack('h', struct.pack('BB', *byte_values))[0]
+
+    def pack_float(byte_values):
+        value = struct.unpack('f', struct.pack('BBBB', *byte_values))[0]
+        return None if math.isnan(value) else value
+
+    bins = [pack_int(frame[i:i + 2]) for i in range(0, 32, 2)]
+    bin_mtofs = list(frame[32:36])
+    period = pack_float(frame[44:48])
+    pms = [pack_float(frame[i:i + 4]) for i in range(50, 62, 4)]
+
+    return bins, bin_mtofs, period, pms
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+bins_in = [12, 0, 345, 7, 1, 0, 0, 2, 0, 0, 0, 0, 0, 0, 0, 1]
+
+for temp_pressure in (221, 101325):
+    buffer = struct.pack('<16h4BfIfH3f', *bins_in, 27, 31, 35, 40, 3.52, temp_pressure, 2.6, sum(bins_in),
+                         1.25, 2.5, float('nan'))
+
+    frame = OPCN2Frame.construct(buffer)
+    print(frame)
+    print("checksum valid:%s" % frame.has_valid_checksum())
+    print("bins array:%s" % frame.bins_array())
+
+    bins, bin_mtofs, period, pms = field_decode(buffer)
+    print("match:%s" % ([bins, bin_mtofs, period, pms] ==
+                        [list(frame.bins), list(frame.bin_mtofs), frame.period, [frame.pm1, frame.pm2p5, frame.pm10]]))
+    print("-")
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+iterations = 10000
+
+start = time.perf_counter()
+
+for _ in range(iterations):
+    field_decode(buffer)
+
+field_time = (time.perf_counter() - start) / iterations
+
+start = time.perf_counter()
+
+for _ in range(iterations):
+    OPCN2Frame.construct(buffer)
+
+frame_time = (time.perf_counter() - start) / iterations
+
+print("field-by-field:%0.1f µs OPCN2Frame:%0.1f µs" % (field_time * 1e6, frame_time * 1e6))
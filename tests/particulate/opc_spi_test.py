@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Benchmark: bulk vs. byte-wise histogram transfer, against a simulated SPI device - no OPC is required.
+"""
+
+import struct
+import time
+
+from scs_dfe.particulate import opc_n2
+from scs_dfe.particulate.opc_n2 import OPCN2
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SimSPI(object):
+    """
+    an SPI device with a fixed cost per transaction, plus the clock time of each byte
+    """
+
+    TRANSACTION_TIME = 0.00005                      # seconds - ioctl and driver overhead
+
+    FRAME = struct.pack('<16h4BfIfH3f', *range(16), 1, 3, 5, 7, 3.5, 225, 2.5, 120, 1.5, 2.5, 10.5)
+
+    def __init__(self, _bus, _mode, clock):
+        self.__byte_time = 8.0 / clock
+        self.__offset = 0
+        self.transactions = 0
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def xfer(self, _args):
+        self.__offset = 0
+        self.__wait(1)
+
+    def read_bytes(self, count):
+        self.__wait(count)
+
+        read_bytes = [SimSPI.FRAME[(self.__offset + i) % len(SimSPI.FRAME)] for i in range(count)]
+        self.__offset += count
+
+        return read_bytes
+
+    def __wait(self, count):
+        self.transactions += 1
+
+        end = time.perf_counter() + SimSPI.TRANSACTION_TIME + count * self.__byte_time
+
+        while time.perf_counter() < end:
+            pass
+
+
+class SimLock(object):
+    """
+    records the time for which the OPC lock is held
+    """
+
+    acquired = None
+    held = []
+
+    @classmethod
+    def acquire(cls, _name, _timeout):
+        cls.acquired = time.perf_counter()
+
+    @classmethod
+    def release(cls, _name):
+        cls.held.append(time.perf_counter() - cls.acquired)
+
+
+class SimIO(object):
+    opc_power = None
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+opc_n2.HostSPI = SimSPI
+opc_n2.Lock = SimLock
+opc_n2.IO = SimIO
+
+for bulk_transfer in (False, True):
+    opc = OPCN2(bulk_transfer=bulk_transfer)
+    print(opc)
+
+    SimLock.held = []
+    datum = None
+
+    for _ in range(20):
+        datum = opc.sample()
+
+    print(datum)
+    print(opc.last_frame)
+    print("bulk_transfer:%s mean lock hold:%0.6f s" % (bulk_transfer, sum(SimLock.held) / len(SimLock.held)))
+    print("-")
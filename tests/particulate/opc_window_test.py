@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+Note: compares OPCWindow with a brute-force computation over the samples in the period.
+"""
+
+import random
+import struct
+
+from scs_core.data.json import JSONify
+
+from scs_dfe.particulate.opc_n2_frame import OPCN2Frame
+from scs_dfe.particulate.opc_window import OPCWindow
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+period = 60.0
+sample_period = 10.0
+
+window = OPCWindow(period)
+samples = []
+
+for i in range(100):
+    rec = 1792310400.0 + i * sample_period
+    bins = [random.randint(0, 200) for _ in range(OPCN2Frame.BINS)]
+    pm1 = float('nan') if i % 7 == 0 else random.uniform(0.5, 5.0)
+
+    frame = OPCN2Frame.construct(struct.pack('<16h4BfIfH3f', *bins, 27, 31, 35, 40, 3.5, 221, 2.6, sum(bins) & 0xffff,
+                                             pm1, random.uniform(1.0, 10.0), random.uniform(2.0, 20.0)))
+
+    window.append(rec, frame)
+    samples.append((rec, frame))
+
+print(window)
+print("-")
+
+current = [frame for rec, frame in samples if rec > samples[-1][0] - period]
+pm1s = [frame.pm1 for frame in current if frame.pm1 is not None]
+
+print("n:%s expected:%s" % (window.count, len(current)))
+print("pm1 avg:%s expected:%s" % (window.pm('pm1').mean, sum(pm1s) / len(pm1s)))
+print("bin 0 sum:%s expected:%s" % (window.bin(0).total, sum(frame.bins[0] for frame in current)))
+print("bin 15 max:%s expected:%s" % (window.bin(15).max, max(frame.bins[15] for frame in current)))
+print("-")
+
+print(JSONify.dumps(window))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bruno.beloff@southcoastscience.com)
+
+one event loop drives gases, climate, board temperature, particulates and GPS concurrently
+"""
+
+import asyncio
+import time
+
+from scs_core.data.json import JSONify
+from scs_core.position.gpgga import GPGGA
+
+from scs_dfe.board.mcp9808 import MCP9808
+from scs_dfe.climate.sht_conf import SHTConf
+from scs_dfe.gas.afe_conf import AFEConf
+from scs_dfe.gps.gps_conf import GPSConf
+from scs_dfe.particulate.opc_n2 import OPCN2
+
+from scs_host.bus.i2c import I2C
+from scs_host.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+async def sample_all(afe, sht, board, opc, gps):
+    await board.set_running_async(True)
+
+    sht_datum = await sht.sample_async()
+
+    start_time = time.time()
+
+    gathered = await asyncio.gather(afe.sample_async(sht_datum), sht.sample_async(), opc.sample_async(),
+                                    gps.report_async(GPGGA) if gps else asyncio.sleep(0))
+
+    print("elapsed:%0.3f" % (time.time() - start_time))
+
+    return gathered + [board.sample()]
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+opc_n2 = None
+
+try:
+    I2C.open(Host.I2C_SENSORS)
+
+    afe_sampler = AFEConf.load(Host).afe(Host)
+    sht_sampler = SHTConf.load(Host).int_sht()
+    board_sampler = MCP9808(False)
+
+    opc_n2 = OPCN2()
+
+    gps_receiver = GPSConf.load(Host).gps(Host)
+
+    if gps_receiver:
+        gps_receiver.power_on()
+        gps_receiver.open()
+
+    loop = asyncio.get_event_loop()
+
+    loop.run_until_complete(opc_n2.operations_on_async())
+
+    for datum in loop.run_until_complete(sample_all(afe_sampler, sht_sampler, board_sampler, opc_n2, gps_receiver)):
+        print(JSONify.dumps(datum))
+
+finally:
+    if opc_n2:
+        opc_n2.operations_off()
+
+    I2C.close()